@@ -5,7 +5,6 @@ from PyQt6.QtGui import QScreen
 from PyQt6.QtCore import Qt, QRect
 from core.utils.utilities import is_valid_percentage_str, percent_to_float
 from core.validation.bar import BAR_DEFAULTS
-from BlurWindow.blurWindow import GlobalBlur
 
 try:
     from core.utils.win32 import app_bar
@@ -40,6 +39,8 @@ class Bar(QWidget):
         self._window_flags = window_flags
         self._dimensions = dimensions
         self._padding = padding
+        self._widgets: dict[str, list] = {}
+        self._widget_layouts: dict[str, QHBoxLayout] = {}
 
         self.screen_name = self.screen().name()
         self.app_bar_edge = app_bar.AppBarEdge.Top \
@@ -67,6 +68,7 @@ class Bar(QWidget):
         self.position_bar(init)
 
         if blur_effect['enabled']:
+            from BlurWindow.blurWindow import GlobalBlur
             GlobalBlur(
                 self.winId(),
                 Acrylic=blur_effect['acrylic'],
@@ -81,6 +83,14 @@ class Bar(QWidget):
     def bar_id(self) -> str:
         return self._bar_id
 
+    @property
+    def bar_name(self) -> str:
+        return self._bar_name
+
+    @property
+    def widgets(self) -> dict[str, list]:
+        return self._widgets
+
     def on_geometry_changed(self, geo: QRect) -> None:
         logging.info(f"Screen geometry changed. Updating position for bar ({self.bar_id})")
         self.position_bar()
@@ -153,19 +163,47 @@ class Bar(QWidget):
             layout_container = QFrame()
             layout_container.setProperty("class", f"container container-{layout_type}")
 
-            if layout_type in ["center", "right"]:
-                layout.addStretch()
-
-            for widget in widgets[layout_type]:
-                widget.setFixedHeight(self._bar_frame.geometry().height())
-                widget.parent_layout_type = layout_type
-                widget.bar_id = self.bar_id
-                layout.addWidget(widget, 0)
-
-            if layout_type in ["left", "center"]:
-                layout.addStretch()
+            self._widget_layouts[layout_type] = layout
+            self._widgets[layout_type] = widgets[layout_type]
+            self._populate_layout(layout_type)
 
             layout_container.setLayout(layout)
             bar_layout.addWidget(layout_container, 0, column_num)
 
         self._bar_frame.setLayout(bar_layout)
+
+    def _populate_layout(self, layout_type: str):
+        layout = self._widget_layouts[layout_type]
+
+        while layout.count():
+            layout.takeAt(0)
+
+        if layout_type in ["center", "right"]:
+            layout.addStretch()
+
+        for widget in self._widgets[layout_type]:
+            widget.setFixedHeight(self._bar_frame.geometry().height())
+            widget.parent_layout_type = layout_type
+            widget.bar_id = self.bar_id
+            layout.addWidget(widget, 0)
+
+        if layout_type in ["left", "center"]:
+            layout.addStretch()
+
+    def replace_widgets(self, widgets: dict[str, list]) -> None:
+        """
+        Swaps the bar's widgets for the given ones without rebuilding the bar. Widget instances present in
+        both the old and new layouts are kept alive and only moved, whereas dropped instances are torn down and deleted.
+        """
+        kept_widgets = {id(widget) for column_widgets in widgets.values() for widget in column_widgets}
+
+        for column_widgets in self._widgets.values():
+            for widget in column_widgets:
+                if id(widget) not in kept_widgets:
+                    widget.teardown()
+                    widget.hide()
+                    widget.deleteLater()
+
+        for layout_type in self._widget_layouts.keys():
+            self._widgets[layout_type] = widgets.get(layout_type, [])
+            self._populate_layout(layout_type)
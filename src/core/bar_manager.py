@@ -1,16 +1,25 @@
 import logging
+import time
 import uuid
 from contextlib import suppress
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QScreen
-from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
 from core.bar import Bar
 from core.utils.widget_builder import WidgetBuilder
 from core.utils.utilities import get_screen_by_name
+from core.utils.startup_profiler import StartupProfiler
+from core.utils.idle_monitor import IdleMonitor
+from core.utils.timer_wheel import TimerWheel
+from core.utils.process_cache import ProcessCache
+from core.utils.win32.media_session import MediaSessionService
 from core.event_service import EventService
+from core.metrics_service import SystemMetricsService
 from core.config import get_stylesheet, get_config
 from copy import deepcopy
 
+SCREEN_UPDATE_DEBOUNCE_MS = 500
+
 
 class BarManager(QObject):
     styles_modified = pyqtSignal()
@@ -21,13 +30,20 @@ class BarManager(QObject):
         self.config = config
         self.stylesheet = stylesheet
         self.event_service = EventService()
+        self.metrics_service = SystemMetricsService()
         self.widget_event_listeners = set()
         self.bars: list[Bar] = list()
-        self.config['bars'] = {n: bar for n, bar in self.config['bars'].items() if bar['enabled']}
+        self.config['bars'] = self._get_enabled_bars(self.config['bars'])
         self._threads = {}
         self._active_listeners = {}
         self._widget_builder = WidgetBuilder(self.config['widgets'])
         self._prev_listeners = set()
+        self._screen_update_timer = QTimer(self)
+        self._screen_update_timer.setSingleShot(True)
+        self._screen_update_timer.setInterval(SCREEN_UPDATE_DEBOUNCE_MS)
+        self._screen_update_timer.timeout.connect(self.reconcile_screens)
+        self.idle_monitor = IdleMonitor()
+        self.idle_monitor.configure(self.config['idle_throttle'])
 
         self.styles_modified.connect(self.on_styles_modified)
         self.config_modified.connect(self.on_config_modified)
@@ -46,69 +62,140 @@ class BarManager(QObject):
 
     @pyqtSlot()
     def on_config_modified(self):
+        reload_start = time.perf_counter()
         config = get_config(show_error_dialog=True)
 
+        if config:
+            config['bars'] = self._get_enabled_bars(config['bars'])
+
         if config and (config != self.config):
+            self.idle_monitor.configure(config['idle_throttle'])
 
             if config['bars'] != self.config['bars'] or config['widgets'] != self.config['widgets']:
+                prev_config = self.config
                 self.config = config
-                self.close_bars()
-                self.initialize_bars()
+                self.reconcile_bars(prev_config)
+                QTimer.singleShot(0, lambda: logging.info(
+                    f"Config changes visible {(time.perf_counter() - reload_start) * 1000:.1f}ms after reload."
+                ))
             else:
                 self.config = config
 
-            logging.info("Successfully loaded updated config and re-initialised all bars.")
+            logging.info("Successfully loaded updated config and re-initialised changed bars.")
 
     @pyqtSlot(QScreen)
     def on_screens_update(self, _screen: QScreen) -> None:
-        logging.info("Screens updated. Re-initialising all bars.")
-        self.close_bars()
-        self.initialize_bars()
+        logging.info(f"Screens updated. Updating bars in {SCREEN_UPDATE_DEBOUNCE_MS}ms unless more screens change.")
+        self._screen_update_timer.start()
+
+    @pyqtSlot()
+    def reconcile_screens(self) -> None:
+        """
+        Closes only the bars bound to screens which are no longer connected and builds bars only for newly
+        connected screens. Bars on screens which remain connected keep their widgets and state.
+        """
+        reconcile_start = time.perf_counter()
+        connected_screen_names = {screen.name() for screen in QApplication.screens()}
+        self._widget_builder.update_widget_configs(self.config['widgets'])
+
+        for bar in list(self.bars):
+            if bar.screen_name not in connected_screen_names:
+                self._close_bar(bar)
+
+        num_bars_built = self._create_missing_bars()
+        self._update_listener_threads()
+        self._widget_builder.log_build_timings()
+        self._widget_builder.raise_alerts_if_errors_present()
+
+        logging.info(
+            f"Updated bars for connected screens in {(time.perf_counter() - reconcile_start) * 1000:.1f}ms: "
+            f"{num_bars_built} bar(s) built, {len(self.bars)} bar(s) active."
+        )
 
     def run_listeners_in_threads(self):
         for listener in self.widget_event_listeners:
+            if listener in self._threads:
+                continue
+
             logging.info(f"Starting {listener.__name__}...")
             thread = listener()
             thread.start()
             self._threads[listener] = thread
 
-    def stop_listener_threads(self):
-        for listener in self.widget_event_listeners:
+    def stop_listener_threads(self, listeners: set = None):
+        listeners = set(self.widget_event_listeners) if listeners is None else listeners
+
+        for listener in listeners:
             logging.info(f"Stopping {listener.__name__}...")
             with suppress(KeyError):
                 self._threads[listener].stop()
                 self._threads[listener].quit()
                 self._threads[listener].wait(500)
-        self._threads.clear()
-        self.widget_event_listeners.clear()
+                del self._threads[listener]
+
+        self.widget_event_listeners -= listeners
 
     def close_bars(self):
         self.stop_listener_threads()
+        TimerWheel().log_callback_stats()
+        self.event_service.log_metrics()
+        ProcessCache().log_stats()
+        MediaSessionService().stop()
 
         for bar in self.bars:
             bar.close()
 
         self.event_service.clear()
+        self.metrics_service.clear()
         self.bars.clear()
 
     def initialize_bars(self, init=False) -> None:
-        self._widget_builder = WidgetBuilder(self.config['widgets'])
+        self._widget_builder.update_widget_configs(self.config['widgets'])
+        self._create_missing_bars(init)
+        self.widget_event_listeners = self._get_required_listeners()
+        self.run_listeners_in_threads()
+        self._widget_builder.log_build_timings()
+        self._widget_builder.raise_alerts_if_errors_present()
 
-        for bar_name, bar_config in self.config['bars'].items():
+    def reconcile_bars(self, prev_config: dict) -> None:
+        """
+        Applies a config change by diffing the previous and current config per bar and per widget name.
+        Only bars whose own options changed are rebuilt. For all other bars, only widgets whose config
+        changed are rebuilt, whereas unchanged widget instances and their listener threads are kept alive.
+        """
+        reconcile_start = time.perf_counter()
+        self._widget_builder.update_widget_configs(self.config['widgets'])
+        prev_widget_configs = prev_config['widgets']
+        curr_widget_configs = self.config['widgets']
+        changed_widget_names = {
+            widget_name for widget_name in set(prev_widget_configs) | set(curr_widget_configs)
+            if prev_widget_configs.get(widget_name) != curr_widget_configs.get(widget_name)
+        }
+        num_widgets_rebuilt = 0
 
-            if bar_config['screens'] == ['*']:
-                for screen in QApplication.screens():
-                    self.create_bar(bar_config, bar_name, screen, init)
-                continue
+        for bar in list(self.bars):
+            prev_bar_config = prev_config['bars'].get(bar.bar_name, None)
+            curr_bar_config = self.config['bars'].get(bar.bar_name, None)
 
-            for screen_name in bar_config['screens']:
-                screen = get_screen_by_name(screen_name)
-                if screen:
-                    self.create_bar(bar_config, bar_name, screen, init)
+            if not curr_bar_config or self._get_bar_options(prev_bar_config) != self._get_bar_options(curr_bar_config):
+                self._close_bar(bar)
+            else:
+                num_widgets_rebuilt += self._reconcile_bar_widgets(
+                    bar,
+                    curr_bar_config.get('widgets', {}),
+                    changed_widget_names
+                )
 
-        self.run_listeners_in_threads()
+        num_bars_built = self._create_missing_bars()
+        self._update_listener_threads()
+        self._widget_builder.log_build_timings()
         self._widget_builder.raise_alerts_if_errors_present()
 
+        logging.info(
+            f"Reconciled bars in {(time.perf_counter() - reconcile_start) * 1000:.1f}ms: "
+            f"{num_bars_built} bar(s) built, {num_widgets_rebuilt} widget(s) rebuilt in place."
+        )
+
     def create_bar(self, config: dict, name: str, screen: QScreen, init=False) -> None:
         screen_name = screen.name().replace('\\', '').replace('.', '')
         bar_id = f"{name}_{screen_name}_{str(uuid.uuid4())[:8]}"
@@ -129,3 +216,91 @@ class BarManager(QObject):
 
         self.widget_event_listeners = self.widget_event_listeners.union(widget_event_listeners)
         self.bars.append(Bar(**bar_options))
+
+    def _create_missing_bars(self, init=False) -> int:
+        existing_bars = {(bar.bar_name, bar.screen_name) for bar in self.bars}
+        num_bars_built = 0
+
+        for bar_name, bar_config in self.config['bars'].items():
+            for screen in self._get_bar_screens(bar_config):
+                if (bar_name, screen.name()) not in existing_bars:
+                    with StartupProfiler().phase(f"create_bar {bar_name} ({screen.name()})"):
+                        self.create_bar(bar_config, bar_name, screen, init)
+                    num_bars_built += 1
+
+        return num_bars_built
+
+    def _close_bar(self, bar: Bar) -> None:
+        logging.info(f"Closing bar {bar.bar_id}")
+
+        for column_widgets in bar.widgets.values():
+            for widget in column_widgets:
+                widget.teardown()
+
+        bar.close()
+        self.bars.remove(bar)
+
+    def _reconcile_bar_widgets(self, bar: Bar, widget_map: dict[str, list[str]], changed_widget_names: set) -> int:
+        reusable_widgets = {}
+        num_widgets_built = 0
+
+        for column_widgets in bar.widgets.values():
+            for widget in column_widgets:
+                if widget.widget_name not in changed_widget_names:
+                    reusable_widgets.setdefault(widget.widget_name, []).append(widget)
+
+        bar_widgets = {}
+
+        for column, widget_names in widget_map.items():
+            bar_widgets[column] = []
+
+            for widget_name in widget_names:
+                if reusable_widgets.get(widget_name, None):
+                    widget = reusable_widgets[widget_name].pop(0)
+                else:
+                    widget = self._widget_builder.build_widget(widget_name)
+                    num_widgets_built += 1
+
+                if widget is not None:
+                    bar_widgets[column].append(widget)
+
+        if num_widgets_built or bar_widgets != bar.widgets:
+            bar.replace_widgets(bar_widgets)
+
+        return num_widgets_built
+
+    def _update_listener_threads(self) -> None:
+        required_listeners = self._get_required_listeners()
+        self.stop_listener_threads(self.widget_event_listeners - required_listeners)
+
+        for listener in required_listeners & self._widget_builder.widget_event_listeners:
+            with suppress(KeyError, AttributeError):
+                self._threads[listener].replay_state()
+
+        self.widget_event_listeners = required_listeners
+        self.run_listeners_in_threads()
+
+    def _get_required_listeners(self) -> set:
+        return {
+            widget.event_listener
+            for bar in self.bars
+            for column_widgets in bar.widgets.values()
+            for widget in column_widgets
+            if getattr(widget, 'event_listener', None)
+        }
+
+    @staticmethod
+    def _get_bar_screens(bar_config: dict) -> list[QScreen]:
+        if bar_config['screens'] == ['*']:
+            return QApplication.screens()
+
+        bar_screens = [get_screen_by_name(screen_name) for screen_name in bar_config['screens']]
+        return [screen for screen in bar_screens if screen]
+
+    @staticmethod
+    def _get_bar_options(bar_config: dict) -> dict:
+        return {option: value for option, value in (bar_config or {}).items() if option != 'widgets'}
+
+    @staticmethod
+    def _get_enabled_bars(bar_configs: dict) -> dict:
+        return {n: bar for n, bar in bar_configs.items() if bar['enabled']}
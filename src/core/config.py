@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Union
 from core.validation.config import CONFIG_SCHEMA
 from core.utils.alert_dialog import raise_info_alert
+from core.utils.startup_profiler import StartupProfiler
 from cssutils import CSSParser
 from cerberus import Validator, schema
 from yaml.parser import ParserError
@@ -106,8 +107,11 @@ def get_stylesheet(show_error_dialog=False) -> Union[str, None]:
 
 
 def get_config_and_stylesheet() -> tuple[dict, str]:
-    config = get_config()
-    stylesheet = get_stylesheet()
+    with StartupProfiler().phase("config load"):
+        config = get_config()
+
+    with StartupProfiler().phase("stylesheet parse"):
+        stylesheet = get_stylesheet()
 
     if not config:
         error_msg = "User config file could not be loaded. Exiting Application."
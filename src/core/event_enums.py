@@ -18,6 +18,7 @@ class KomorebiEvent(Event):
     KomorebiConnect = "KomorebiConnect"
     KomorebiUpdate = "KomorebiUpdate"
     KomorebiDisconnect = "KomorebiDisconnect"
+    KomorebiStateChange = "KomorebiStateChange"
     FocusWorkspaceNumber = "FocusWorkspaceNumber"
     FocusMonitorWorkspaceNumber = "FocusMonitorWorkspaceNumber"
     FocusChange = "FocusChange"
@@ -41,3 +42,7 @@ class KomorebiEvent(Event):
     SendContainerToMonitorNumber = "SendContainerToMonitorNumber"
     SendContainerToWorkspaceNumber = "SendContainerToWorkspaceNumber"
     WorkspaceName = "WorkspaceName"
+
+
+class VolumeEvent(Event):
+    VolumeChange = "VolumeChange"
@@ -1,31 +1,169 @@
 import functools
 import logging
+import threading
 
-from PyQt6.QtCore import QObject, pyqtSignal
-from typing import Any
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
+from typing import Any, Callable, Hashable, Optional
 from core.event_enums import Event
 
 
+class EventSubscription:
+    def __init__(
+            self,
+            event_signal: pyqtSignal,
+            event_filter: Optional[Callable[..., bool]],
+            coalesce_ms: int,
+            coalesce_key: Optional[Callable[..., Hashable]]
+    ):
+        self.signal = event_signal
+        self.event_filter = event_filter
+        self.coalesce_ms = coalesce_ms
+        self.coalesce_key = coalesce_key
+        self.pending_args: dict[Hashable, tuple] = {}
+
+
+class EventMetrics:
+    def __init__(self):
+        self.emitted = 0
+        self.delivered = 0
+        self.filtered = 0
+        self.coalesced = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+
+    def __repr__(self):
+        return (
+            f"emitted={self.emitted} delivered={self.delivered} filtered={self.filtered} "
+            f"coalesced={self.coalesced} max_queue_depth={self.max_queue_depth}"
+        )
+
+
 @functools.lru_cache()
 class EventService(QObject):
+    """
+    Fans events out to registered signals. A subscription may pass an event_filter, called with the event's
+    arguments, to skip events it has no interest in, such as those of other monitors or windows. With a
+    coalesce_ms window, only the latest arguments per coalesce_key are delivered once the window has passed.
+    """
+    _flush_requested = pyqtSignal(object)
+    subscriptions_changed = pyqtSignal()
+
     def __init__(self):
         super().__init__()
-        self._registered_event_signals: dict[Event, list[pyqtSignal]] = {}
+        self._registered_event_signals: dict[Event, list[EventSubscription]] = {}
+        self._metrics: dict[Event, EventMetrics] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_requested.connect(self._schedule_flush)
+
+    @property
+    def metrics(self) -> dict[Event, EventMetrics]:
+        return dict(self._metrics)
+
+    def register_event(
+            self,
+            event_type: Event,
+            event_signal: pyqtSignal,
+            event_filter: Callable[..., bool] = None,
+            coalesce_ms: int = 0,
+            coalesce_key: Callable[..., Hashable] = None
+    ):
+        subscription = EventSubscription(event_signal, event_filter, coalesce_ms, coalesce_key)
 
-    def register_event(self, event_type: Event, event_signal: pyqtSignal):
         if event_type not in self._registered_event_signals:
-            self._registered_event_signals[event_type] = [event_signal]
+            self._registered_event_signals[event_type] = [subscription]
         else:
-            self._registered_event_signals[event_type].append(event_signal)
+            self._registered_event_signals[event_type].append(subscription)
+
+        self.subscriptions_changed.emit()
+
+    def unregister_event(self, event_type: Event, event_signal: pyqtSignal):
+        """Removes the subscriptions of a signal, dropping any of its coalesced events not yet delivered."""
+        subscriptions = self._registered_event_signals.get(event_type, [])
+
+        with self._pending_lock:
+            for subscription in [sub for sub in subscriptions if sub.signal == event_signal]:
+                self._metrics.setdefault(event_type, EventMetrics()).queue_depth -= len(subscription.pending_args)
+                subscription.pending_args.clear()
+                subscriptions.remove(subscription)
+
+        self.subscriptions_changed.emit()
+
+    def has_registered_signals(self, event_type: Event) -> bool:
+        return bool(self._registered_event_signals.get(event_type, None))
+
+    def registered_event_types(self) -> list[Event]:
+        return [event_type for event_type, subscriptions in tuple(self._registered_event_signals.items()) if subscriptions]
 
     def emit_event(self, event_type: Event, *args: Any):
-        event_signals = self._registered_event_signals.get(event_type, [])
-        for event_signal in event_signals:
+        subscriptions = self._registered_event_signals.get(event_type, [])
+        metrics = self._metrics.setdefault(event_type, EventMetrics())
+        metrics.emitted += 1
+
+        for subscription in list(subscriptions):
             try:
-                event_signal.emit(*args)
-            except AttributeError:
-                logging.error(f"Failed to emit signal {event_signal.__str__()}. Removing link to {event_type}.")
-                event_signals.pop(event_signals.index(event_signal))
+                if subscription.event_filter and not subscription.event_filter(*args):
+                    metrics.filtered += 1
+                elif subscription.coalesce_ms > 0:
+                    self._queue_coalesced(event_type, subscription, args)
+                else:
+                    subscription.signal.emit(*args)
+                    metrics.delivered += 1
+            except (AttributeError, RuntimeError):
+                logging.error(f"Failed to emit signal {subscription.signal.__str__()}. Removing link to {event_type}.")
+                self._remove_subscription(event_type, subscription)
+
+    def log_metrics(self) -> None:
+        for event_type, metrics in self._metrics.items():
+            logging.debug(f"Event {event_type.value}: {metrics}")
 
     def clear(self):
         self._registered_event_signals.clear()
+        self.subscriptions_changed.emit()
+
+    def _queue_coalesced(self, event_type: Event, subscription: EventSubscription, args: tuple) -> None:
+        metrics = self._metrics[event_type]
+        key = subscription.coalesce_key(*args) if subscription.coalesce_key else None
+
+        with self._pending_lock:
+            is_window_open = bool(subscription.pending_args)
+
+            if key in subscription.pending_args:
+                metrics.coalesced += 1
+            else:
+                metrics.queue_depth += 1
+                metrics.max_queue_depth = max(metrics.max_queue_depth, metrics.queue_depth)
+
+            subscription.pending_args[key] = args
+
+        if not is_window_open:
+            # Events may be emitted from listener threads, so the flush timer is started on the service's thread
+            self._flush_requested.emit((event_type, subscription))
+
+    @pyqtSlot(object)
+    def _schedule_flush(self, flush_request: tuple[Event, EventSubscription]) -> None:
+        event_type, subscription = flush_request
+        QTimer.singleShot(subscription.coalesce_ms, lambda: self._flush(event_type, subscription))
+
+    def _flush(self, event_type: Event, subscription: EventSubscription) -> None:
+        metrics = self._metrics[event_type]
+
+        with self._pending_lock:
+            pending_args = list(subscription.pending_args.values())
+            subscription.pending_args.clear()
+            metrics.queue_depth -= len(pending_args)
+
+        for args in pending_args:
+            try:
+                subscription.signal.emit(*args)
+                metrics.delivered += 1
+            except (AttributeError, RuntimeError):
+                logging.error(f"Failed to emit signal {subscription.signal.__str__()}. Removing link to {event_type}.")
+                self._remove_subscription(event_type, subscription)
+                return
+
+    def _remove_subscription(self, event_type: Event, subscription: EventSubscription) -> None:
+        subscriptions = self._registered_event_signals.get(event_type, [])
+
+        if subscription in subscriptions:
+            subscriptions.remove(subscription)
+            self.subscriptions_changed.emit()
@@ -0,0 +1,214 @@
+import functools
+import logging
+import time
+import psutil
+from enum import Enum
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from typing import Callable
+from core.utils.idle_monitor import IdleMonitor
+from core.utils.disk_metrics import sample_disk_usage, sample_disk_io
+
+
+class SystemMetric(Enum):
+    Cpu = "cpu"
+    Memory = "memory"
+    Traffic = "traffic"
+    Battery = "battery"
+    Disk = "disk"
+
+
+def sample_cpu() -> dict:
+    cpu_freq = psutil.cpu_freq()
+    cpu_stats = psutil.cpu_stats()
+    return {
+        'freq': {
+            'min': cpu_freq.min,
+            'max': cpu_freq.max,
+            'current': cpu_freq.current
+        },
+        'percent': {
+            'total': psutil.cpu_percent(),
+            'cores': psutil.cpu_percent(percpu=True)
+        },
+        'stats': {
+            'context_switches': cpu_stats.ctx_switches,
+            'interrupts': cpu_stats.interrupts,
+            'soft_interrupts': cpu_stats.soft_interrupts,
+            'sys_calls': cpu_stats.syscalls
+        }
+    }
+
+
+def sample_memory() -> dict:
+    return {
+        'virtual': psutil.virtual_memory(),
+        'swap': psutil.swap_memory()
+    }
+
+
+def sample_traffic() -> dict:
+    net_io = psutil.net_io_counters()
+    return {
+        'bytes_sent': net_io.bytes_sent,
+        'bytes_recv': net_io.bytes_recv,
+        'timestamp': time.monotonic()
+    }
+
+
+def sample_battery() -> dict:
+    return {
+        'battery': psutil.sensors_battery()
+    }
+
+
+def sample_disk() -> dict:
+    return {
+        'volumes': sample_disk_usage(),
+        'io': sample_disk_io(),
+        'timestamp': time.monotonic()
+    }
+
+
+METRIC_SAMPLERS: dict[SystemMetric, Callable[[], dict]] = {
+    SystemMetric.Cpu: sample_cpu,
+    SystemMetric.Memory: sample_memory,
+    SystemMetric.Traffic: sample_traffic,
+    SystemMetric.Battery: sample_battery,
+    SystemMetric.Disk: sample_disk
+}
+
+
+class MetricSubscriber:
+    def __init__(self, metric_signal: pyqtSignal, interval: int):
+        self.signal = metric_signal
+        self.interval = interval
+        self.next_due = 0.0
+        self.paused = False
+
+
+@functools.lru_cache()
+class SystemMetricsService(QObject):
+    """
+    Samples each system metric once per tick at the fastest interval requested by its subscribers
+    and fans the result out to every subscriber whose own update interval has elapsed.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._subscribers: dict[SystemMetric, list[MetricSubscriber]] = {}
+        self._timers: dict[SystemMetric, QTimer] = {}
+        self._latest_samples: dict[SystemMetric, dict] = {}
+        self._idle_monitor = IdleMonitor()
+        self._idle_monitor.idle_changed.connect(self._on_idle_changed)
+
+    def subscribe(self, metric: SystemMetric, interval: int, metric_signal: pyqtSignal):
+        subscriber = MetricSubscriber(metric_signal, interval)
+
+        if metric not in self._subscribers:
+            self._subscribers[metric] = [subscriber]
+        else:
+            self._subscribers[metric].append(subscriber)
+
+        self._schedule(metric)
+
+        if metric in self._latest_samples:
+            self._emit_to_subscriber(metric, subscriber, self._latest_samples[metric], time.monotonic() * 1000)
+        else:
+            self._sample_metric(metric)
+
+    def unsubscribe(self, metric: SystemMetric, metric_signal: pyqtSignal):
+        subscribers = self._subscribers.get(metric, [])
+        self._subscribers[metric] = [sub for sub in subscribers if sub.signal != metric_signal]
+        self._schedule(metric)
+
+    def pause(self, metric: SystemMetric, metric_signal: pyqtSignal):
+        """Stops emitting to a subscriber, such as a hidden widget, without dropping its subscription."""
+        self._set_paused(metric, metric_signal, True)
+        self._schedule(metric)
+
+    def resume(self, metric: SystemMetric, metric_signal: pyqtSignal):
+        """Resumes a paused subscriber and sends it a fresh sample, as the last one it got may be long stale."""
+        if self._set_paused(metric, metric_signal, False):
+            self._schedule(metric)
+            self._sample_metric(metric)
+
+    def _set_paused(self, metric: SystemMetric, metric_signal: pyqtSignal, paused: bool) -> bool:
+        """Returns True if any subscriber of the signal changed state."""
+        changed = False
+
+        for subscriber in self._subscribers.get(metric, []):
+            if subscriber.signal == metric_signal and subscriber.paused != paused:
+                subscriber.paused = paused
+                subscriber.next_due = 0.0
+                changed = True
+
+        return changed
+
+    def clear(self):
+        for timer in self._timers.values():
+            timer.stop()
+
+        self._subscribers.clear()
+        self._latest_samples.clear()
+
+    def _schedule(self, metric: SystemMetric) -> None:
+        intervals = [
+            sub.interval for sub in self._subscribers.get(metric, []) if sub.interval > 0 and not sub.paused
+        ]
+        timer = self._timers.get(metric, None)
+
+        if not intervals:
+            if timer:
+                timer.stop()
+            return
+
+        if not timer:
+            timer = QTimer(self)
+            timer.timeout.connect(lambda: self._sample_metric(metric))
+            self._timers[metric] = timer
+
+        fastest_interval = self._idle_monitor.scale_interval(min(intervals))
+
+        if not timer.isActive() or timer.interval() != fastest_interval:
+            timer.start(fastest_interval)
+
+    def _on_idle_changed(self, is_idle: bool) -> None:
+        for metric in self._subscribers:
+            self._schedule(metric)
+
+            # Refresh stale samples as soon as the user is back
+            if not is_idle:
+                self._sample_metric(metric)
+
+    def _sample_metric(self, metric: SystemMetric) -> None:
+        now_ms = time.monotonic() * 1000
+        timer = self._timers.get(metric, None)
+        tolerance_ms = timer.interval() / 2 if timer and timer.isActive() else 0
+        due_subscribers = [
+            sub for sub in self._subscribers.get(metric, [])
+            if not sub.paused and sub.next_due - now_ms <= tolerance_ms
+        ]
+
+        if not due_subscribers:
+            return
+
+        try:
+            sample = METRIC_SAMPLERS[metric]()
+        except Exception:
+            logging.exception(f"Failed to sample system metric {metric.value}")
+            return
+
+        self._latest_samples[metric] = sample
+
+        for subscriber in due_subscribers:
+            self._emit_to_subscriber(metric, subscriber, sample, now_ms)
+
+    def _emit_to_subscriber(self, metric: SystemMetric, subscriber: MetricSubscriber, sample: dict, now_ms: float):
+        subscriber.next_due = now_ms + subscriber.interval if subscriber.interval > 0 else float('inf')
+
+        try:
+            subscriber.signal.emit(sample)
+        except (AttributeError, RuntimeError):
+            logging.error(f"Failed to emit signal {subscriber.signal.__str__()}. Removing link to {metric.value}.")
+            self._subscribers[metric].remove(subscriber)
+            self._schedule(metric)
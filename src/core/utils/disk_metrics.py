@@ -0,0 +1,115 @@
+import ctypes
+import functools
+import logging
+import threading
+import psutil
+from contextlib import suppress
+from typing import Optional
+
+LINUX_MOUNTS_PATH = "/proc/self/mounts"
+
+
+def normalize_volume_label(volume_label: str) -> str:
+    """Maps a volume label, drive or mount point to one key, so "C", "C:" and "C:\\" all name the same volume."""
+    label = volume_label.rstrip("\\")
+
+    if len(label) == 2 and label[1] == ":":
+        label = label[0]
+
+    return label.upper() if len(label) == 1 else (label.rstrip("/") or "/")
+
+
+def get_mount_signature() -> Optional[object]:
+    """Returns a value which changes whenever a volume is mounted or unmounted, or None if it can't be detected."""
+    if hasattr(ctypes, 'windll'):
+        return ctypes.windll.kernel32.GetLogicalDrives()
+
+    with suppress(OSError):
+        with open(LINUX_MOUNTS_PATH, "rb") as mounts:
+            return hash(mounts.read())
+
+    return None
+
+
+class DiskVolume:
+    def __init__(self, partition):
+        self.label = normalize_volume_label(partition.mountpoint)
+        self.mountpoint = partition.mountpoint
+        self.device = partition.device
+        self.fstype = partition.fstype
+
+
+@functools.lru_cache()
+class DiskPartitionCache:
+    """
+    Holds the mounted volumes found by psutil.disk_partitions, which is far slower than reading their usage.
+    The partitions are only listed again once the mount signature changes, or a cached volume disappears.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._volumes: dict[str, DiskVolume] = {}
+        self._mount_signature = None
+        self._is_stale = True
+        self._requested_labels: set[str] = set()
+
+    def request_volumes(self, volume_labels: list[str]) -> None:
+        """Adds volumes to those sampled, so network and removable drives nobody shows are never touched."""
+        with self._lock:
+            self._requested_labels.update(map(normalize_volume_label, volume_labels))
+
+    def get_requested_volumes(self) -> dict[str, DiskVolume]:
+        volumes = self.get_volumes()
+        return {label: volume for label, volume in volumes.items() if label in self._requested_labels}
+
+    def get_volumes(self) -> dict[str, DiskVolume]:
+        mount_signature = get_mount_signature()
+
+        with self._lock:
+            if self._is_stale or mount_signature != self._mount_signature:
+                self._volumes = {volume.label: volume for volume in map(DiskVolume, psutil.disk_partitions())}
+                self._mount_signature = mount_signature
+                self._is_stale = False
+
+            return self._volumes
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._is_stale = True
+
+
+def sample_disk_usage() -> dict:
+    volumes = {}
+    partition_cache = DiskPartitionCache()
+
+    for label, volume in partition_cache.get_requested_volumes().items():
+        try:
+            usage = psutil.disk_usage(volume.mountpoint)
+        except PermissionError:
+            # Mounted but unreadable, such as an empty optical drive
+            continue
+        except OSError:
+            logging.debug(f"Failed to read usage of volume {volume.mountpoint}")
+            partition_cache.invalidate()
+            continue
+
+        volumes[label] = {
+            'total': usage.total,
+            'used': usage.used,
+            'free': usage.free,
+            'percent': usage.percent
+        }
+
+    return volumes
+
+
+def sample_disk_io() -> Optional[dict]:
+    io_counters = psutil.disk_io_counters()
+
+    if io_counters is None:
+        return None
+
+    return {
+        'read_bytes': io_counters.read_bytes,
+        'write_bytes': io_counters.write_bytes
+    }
@@ -0,0 +1,58 @@
+import functools
+import logging
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+try:
+    from core.utils.win32.utilities import get_idle_duration_ms
+except ImportError:
+    get_idle_duration_ms = None
+    logging.warning("Failed to load idle time lookup. Widget timers will not be throttled when idle.")
+
+IDLE_POLL_INTERVAL_MS = 5000
+
+
+@functools.lru_cache()
+class IdleMonitor(QObject):
+    """
+    Polls the time since the last user input and emits idle_changed whenever the configured idle timeout
+    is crossed, so widget timers can slow down while nobody is using the machine.
+    """
+    idle_changed = pyqtSignal(bool)
+
+    def __init__(self):
+        super().__init__()
+        self.is_idle = False
+        self.idle_timeout_ms = 0
+        self.interval_multiplier = 1
+        self._poll_timer = QTimer(self)
+        self._poll_timer.timeout.connect(self._poll_idle_state)
+
+    def configure(self, idle_throttle: dict) -> None:
+        self.idle_timeout_ms = idle_throttle['idle_timeout'] * 1000 if idle_throttle['enabled'] else 0
+        self.interval_multiplier = idle_throttle['interval_multiplier']
+
+        if self.idle_timeout_ms and get_idle_duration_ms:
+            self._poll_timer.start(min(IDLE_POLL_INTERVAL_MS, self.idle_timeout_ms))
+        else:
+            self._poll_timer.stop()
+            self._set_idle(False)
+
+    def scale_interval(self, interval: int) -> int:
+        return interval * self.interval_multiplier if self.is_idle else interval
+
+    def notify_activity(self) -> None:
+        self._set_idle(False)
+
+    def _poll_idle_state(self) -> None:
+        try:
+            self._set_idle(get_idle_duration_ms() >= self.idle_timeout_ms)
+        except Exception:
+            logging.exception("Failed to retrieve idle duration")
+
+    def _set_idle(self, is_idle: bool) -> None:
+        if is_idle == self.is_idle:
+            return
+
+        self.is_idle = is_idle
+        logging.debug(f"User is {'idle' if is_idle else 'active'}. Widget timers {'slowed' if is_idle else 'resumed'}.")
+        self.idle_changed.emit(is_idle)
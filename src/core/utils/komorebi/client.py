@@ -1,8 +1,10 @@
 import subprocess
-import logging
 import json
 from contextlib import suppress
 from typing import Optional
+from core.utils.komorebi.state_index import get_state_index
+from core.utils.komorebi.command_dispatcher import KomorebiCommandDispatcher
+from core.utils.komorebi.state_cache import KomorebiStateCache
 
 
 def add_index(dictionary: dict, dictionary_index: int) -> dict:
@@ -21,7 +23,14 @@ class KomorebiClient:
         self._komorebic_path = komorebic_path
         self._previous_poll_offline = False
 
+    @property
+    def _dispatcher(self) -> KomorebiCommandDispatcher:
+        return KomorebiCommandDispatcher(self._komorebic_path)
+
     def query_state(self) -> Optional[dict]:
+        return KomorebiStateCache().get(self._query_state_uncached)
+
+    def _query_state_uncached(self) -> Optional[dict]:
         with suppress(json.JSONDecodeError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
             output = subprocess.check_output([self._komorebic_path, "state"], timeout=self._timeout_secs, shell=True)
             return json.loads(output)
@@ -30,18 +39,17 @@ class KomorebiClient:
         return state['monitors']['elements']
 
     def get_screen_by_hwnd(self, state: dict, screen_hwnd: int) -> Optional[dict]:
-        for i, screen in enumerate(self.get_screens(state)):
-            if screen.get('id', None) == screen_hwnd:
-                return add_index(screen, i)
+        return get_state_index(state).monitor_by_id.get(screen_hwnd, None)
 
     def get_workspaces(self, screen: dict) -> list:
         return [add_index(workspace, i) for i, workspace in enumerate(screen['workspaces']['elements'])]
 
     def get_workspace_by_index(self, screen: dict, workspace_index: int) -> Optional[dict]:
-        try:
-            return self.get_workspaces(screen)[workspace_index]
-        except IndexError:
-            return None
+        workspaces = screen['workspaces']['elements']
+
+        if 0 <= workspace_index < len(workspaces):
+            return add_index(workspaces[workspace_index], workspace_index)
+        return None
 
     def get_focused_workspace(self, screen: dict) -> Optional[dict]:
         try:
@@ -52,7 +60,8 @@ class KomorebiClient:
         except (KeyError, TypeError):
             return None
 
-    def get_num_windows(self, workspace: dict):
+    @staticmethod
+    def get_num_windows(workspace: dict):
         containers = workspace['containers']['elements']
         if workspace.get('floating_windows', []):
             return True
@@ -63,67 +72,30 @@ class KomorebiClient:
 
         return False
 
-    def get_workspace_by_window_hwnd(self, workspaces: list[Optional[dict]], window_hwnd: int) -> Optional[dict]:
-        for i, workspace in enumerate(workspaces):
-
-            for floating_window in workspace['floating_windows']:
-                if floating_window['hwnd'] == window_hwnd:
-                    return add_index(workspace, i)
-
-            if ('containers' not in workspace) or ('elements' not in workspace['containers']):
-                continue
-
-            for container in workspace['containers']['elements']:
-                if ('windows' not in container) or ('elements' not in container['windows']):
-                    continue
-
-                for managed_window in container['windows']['elements']:
-                    if managed_window['hwnd'] == window_hwnd:
-                        return add_index(workspace, i)
+    def get_workspace_by_window_hwnd(self, state: dict, window_hwnd: int) -> Optional[dict]:
+        window_location = get_state_index(state).window_locations.get(window_hwnd, None)
+        return window_location.workspace if window_location else None
 
     def activate_workspace(self, ws_idx: int) -> None:
-        subprocess.Popen([self._komorebic_path, "focus-workspace", str(ws_idx)], shell=True)
+        self._dispatcher.submit("focus-workspace", str(ws_idx))
 
     def next_workspace(self) -> None:
-        try:
-            subprocess.Popen([self._komorebic_path, "cycle-workspace", "next"], shell=True)
-        except subprocess.SubprocessError:
-            logging.exception("Failed to cycle komorebi workspace")
+        self._dispatcher.submit("cycle-workspace", "next")
 
     def prev_workspace(self) -> None:
-        try:
-            subprocess.Popen([self._komorebic_path, "cycle-workspace", "prev"], shell=True)
-        except subprocess.SubprocessError:
-            logging.exception("Failed to cycle komorebi workspace")
+        self._dispatcher.submit("cycle-workspace", "prev")
 
     def toggle_focus_mouse(self) -> None:
-        try:
-            subprocess.Popen([self._komorebic_path, "toggle-focus-follows-mouse"], shell=True)
-        except subprocess.SubprocessError:
-            logging.exception("Failed to toggle focus-follows-mouse")
+        self._dispatcher.submit("toggle-focus-follows-mouse")
 
     def change_layout(self, layout: str) -> None:
-        try:
-            subprocess.Popen([self._komorebic_path, "change-layout", layout], shell=True)
-        except subprocess.SubprocessError:
-            logging.exception(f"Failed to change layout of currently active workspace to {layout}")
+        self._dispatcher.submit("change-layout", layout)
 
     def flip_layout(self) -> None:
-        try:
-            subprocess.Popen(
-                [self._komorebic_path, "flip-layout"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                shell=True
-            )
-        except subprocess.SubprocessError:
-            pass
+        self._dispatcher.submit("flip-layout")
 
     def toggle(self, toggle_type: str):
-        try:
-            subprocess.Popen([self._komorebic_path, f"toggle-{toggle_type}"], shell=True)
-        except subprocess.SubprocessError:
-            logging.exception(f"Failed to toggle {toggle_type} for currently active workspace")
+        self._dispatcher.submit(f"toggle-{toggle_type}")
 
     def wait_until_subscribed_to_pipe(self, pipe_name: str):
         proc = subprocess.Popen(
@@ -0,0 +1,184 @@
+import functools
+import json
+import logging
+import os
+import socket
+import subprocess
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Optional
+
+KOMOREBI_SOCKET_PATH = os.path.join(os.environ.get('LOCALAPPDATA', ''), "komorebi", "komorebi.sock")
+KOMOREBI_COMMAND_TIMEOUT_SECS = 5
+
+# Commands of which only the most recent queued call matters
+LAST_CALL_WINS_COMMANDS = ["focus-workspace", "change-layout"]
+CYCLE_DIRECTIONS = {"next": 1, "prev": -1}
+
+SOCKET_LAYOUTS = {
+    "bsp": "BSP",
+    "columns": "Columns",
+    "rows": "Rows",
+    "vertical-stack": "VerticalStack",
+    "horizontal-stack": "HorizontalStack",
+    "ultrawide-vertical-stack": "UltrawideVerticalStack"
+}
+SOCKET_TOGGLES = {
+    "toggle-tiling": "ToggleTiling",
+    "toggle-float": "ToggleFloat",
+    "toggle-monocle": "ToggleMonocle",
+    "toggle-maximise": "ToggleMaximize",
+    "toggle-pause": "TogglePause"
+}
+
+
+class KomorebiCommand:
+    def __init__(self, name: str, *args: str):
+        self.name = name
+        self.args = list(args)
+        self.cycle_steps = CYCLE_DIRECTIONS.get(args[0], 0) if name == "cycle-workspace" and args else 0
+
+    def coalesce(self, command: "KomorebiCommand") -> bool:
+        """Merges a command queued directly after this one into it. Returns False if they can't be merged."""
+        if command.name != self.name:
+            return False
+
+        if self.name == "cycle-workspace":
+            self.cycle_steps += command.cycle_steps
+            return True
+
+        if self.name in LAST_CALL_WINS_COMMANDS:
+            self.args = command.args
+            return True
+
+        return False
+
+    def expand(self) -> list[list[str]]:
+        """Returns the komorebic arguments to run, with net cycle steps expanded into single steps."""
+        if self.name == "cycle-workspace":
+            direction = "next" if self.cycle_steps > 0 else "prev"
+            return [[self.name, direction]] * abs(self.cycle_steps)
+
+        return [[self.name, *self.args]]
+
+
+class CommandExecutor(ABC):
+    def is_available(self) -> bool:
+        return True
+
+    @abstractmethod
+    def execute(self, command_args: list[str]) -> bool:
+        """Runs a komorebic command. Returns False if this executor does not support the command."""
+
+
+class ProcessExecutor(CommandExecutor):
+    """Runs each command as a komorebic process without an intermediate shell."""
+
+    def __init__(self, komorebic_path: str):
+        self._komorebic_path = komorebic_path
+
+    def execute(self, command_args: list[str]) -> bool:
+        proc = subprocess.run(
+            [self._komorebic_path, *command_args],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=KOMOREBI_COMMAND_TIMEOUT_SECS,
+            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+        )
+
+        if proc.returncode != 0:
+            logging.warning(f"komorebic {' '.join(command_args)} failed: {proc.stderr.decode('utf-8', 'replace')}")
+
+        return True
+
+
+class SocketExecutor(CommandExecutor):
+    """
+    Sends commands straight to komorebi's command socket, skipping komorebic process creation. komorebi listens on
+    a Unix domain socket, which CPython does not expose on Windows, where socket.AF_UNIX is missing. There this
+    executor is never available and every command falls back to the process executor, so it only takes effect on
+    Python builds with AF_UNIX support.
+    """
+
+    def __init__(self, socket_path: str = KOMOREBI_SOCKET_PATH):
+        self._socket_path = socket_path
+
+    def is_available(self) -> bool:
+        return hasattr(socket, 'AF_UNIX') and os.path.exists(self._socket_path)
+
+    def execute(self, command_args: list[str]) -> bool:
+        socket_message = self._to_socket_message(command_args)
+
+        if socket_message is None:
+            return False
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as komorebi_socket:
+            komorebi_socket.settimeout(KOMOREBI_COMMAND_TIMEOUT_SECS)
+            komorebi_socket.connect(self._socket_path)
+            komorebi_socket.sendall(json.dumps(socket_message).encode("utf-8"))
+
+        return True
+
+    @staticmethod
+    def _to_socket_message(command_args: list[str]) -> Optional[dict]:
+        command_name, args = command_args[0], command_args[1:]
+
+        if command_name == "focus-workspace":
+            return {"type": "FocusWorkspaceNumber", "content": int(args[0])}
+        elif command_name == "cycle-workspace":
+            return {"type": "CycleFocusWorkspace", "content": "Next" if args[0] == "next" else "Previous"}
+        elif command_name == "change-layout" and args[0] in SOCKET_LAYOUTS:
+            return {"type": "ChangeLayout", "content": SOCKET_LAYOUTS[args[0]]}
+        elif command_name in SOCKET_TOGGLES:
+            return {"type": SOCKET_TOGGLES[command_name]}
+
+        return None
+
+
+@functools.lru_cache()
+class KomorebiCommandDispatcher:
+    """
+    Runs komorebic commands in order on a single worker thread. Commands submitted while an earlier one is
+    still queued are coalesced with it: consecutive workspace cycles collapse into their net number of steps,
+    and only the last of consecutive workspace focus or layout changes is run.
+    """
+
+    def __init__(self, komorebic_path: str, executors: tuple[CommandExecutor, ...] = None):
+        self._executors = executors or (SocketExecutor(), ProcessExecutor(komorebic_path))
+        self._queue: deque[KomorebiCommand] = deque()
+        self._condition = threading.Condition()
+        self._worker = threading.Thread(target=self._run, name="KomorebiCommandDispatcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, name: str, *args: str) -> None:
+        command = KomorebiCommand(name, *args)
+
+        with self._condition:
+            if not self._queue or not self._queue[-1].coalesce(command):
+                self._queue.append(command)
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue:
+                    self._condition.wait()
+                command = self._queue.popleft()
+
+            # A failing command must never take the worker down with it, or every later command would be lost
+            try:
+                for command_args in command.expand():
+                    self._execute(command_args)
+            except Exception:
+                logging.exception(f"Failed to run komorebic command {command.name}")
+
+    def _execute(self, command_args: list[str]) -> None:
+        for executor in self._executors:
+            try:
+                if executor.is_available() and executor.execute(command_args):
+                    return
+            except (OSError, ValueError, subprocess.SubprocessError):
+                logging.exception(f"Failed to run komorebic {' '.join(command_args)} with {executor.__class__.__name__}")
+
+        logging.error(f"No executor was able to run komorebic {' '.join(command_args)}")
@@ -1,16 +1,21 @@
 import logging
-import time
-import json
+import threading
 import uuid
-import win32pipe
-import win32file
 from PyQt6.QtCore import QThread
 from core.event_enums import KomorebiEvent
 from core.event_service import EventService
 from core.utils.komorebi.client import KomorebiClient
+from core.utils.komorebi.transport import KomorebiTransport, create_transport
+from core.utils.komorebi.state_store import KomorebiStateStore
+from core.utils.komorebi.state_cache import KomorebiStateCache
+from core.utils.komorebi.message_decoder import KomorebiMessageDecoder
 
 KOMOREBI_PIPE_BUFF_SIZE = 64 * 1024
 KOMOREBI_PIPE_NAME = "yasb"
+KOMOREBI_RETRY_INTERVAL_SECS = 1
+
+# Window events which leave monitors and workspaces untouched, so their state is only parsed if subscribed to
+KOMOREBI_STATELESS_EVENTS = ["FocusChange", "MoveResizeStart", "MouseCapture", "Raise", "TitleUpdate"]
 
 
 class KomorebiEventListener(QThread):
@@ -18,101 +23,137 @@ class KomorebiEventListener(QThread):
     def __init__(
             self,
             pipe_name: str = KOMOREBI_PIPE_NAME,
-            buffer_size: int = KOMOREBI_PIPE_BUFF_SIZE
+            buffer_size: int = KOMOREBI_PIPE_BUFF_SIZE,
+            transport: KomorebiTransport = None
     ):
         super().__init__()
         self._komorebic = KomorebiClient()
         self._app_running = True
+        self._stop_event = threading.Event()
         self.pipe_name = f"{pipe_name}-{uuid.uuid1()}"
         self.buffer_size = buffer_size
         self.event_service = EventService()
-        self.pipe = None
+        self.transport = transport or create_transport(self.pipe_name, buffer_size)
+        self.state_store = KomorebiStateStore()
+        self.state_cache = KomorebiStateCache()
+        self.decoder = KomorebiMessageDecoder(self._needs_state)
+        self._komorebi_state = None
 
     def __str__(self):
         return "Komorebi Event Listener"
 
-    def _create_pipe(self) -> None:
-        open_mode = win32pipe.PIPE_ACCESS_DUPLEX
-        pipe_mode = win32pipe.PIPE_TYPE_MESSAGE | win32pipe.PIPE_READMODE_MESSAGE | win32pipe.PIPE_WAIT
-        max_instances = 1
-        buffer_size_in = self.buffer_size
-        buffer_size_out = self.buffer_size
-        default_timeout_ms = 0
-        security_attributes = None
-        self.pipe = win32pipe.CreateNamedPipe(
-            f"\\\\.\\pipe\\{self.pipe_name}",
-            open_mode,
-            pipe_mode,
-            max_instances,
-            buffer_size_in,
-            buffer_size_out,
-            default_timeout_ms,
-            security_attributes
-        )
-        logging.info(f"Created named pipe {self.pipe_name}")
-
     def run(self):
-        self._create_pipe()
-        self._wait_until_komorebi_online()
-
-        try:
-            while self._app_running:
-                buffer, bytes_to_read, result = win32pipe.PeekNamedPipe(self.pipe, 1)
-
-                if not bytes_to_read:
-                    time.sleep(0.05)
+        while self._app_running:
+            try:
+                self.transport.open()
+
+                if self._wait_until_komorebi_online():
+                    self._read_events()
+            except (BaseException, Exception):
+                if self._app_running:
+                    logging.exception(f"Komorebi has disconnected from {self.transport.name}")
+                    self.state_cache.invalidate()
+                    self.event_service.emit_event(KomorebiEvent.KomorebiDisconnect)
+                    self._stop_event.wait(KOMOREBI_RETRY_INTERVAL_SECS)
+            finally:
+                self.transport.close()
+                logging.debug(f"Komorebi state cache: {self.state_cache.stats}")
+
+    def _read_events(self) -> None:
+        self.decoder.reset()
+
+        while self._app_running:
+            data = self.transport.read_message()
+
+            if data is None:
+                return
+
+            # Both transports return whole frames: pipe messages, or newline-delimited socket messages
+            for message in self.decoder.feed(data, end_of_frame=True):
+                try:
+                    state = message.state if self._needs_state(message.event) else None
+                except (KeyError, ValueError):
+                    logging.exception(f"Failed parse komorebi state of event: {message.event}")
                     continue
 
-                result, data = win32file.ReadFile(self.pipe, bytes_to_read, None)
+                if self._komorebi_state is None and state:
+                    self._on_connect(state)
 
-                if not data.strip():
-                    continue
+                if message.event and state:
+                    self._emit_event(message.event, state)
 
-                try:
-                    event_message = json.loads(data.decode("utf-8"))
-                    event = event_message['event']
-                    state = event_message['state']
+    def _needs_state(self, event: dict) -> bool:
+        event_type = event.get('type', None) if event else None
 
-                    if event and state:
-                        self._emit_event(event, state)
-                except (KeyError, ValueError):
-                    logging.exception(f"Failed parse komorebi state. Received data: {data}")
-        except (BaseException, Exception):
-            logging.exception(f"Komorebi has disconnected from the named pipe {self.pipe_name}")
-            win32file.CloseHandle(self.pipe)
-            self.event_service.emit_event(KomorebiEvent.KomorebiDisconnect)
-            self.start()
+        return (
+            self._komorebi_state is None or
+            event_type not in KOMOREBI_STATELESS_EVENTS or
+            self.event_service.has_registered_signals(KomorebiEvent.KomorebiUpdate) or
+            (event_type in KomorebiEvent and self.event_service.has_registered_signals(KomorebiEvent[event_type]))
+        )
 
     def stop(self):
         self._app_running = False
+        self._stop_event.set()
+        self.transport.cancel()
+
+    def replay_state(self) -> None:
+        """Re-emits the last known state as a connect event, for widgets built after the listener connected."""
+        if self._komorebi_state:
+            self.event_service.emit_event(KomorebiEvent.KomorebiConnect, self._komorebi_state)
 
     def _emit_event(self, event: dict, state: dict) -> None:
+        self._komorebi_state = state
+        self.state_cache.put(state)
+        changes = self.state_store.update(state)
         self.event_service.emit_event(KomorebiEvent.KomorebiUpdate, event, state)
 
         if event['type'] in KomorebiEvent:
             self.event_service.emit_event(KomorebiEvent[event['type']], event, state)
 
-    def _wait_until_komorebi_online(self):
+        if changes:
+            self.event_service.emit_event(KomorebiEvent.KomorebiStateChange, changes, self.state_store.snapshot)
+
+    def _on_connect(self, state: dict) -> None:
+        self._komorebi_state = state
+        self.state_cache.put(state)
+        self.state_store.reset()
+        self.state_store.update(state)
+        self.event_service.emit_event(KomorebiEvent.KomorebiConnect, state)
+
+    def _wait_until_komorebi_online(self) -> bool:
+        self._komorebi_state = None
+        self.state_cache.invalidate()
+
+        if not self.transport.requires_subscription:
+            # Stand-in transports have no komorebic to subscribe with, so the first message connects
+            return self.transport.wait_for_client()
+
         logging.info(f"Waiting for Komorebi to subscribe to named pipe {self.pipe_name}")
         stderr, proc = self._komorebic.wait_until_subscribed_to_pipe(self.pipe_name)
 
         if stderr:
             logging.warning(f"Komorebi failed to subscribe named pipe. Waiting for subscription: {stderr.decode('utf-8')}")
 
-        while self._app_running and proc.returncode != 0:
-            time.sleep(1)
+        while proc.returncode != 0:
+            if self._stop_event.wait(KOMOREBI_RETRY_INTERVAL_SECS):
+                return False
             stderr, proc = self._komorebic.wait_until_subscribed_to_pipe(self.pipe_name)
 
-        win32pipe.ConnectNamedPipe(self.pipe, None)
+        if not self.transport.wait_for_client():
+            return False
+
         logging.info(f"Komorebi connected to named pipe: {self.pipe_name}")
         state = self._komorebic.query_state()
 
-        while self._app_running and state is None:
+        while state is None:
             logging.error(
                 "Failed to retrieve komorebi state before starting event listener: None returned. "
-                "Retrying in 1 second... Is komorebi online and its binaries added to $PATH?"
+                f"Retrying in {KOMOREBI_RETRY_INTERVAL_SECS} second(s)... Is komorebi online and its binaries added to $PATH?"
             )
-            time.sleep(1)
+            if self._stop_event.wait(KOMOREBI_RETRY_INTERVAL_SECS):
+                return False
             state = self._komorebic.query_state()
 
-        self.event_service.emit_event(KomorebiEvent.KomorebiConnect, state)
+        self._on_connect(state)
+        return True
@@ -0,0 +1,159 @@
+import codecs
+import functools
+import json
+import logging
+import re
+from typing import Callable, Optional
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+KOMOREBI_MESSAGE_HEADER = '{"event":'
+# Whitespace tolerant, as pretty-printed or re-serialised streams may not use komorebi's compact layout
+KOMOREBI_MESSAGE_HEADER_PATTERN = re.compile(r'\{\s*"event"\s*:')
+KOMOREBI_STATE_SEPARATOR_PATTERN = re.compile(r'\s*,\s*"state"\s*:\s*')
+KOMOREBI_MAX_MESSAGE_SIZE = 32 * 1024 * 1024
+
+
+class KomorebiMessage:
+    """A komorebi notification whose event is parsed eagerly and whose much larger state is parsed on first access."""
+
+    def __init__(self, event: dict, raw_message: str, state_start: Optional[int], state: dict = None):
+        self.event = event
+        self._raw_message = raw_message
+        self._state_start = state_start
+
+        if state is not None:
+            self.__dict__['state'] = state
+
+    @functools.cached_property
+    def state(self) -> dict:
+        return parse_state(self._raw_message, self._state_start)
+
+
+def parse_state(raw_message: str, state_start: Optional[int]) -> dict:
+    if state_start is not None:
+        # Fast path for komorebi's compact {"event":...,"state":...} layout, skipping the outer closing brace
+        try:
+            return json_loads(raw_message[state_start:raw_message.rindex("}")])
+        except ValueError:
+            pass
+
+    return json.loads(raw_message)['state']
+
+
+class KomorebiMessageDecoder:
+    """
+    Reassembles komorebi notifications from the chunks read off the transport. A message larger than a single
+    write may arrive split across several chunks, and a stream may carry several messages in one chunk.
+
+    Each message starts with '{"event":', possibly with whitespace around its tokens. That can't occur inside
+    a JSON string as its quotes would be escaped, so it marks message boundaries without parsing the state.
+    The state of a message is only parsed up front when needs_state returns True for its event, otherwise it is
+    parsed on first access.
+
+    A message followed by the header of the next one is known to be complete. The last message in the buffer
+    only is if the chunk ended a transport frame, so without end_of_frame its state is parsed to prove it.
+    """
+
+    def __init__(self, needs_state: Callable[[dict], bool], max_message_size: int = KOMOREBI_MAX_MESSAGE_SIZE):
+        self._needs_state = needs_state
+        self._max_message_size = max_message_size
+        self._utf8_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+
+    def reset(self) -> None:
+        self._utf8_decoder.reset()
+        self._buffer = ""
+
+    def feed(self, data: bytes, end_of_frame: bool = False) -> list[KomorebiMessage]:
+        """
+        Returns the messages completed by data. Transports which preserve message boundaries pass end_of_frame
+        for data ending a message, so its state isn't parsed only to tell whether it is complete.
+        """
+        # The kept data was already searched for the next header, up to a header possibly split at its end
+        scanned_length = len(self._buffer)
+        self._buffer += self._utf8_decoder.decode(data)
+        messages = []
+
+        while self._buffer:
+            header = KOMOREBI_MESSAGE_HEADER_PATTERN.search(self._buffer)
+
+            if header is None:
+                # The header of the next message may itself be split across chunks
+                partial_header_start = self._find_partial_header(self._buffer)
+                self._discard_stray_data(self._buffer[:partial_header_start])
+                self._buffer = self._buffer[partial_header_start:]
+                break
+
+            message_start = header.start()
+
+            if message_start > 0:
+                self._discard_stray_data(self._buffer[:message_start])
+
+            # A header holds a single brace, so one split at the end of the kept data starts at its last brace
+            next_header_search_start = max(header.end(), self._buffer.rfind("{", 0, scanned_length))
+            next_header = KOMOREBI_MESSAGE_HEADER_PATTERN.search(self._buffer, next_header_search_start)
+            next_message_start = next_header.start() if next_header else -1
+            is_last_message = next_header is None
+            raw_message = self._buffer[message_start:] if is_last_message else self._buffer[message_start:next_message_start]
+            message = self._decode_message(raw_message.strip(), is_last_message, end_of_frame)
+
+            if message is None and is_last_message:
+                if len(raw_message) > self._max_message_size:
+                    logging.error(f"Discarding incomplete komorebi message exceeding {self._max_message_size} bytes")
+                    self._buffer = ""
+                else:
+                    # Wait for the rest of the message
+                    self._buffer = raw_message
+                break
+
+            if message:
+                messages.append(message)
+
+            self._buffer = "" if is_last_message else self._buffer[next_message_start:]
+            scanned_length = 0
+
+        return messages
+
+    def _decode_message(self, raw_message: str, is_last_message: bool, end_of_frame: bool) -> Optional[KomorebiMessage]:
+        """Returns None if the message is incomplete, or could not be parsed if it is not the last message."""
+        if not raw_message.endswith("}"):
+            if not is_last_message:
+                logging.error(f"Failed parse komorebi state. Received data: {raw_message}")
+            return None
+
+        try:
+            header_end = KOMOREBI_MESSAGE_HEADER_PATTERN.match(raw_message).end()
+            # raw_decode doesn't skip leading whitespace itself
+            event_start = json.decoder.WHITESPACE.match(raw_message, header_end).end()
+            event, event_end = json.JSONDecoder().raw_decode(raw_message, event_start)
+            state_separator = KOMOREBI_STATE_SEPARATOR_PATTERN.match(raw_message, event_end)
+            state_start = state_separator.end() if state_separator else None
+            # A chunk may end on any brace of the state, so only a full parse proves an unframed message complete
+            needs_state = self._needs_state(event) or (is_last_message and not end_of_frame)
+            state = parse_state(raw_message, state_start) if needs_state else None
+            return KomorebiMessage(event, raw_message, state_start, state)
+        except (KeyError, ValueError):
+            if not is_last_message:
+                logging.exception(f"Failed parse komorebi state. Received data: {raw_message}")
+            return None
+
+    @staticmethod
+    def _find_partial_header(data: str) -> int:
+        """Returns where a trailing prefix of a message header starts, or the length of data if it has none."""
+        # A header prefix holds a single brace, so only the last one can start it
+        start = data.rfind("{")
+
+        if start != -1 and KOMOREBI_MESSAGE_HEADER.startswith("".join(data[start:].split())):
+            return start
+
+        return len(data)
+
+    @staticmethod
+    def _discard_stray_data(data: str) -> None:
+        if data.strip():
+            logging.warning(f"Discarding {len(data)} characters of komorebi data without a message header")
@@ -0,0 +1,91 @@
+import functools
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+KOMOREBI_STATE_CACHE_TTL_SECS = 1.0
+KOMOREBI_STATE_QUERY_WAIT_SECS = 5.0
+
+
+@functools.lru_cache()
+class KomorebiStateCache:
+    """
+    Caches the komorebi state for a short TTL. Callers arriving while a query is in flight wait for and share
+    its result instead of running their own. States received through the event pipe refresh the cache.
+    """
+
+    def __init__(self, ttl_secs: float = KOMOREBI_STATE_CACHE_TTL_SECS):
+        self._ttl_secs = ttl_secs
+        self._lock = threading.Lock()
+        self._state: Optional[dict] = None
+        self._updated_at = 0.0
+        self._in_flight_query: Optional[threading.Event] = None
+        self.hits = 0
+        self.misses = 0
+        self.num_queries = 0
+        self.total_query_ms = 0.0
+        self.max_query_ms = 0.0
+
+    @property
+    def stats(self) -> dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'queries': self.num_queries,
+            'mean_query_ms': self.total_query_ms / self.num_queries if self.num_queries else 0.0,
+            'max_query_ms': self.max_query_ms
+        }
+
+    def get(self, query_state: Callable[[], Optional[dict]]) -> Optional[dict]:
+        with self._lock:
+            if self._state is not None and time.monotonic() - self._updated_at < self._ttl_secs:
+                self.hits += 1
+                return self._state
+
+            in_flight_query = self._in_flight_query
+
+            if in_flight_query:
+                self.hits += 1
+            else:
+                self.misses += 1
+                self._in_flight_query = threading.Event()
+
+        if in_flight_query:
+            in_flight_query.wait(KOMOREBI_STATE_QUERY_WAIT_SECS)
+            return self._state
+
+        return self._run_query(query_state)
+
+    def put(self, state: dict) -> None:
+        with self._lock:
+            self._state = state
+            self._updated_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._state = None
+
+    def _run_query(self, query_state: Callable[[], Optional[dict]]) -> Optional[dict]:
+        query_start = time.perf_counter()
+        state = None
+
+        try:
+            state = query_state()
+        except Exception:
+            logging.exception("Failed to query komorebi state")
+        finally:
+            query_ms = (time.perf_counter() - query_start) * 1000
+
+            with self._lock:
+                if state is not None:
+                    self._state = state
+                    self._updated_at = time.monotonic()
+
+                self.num_queries += 1
+                self.total_query_ms += query_ms
+                self.max_query_ms = max(self.max_query_ms, query_ms)
+                self._in_flight_query.set()
+                self._in_flight_query = None
+
+        return state
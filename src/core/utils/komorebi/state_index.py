@@ -0,0 +1,55 @@
+import threading
+from typing import Optional
+
+
+class WindowLocation:
+    def __init__(self, monitor: dict, workspace: dict, container: Optional[dict]):
+        self.monitor = monitor
+        self.workspace = workspace
+        self.container = container
+
+
+class KomorebiStateIndex:
+    """
+    Lookup tables for a single komorebi state, built in one pass so that queries by window hwnd or monitor id
+    no longer scan every monitor, workspace, container and window. Like add_index, the monitor and workspace
+    dicts of the state are tagged with their 'index'.
+    """
+
+    def __init__(self, state: dict):
+        self.monitor_by_id: dict[int, dict] = {}
+        self.window_locations: dict[int, WindowLocation] = {}
+
+        for monitor_index, monitor in enumerate(state['monitors']['elements']):
+            monitor['index'] = monitor_index
+            self.monitor_by_id[monitor.get('id', None)] = monitor
+
+            for workspace_index, workspace in enumerate(monitor['workspaces']['elements']):
+                workspace['index'] = workspace_index
+
+                for floating_window in workspace.get('floating_windows', []):
+                    self.window_locations[floating_window['hwnd']] = WindowLocation(monitor, workspace, None)
+
+                for container in workspace.get('containers', {}).get('elements', []):
+                    for managed_window in container.get('windows', {}).get('elements', []):
+                        self.window_locations[managed_window['hwnd']] = WindowLocation(monitor, workspace, container)
+
+
+_index_lock = threading.Lock()
+_last_indexed_state: Optional[dict] = None
+_last_state_index: Optional[KomorebiStateIndex] = None
+
+
+def get_state_index(state: dict) -> KomorebiStateIndex:
+    """
+    Returns the index of the given state. It is built on the first lookup of each state object, so states
+    nobody queries, such as those of bursts of events, are never indexed.
+    """
+    global _last_indexed_state, _last_state_index
+
+    with _index_lock:
+        if state is not _last_indexed_state:
+            _last_state_index = KomorebiStateIndex(state)
+            _last_indexed_state = state
+
+        return _last_state_index
@@ -0,0 +1,156 @@
+import functools
+import threading
+from enum import Enum
+from typing import Optional
+from core.utils.komorebi.client import KomorebiClient
+
+
+class KomorebiChangeType(Enum):
+    MonitorAdded = "MonitorAdded"
+    MonitorRemoved = "MonitorRemoved"
+    MonitorFocused = "MonitorFocused"
+    WorkspaceAdded = "WorkspaceAdded"
+    WorkspaceRemoved = "WorkspaceRemoved"
+    WorkspaceFocused = "WorkspaceFocused"
+    WorkspaceRenamed = "WorkspaceRenamed"
+    WorkspacePopulated = "WorkspacePopulated"
+    WorkspaceEmptied = "WorkspaceEmptied"
+    WorkspaceLayoutChanged = "WorkspaceLayoutChanged"
+    PauseToggled = "PauseToggled"
+
+
+class KomorebiChange:
+    def __init__(self, change_type: KomorebiChangeType, monitor_id: int = None, workspace_index: int = None):
+        self.change_type = change_type
+        self.monitor_id = monitor_id
+        self.workspace_index = workspace_index
+
+    def __repr__(self):
+        return f"KomorebiChange({self.change_type.value}, monitor={self.monitor_id}, workspace={self.workspace_index})"
+
+
+class WorkspaceSnapshot:
+    """The parts of a komorebi workspace which widgets render. Never mutated once created."""
+
+    def __init__(self, workspace: dict, index: int):
+        self.index = index
+        self.name = workspace.get('name', None)
+        self.has_windows = KomorebiClient.get_num_windows(workspace)
+        self.layout = workspace.get('layout', {}).get('Default', None)
+        self.tile = workspace.get('tile', False)
+        self.monocle = bool(workspace.get('monocle_container', None))
+        self.maximised = bool(workspace.get('maximized_window', None))
+
+    @property
+    def layout_state(self) -> tuple:
+        return self.layout, self.tile, self.monocle, self.maximised
+
+
+class MonitorSnapshot:
+    def __init__(self, monitor: dict, index: int):
+        self.id = monitor.get('id', None)
+        self.index = index
+        self.focused_workspace_index = monitor['workspaces']['focused']
+        self.workspaces = tuple(
+            WorkspaceSnapshot(workspace, i) for i, workspace in enumerate(monitor['workspaces']['elements'])
+        )
+
+    @property
+    def focused_workspace(self) -> Optional[WorkspaceSnapshot]:
+        return self.get_workspace(self.focused_workspace_index)
+
+    def get_workspace(self, workspace_index: int) -> Optional[WorkspaceSnapshot]:
+        if 0 <= workspace_index < len(self.workspaces):
+            return self.workspaces[workspace_index]
+        return None
+
+
+class KomorebiSnapshot:
+    def __init__(self, state: dict):
+        self.is_paused = state.get('is_paused', False)
+        self.focused_monitor_index = state['monitors']['focused']
+        self.monitors = tuple(MonitorSnapshot(monitor, i) for i, monitor in enumerate(state['monitors']['elements']))
+        self._monitors_by_id = {monitor.id: monitor for monitor in self.monitors}
+
+    def get_monitor(self, monitor_id: int) -> Optional[MonitorSnapshot]:
+        return self._monitors_by_id.get(monitor_id, None)
+
+
+def diff_snapshots(prev: Optional[KomorebiSnapshot], curr: KomorebiSnapshot) -> list[KomorebiChange]:
+    if prev is None:
+        return [KomorebiChange(KomorebiChangeType.MonitorAdded, monitor.id) for monitor in curr.monitors]
+
+    changes = []
+
+    if prev.is_paused != curr.is_paused:
+        changes.append(KomorebiChange(KomorebiChangeType.PauseToggled))
+
+    if prev.focused_monitor_index != curr.focused_monitor_index and curr.focused_monitor_index < len(curr.monitors):
+        changes.append(KomorebiChange(KomorebiChangeType.MonitorFocused, curr.monitors[curr.focused_monitor_index].id))
+
+    for prev_monitor in prev.monitors:
+        if curr.get_monitor(prev_monitor.id) is None:
+            changes.append(KomorebiChange(KomorebiChangeType.MonitorRemoved, prev_monitor.id))
+
+    for monitor in curr.monitors:
+        prev_monitor = prev.get_monitor(monitor.id)
+
+        if prev_monitor is None:
+            changes.append(KomorebiChange(KomorebiChangeType.MonitorAdded, monitor.id))
+            continue
+
+        if prev_monitor.focused_workspace_index != monitor.focused_workspace_index:
+            changes.append(KomorebiChange(
+                KomorebiChangeType.WorkspaceFocused, monitor.id, monitor.focused_workspace_index
+            ))
+
+        for workspace in monitor.workspaces:
+            prev_workspace = prev_monitor.get_workspace(workspace.index)
+
+            if prev_workspace is None:
+                changes.append(KomorebiChange(KomorebiChangeType.WorkspaceAdded, monitor.id, workspace.index))
+                continue
+
+            if prev_workspace.name != workspace.name:
+                changes.append(KomorebiChange(KomorebiChangeType.WorkspaceRenamed, monitor.id, workspace.index))
+
+            if prev_workspace.has_windows != workspace.has_windows:
+                change_type = KomorebiChangeType.WorkspacePopulated if workspace.has_windows \
+                    else KomorebiChangeType.WorkspaceEmptied
+                changes.append(KomorebiChange(change_type, monitor.id, workspace.index))
+
+            if prev_workspace.layout_state != workspace.layout_state:
+                changes.append(KomorebiChange(KomorebiChangeType.WorkspaceLayoutChanged, monitor.id, workspace.index))
+
+        for workspace_index in range(len(monitor.workspaces), len(prev_monitor.workspaces)):
+            changes.append(KomorebiChange(KomorebiChangeType.WorkspaceRemoved, monitor.id, workspace_index))
+
+    return changes
+
+
+@functools.lru_cache()
+class KomorebiStateStore:
+    """
+    Holds the latest komorebi state, parsed once per event on the listener thread into an immutable
+    snapshot. Widgets keep a reference to the snapshot they were sent, so later updates never race them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.state: Optional[dict] = None
+        self.snapshot: Optional[KomorebiSnapshot] = None
+
+    def update(self, state: dict) -> list[KomorebiChange]:
+        snapshot = KomorebiSnapshot(state)
+
+        with self._lock:
+            changes = diff_snapshots(self.snapshot, snapshot)
+            self.state = state
+            self.snapshot = snapshot
+
+        return changes
+
+    def reset(self) -> None:
+        with self._lock:
+            self.state = None
+            self.snapshot = None
@@ -0,0 +1,210 @@
+import logging
+from abc import ABC, abstractmethod
+import os
+import select
+import socket
+import tempfile
+from contextlib import suppress
+from typing import Optional
+
+try:
+    import pywintypes
+    import win32event
+    import win32file
+    import win32pipe
+    import winerror
+    IMPORT_WIN32_PIPES_SUCCESSFUL = True
+except ImportError:
+    IMPORT_WIN32_PIPES_SUCCESSFUL = False
+
+
+class KomorebiTransport(ABC):
+    """
+    A channel komorebi writes its event messages to. Every blocking call returns early once cancel() is
+    called from another thread, which permanently cancels the transport.
+    """
+    requires_subscription = True
+
+    def __init__(self, name: str, buffer_size: int):
+        self.name = name
+        self.buffer_size = buffer_size
+
+    @abstractmethod
+    def open(self) -> None:
+        ...
+
+    @abstractmethod
+    def wait_for_client(self) -> bool:
+        """Blocks until a client connects. Returns False if cancelled."""
+
+    @abstractmethod
+    def read_message(self) -> Optional[bytes]:
+        """Blocks until a complete message was received. Returns None if cancelled."""
+
+    @abstractmethod
+    def cancel(self) -> None:
+        ...
+
+    @abstractmethod
+    def close(self) -> None:
+        ...
+
+
+class NamedPipeTransport(KomorebiTransport):
+    """
+    Reads komorebi messages from an overlapped named pipe in message mode. Reads wait on both the I/O
+    and a cancel event rather than polling, and messages larger than the buffer are read until complete.
+    """
+
+    def __init__(self, name: str, buffer_size: int):
+        super().__init__(name, buffer_size)
+        self._pipe = None
+        self._overlapped = None
+        self._cancel_event = win32event.CreateEvent(None, True, False, None)
+
+    def open(self) -> None:
+        self._pipe = win32pipe.CreateNamedPipe(
+            f"\\\\.\\pipe\\{self.name}",
+            win32pipe.PIPE_ACCESS_DUPLEX | win32file.FILE_FLAG_OVERLAPPED,
+            win32pipe.PIPE_TYPE_MESSAGE | win32pipe.PIPE_READMODE_MESSAGE | win32pipe.PIPE_WAIT,
+            1,
+            self.buffer_size,
+            self.buffer_size,
+            0,
+            None
+        )
+        self._overlapped = pywintypes.OVERLAPPED()
+        self._overlapped.hEvent = win32event.CreateEvent(None, True, False, None)
+        logging.info(f"Created named pipe {self.name}")
+
+    def wait_for_client(self) -> bool:
+        if win32pipe.ConnectNamedPipe(self._pipe, self._overlapped) == winerror.ERROR_PIPE_CONNECTED:
+            return True
+
+        return self._wait_for_overlapped_result() is not None
+
+    def read_message(self) -> Optional[bytes]:
+        message = bytearray()
+
+        while True:
+            buffer = win32file.AllocateReadBuffer(self.buffer_size)
+            result, _ = win32file.ReadFile(self._pipe, buffer, self._overlapped)
+            more_data = result == winerror.ERROR_MORE_DATA
+
+            try:
+                num_bytes = self._wait_for_overlapped_result()
+            except pywintypes.error as e:
+                if e.winerror != winerror.ERROR_MORE_DATA:
+                    raise
+                num_bytes = len(buffer)
+                more_data = True
+
+            if num_bytes is None:
+                return None
+
+            message += buffer[:num_bytes]
+
+            if not more_data:
+                return bytes(message)
+
+    def cancel(self) -> None:
+        win32event.SetEvent(self._cancel_event)
+
+    def close(self) -> None:
+        for handle in (self._pipe, self._overlapped.hEvent if self._overlapped else None):
+            if handle:
+                with suppress(pywintypes.error):
+                    win32file.CloseHandle(handle)
+
+        self._pipe = None
+        self._overlapped = None
+
+    def _wait_for_overlapped_result(self) -> Optional[int]:
+        wait_result = win32event.WaitForMultipleObjects(
+            [self._overlapped.hEvent, self._cancel_event],
+            False,
+            win32event.INFINITE
+        )
+
+        if wait_result != win32event.WAIT_OBJECT_0:
+            win32file.CancelIo(self._pipe)
+            # The pending operation must finish before its buffer can be released
+            with suppress(pywintypes.error):
+                win32file.GetOverlappedResult(self._pipe, self._overlapped, True)
+            return None
+
+        return win32file.GetOverlappedResult(self._pipe, self._overlapped, False)
+
+
+class UnixSocketTransport(KomorebiTransport):
+    """
+    A stand-in for the komorebi named pipe on systems without win32 pipes. It listens on a local socket
+    for newline-delimited messages, such as a recorded komorebi event stream being replayed.
+    """
+    requires_subscription = False
+
+    def __init__(self, name: str, buffer_size: int):
+        super().__init__(name, buffer_size)
+        self.socket_path = os.path.join(tempfile.gettempdir(), f"{name}.sock")
+        self._server = None
+        self._connection = None
+        self._pending = b""
+        self._cancel_recv, self._cancel_send = socket.socketpair()
+
+    def open(self) -> None:
+        with suppress(FileNotFoundError):
+            os.unlink(self.socket_path)
+
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.socket_path)
+        self._server.listen(1)
+        self._pending = b""
+        logging.info(f"Listening for komorebi events on {self.socket_path}")
+
+    def wait_for_client(self) -> bool:
+        if not self._wait_until_readable(self._server):
+            return False
+
+        self._connection, _ = self._server.accept()
+        return True
+
+    def read_message(self) -> Optional[bytes]:
+        while b"\n" not in self._pending:
+            if not self._wait_until_readable(self._connection):
+                return None
+
+            chunk = self._connection.recv(self.buffer_size)
+
+            if not chunk:
+                raise ConnectionError(f"Client disconnected from {self.socket_path}")
+
+            self._pending += chunk
+
+        message, _, self._pending = self._pending.partition(b"\n")
+        return message
+
+    def cancel(self) -> None:
+        with suppress(OSError):
+            self._cancel_send.send(b"\0")
+
+    def close(self) -> None:
+        for sock in (self._connection, self._server):
+            if sock:
+                sock.close()
+
+        self._connection = None
+        self._server = None
+
+        with suppress(FileNotFoundError):
+            os.unlink(self.socket_path)
+
+    def _wait_until_readable(self, sock: socket.socket) -> bool:
+        readable, _, _ = select.select([sock, self._cancel_recv], [], [])
+        return self._cancel_recv not in readable
+
+
+def create_transport(name: str, buffer_size: int) -> KomorebiTransport:
+    if IMPORT_WIN32_PIPES_SUCCESSFUL:
+        return NamedPipeTransport(name, buffer_size)
+
+    return UnixSocketTransport(name, buffer_size)
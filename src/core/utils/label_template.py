@@ -0,0 +1,42 @@
+import re
+from typing import Any, Callable, Iterable, Mapping
+
+LABEL_FIELD_PATTERN = re.compile(r"\{(\w+)\}")
+
+
+class LabelTemplate:
+    """
+    A widget label such as "CPU: {cpu_percent_total}%", parsed once into literal and field segments.
+    Only placeholders found in known_fields are treated as fields, any other braces are kept as literal text.
+    """
+
+    def __init__(self, template: str, known_fields: Iterable[str]):
+        known_fields = set(known_fields)
+        segments: list[tuple[bool, str]] = []
+        last_end = 0
+
+        for match in LABEL_FIELD_PATTERN.finditer(template):
+            field_name = match.group(1)
+
+            if field_name not in known_fields:
+                continue
+
+            if match.start() > last_end:
+                segments.append((False, template[last_end:match.start()]))
+
+            segments.append((True, field_name))
+            last_end = match.end()
+
+        if last_end < len(template):
+            segments.append((False, template[last_end:]))
+
+        self.template = template
+        self.fields = frozenset(segment for is_field, segment in segments if is_field)
+        self._segments = segments
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        return "".join([str(values[segment]) if is_field else segment for is_field, segment in self._segments])
+
+    def render_lazy(self, value_getters: Mapping[str, Callable[[], Any]]) -> str:
+        """Renders the template, calling only the getters of fields the template references."""
+        return self.render({field_name: value_getters[field_name]() for field_name in self.fields})
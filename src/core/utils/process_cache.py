@@ -0,0 +1,153 @@
+import functools
+import logging
+import threading
+import time
+import psutil
+from collections import OrderedDict
+from typing import Optional
+
+PROCESS_CACHE_SIZE = 256
+# How long a cached process is trusted to still be running, and its pid not reused, before it is checked again
+PROCESS_REVALIDATE_SECS = 2
+
+
+class ProcessInfo:
+    """The attributes of a process which never change while it runs, looked up once per process."""
+
+    def __init__(self, process: psutil.Process, name: str, ppid: int, create_time: float):
+        self.process = process
+        self.pid = process.pid
+        self.name = name
+        self.ppid = ppid
+        self.create_time = create_time
+        self.validated_at = time.monotonic()
+
+    @property
+    def key(self) -> tuple[int, float]:
+        return self.pid, self.create_time
+
+    @functools.cached_property
+    def exe(self) -> Optional[str]:
+        return self._query(self.process.exe) or None
+
+    @functools.cached_property
+    def cmdline(self) -> Optional[list[str]]:
+        return self._query(self.process.cmdline)
+
+    @functools.cached_property
+    def username(self) -> Optional[str]:
+        return self._query(self.process.username)
+
+    def to_dict(self) -> dict:
+        """Returns the process info with its current resource usage, as returned by get_process_info."""
+        with self.process.oneshot():
+            return {
+                'name': self.name,
+                'pid': self.pid,
+                'ppid': self.ppid,
+                'cpu_percent': self.process.cpu_percent(),
+                'mem_percent': self.process.memory_percent(),
+                'num_threads': self.process.num_threads(),
+                'username': self.username,
+                'status': self.process.status()
+            }
+
+    @staticmethod
+    def _query(getter):
+        try:
+            return getter()
+        except (psutil.AccessDenied, psutil.ZombieProcess):
+            return None
+
+
+@functools.lru_cache()
+class ProcessCache:
+    """
+    A least recently used cache of process info shared by all widgets, by pid. A cached process is only checked
+    against its create time once its revalidation interval passed, as the check opens the process, which costs about
+    as much as the lookup being cached. Within that window a pid reused by a new process returns the info of the
+    exited one. Entries found to have exited are dropped.
+
+    Lookups are by single pid: widgets ask for the process of one window per event, so there are never enough
+    uncached pids at once for a walk of the process table to beat opening each process. The cache itself is what
+    the active window, border and other widgets share.
+    """
+
+    def __init__(self, max_size: int = PROCESS_CACHE_SIZE, revalidate_secs: float = PROCESS_REVALIDATE_SECS):
+        self._max_size = max_size
+        self._revalidate_secs = revalidate_secs
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[int, ProcessInfo] = OrderedDict()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'invalidations': 0
+        }
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / lookups if lookups else 0.0
+
+    def get(self, pid: int) -> Optional[ProcessInfo]:
+        """Returns the info of a process, or None if it doesn't exist or can't be opened."""
+        process_info = self._get_cached(pid)
+
+        if process_info is not None:
+            return process_info
+
+        with self._lock:
+            self.stats['misses'] += 1
+
+        return self._load(pid)
+
+    def invalidate(self, pid: int) -> None:
+        with self._lock:
+            if self._entries.pop(pid, None):
+                self.stats['invalidations'] += 1
+
+    def log_stats(self) -> None:
+        logging.debug(f"Process cache: {self.stats} hit_rate={self.hit_rate:.2f} size={len(self._entries)}")
+
+    def _get_cached(self, pid: int) -> Optional[ProcessInfo]:
+        with self._lock:
+            process_info = self._entries.get(pid, None)
+
+        if process_info is None:
+            return None
+
+        now = time.monotonic()
+
+        if now - process_info.validated_at >= self._revalidate_secs:
+            # is_running compares the create time, so it also detects pids reused by a new process
+            if not process_info.process.is_running():
+                self.invalidate(pid)
+                return None
+
+            process_info.validated_at = now
+
+        with self._lock:
+            self.stats['hits'] += 1
+            if pid in self._entries:
+                self._entries.move_to_end(pid)
+
+        return process_info
+
+    def _load(self, pid: int) -> Optional[ProcessInfo]:
+        try:
+            process = psutil.Process(pid)
+            with process.oneshot():
+                process_info = ProcessInfo(process, process.name(), process.ppid(), process.create_time())
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
+
+        self._put(process_info)
+        return process_info
+
+    def _put(self, process_info: ProcessInfo) -> None:
+        with self._lock:
+            self._entries[process_info.pid] = process_info
+            self._entries.move_to_end(process_info.pid)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
@@ -0,0 +1,54 @@
+import functools
+import logging
+import time
+from contextlib import contextmanager
+from settings import STARTUP_TIME_BUDGET_MS
+
+PROFILER_IMPORT_TIME = time.perf_counter()
+
+
+@functools.lru_cache()
+class StartupProfiler:
+    """
+    Records the duration of named startup phases when enabled via the --profile-startup flag.
+    Phases are recorded in the order they finish, so nested phases are listed before their parent.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._start_time = PROFILER_IMPORT_TIME
+        self._phases: list[tuple[str, float]] = []
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    @contextmanager
+    def phase(self, phase_name: str):
+        if not self.enabled:
+            yield
+            return
+
+        phase_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases.append((phase_name, (time.perf_counter() - phase_start) * 1000))
+
+    def report(self) -> None:
+        if not self.enabled:
+            return
+
+        total_ms = (time.perf_counter() - self._start_time) * 1000
+        phase_name_width = max([len(phase_name) for phase_name, _ in self._phases] + [len("total")])
+
+        logging.info("Startup profile:")
+        for phase_name, phase_ms in self._phases:
+            logging.info(f"  {phase_name:<{phase_name_width}} {phase_ms:>9.1f}ms")
+        logging.info(f"  {'total':<{phase_name_width}} {total_ms:>9.1f}ms (budget: {STARTUP_TIME_BUDGET_MS}ms)")
+
+        if total_ms > STARTUP_TIME_BUDGET_MS:
+            logging.warning(f"Startup took {total_ms - STARTUP_TIME_BUDGET_MS:.1f}ms longer than its budget.")
+
+        # Stop recording once startup is over, as bars rebuilt later on would otherwise accumulate phases
+        self.enabled = False
+        self._phases.clear()
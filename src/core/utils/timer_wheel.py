@@ -0,0 +1,175 @@
+import functools
+import logging
+import time
+from PyQt6.QtCore import QObject, QTimer, Qt
+from typing import Any, Callable, Optional
+from core.utils.idle_monitor import IdleMonitor
+
+TIMER_WHEEL_TICK_MS = 50
+TIMER_WHEEL_NUM_SLOTS = 256
+
+
+class TimerEntry:
+    def __init__(self, owner: Any, callback: Callable[[], None], interval: int):
+        self.owner = owner
+        self.callback = callback
+        self.interval = interval
+        self.due_tick: Optional[int] = None
+        self.paused = False
+        self.num_calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    @property
+    def name(self) -> str:
+        return getattr(self.owner, 'widget_name', None) or self.owner.__class__.__name__
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.num_calls if self.num_calls else 0.0
+
+
+@functools.lru_cache()
+class TimerWheel(QObject):
+    """
+    A hashed timer wheel driving all widget timers from a single QTimer. Intervals are rounded to whole
+    ticks and due times are aligned to multiples of the interval, so entries with the same or compatible
+    intervals fire on the same wakeup. The QTimer is only armed for the next tick with a due entry.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._slots: list[set[TimerEntry]] = [set() for _ in range(TIMER_WHEEL_NUM_SLOTS)]
+        self._entries: set[TimerEntry] = set()
+        self._last_tick = self._current_tick()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._advance)
+        self._idle_monitor = IdleMonitor()
+        self._idle_monitor.idle_changed.connect(self._on_idle_changed)
+        self.num_wakeups = 0
+
+    @property
+    def entries(self) -> list[TimerEntry]:
+        return list(self._entries)
+
+    def register(self, owner: Any, callback: Callable[[], None], interval: int) -> TimerEntry:
+        entry = TimerEntry(owner, callback, interval)
+        self._entries.add(entry)
+        self._schedule(entry)
+        self._arm()
+        return entry
+
+    def unregister(self, entry: TimerEntry) -> None:
+        self._unschedule(entry)
+        self._entries.discard(entry)
+        self._arm()
+
+    def pause(self, entry: TimerEntry) -> None:
+        entry.paused = True
+        self._unschedule(entry)
+        self._arm()
+
+    def resume(self, entry: TimerEntry) -> None:
+        """Resumes a paused entry, running its callback immediately to catch up on missed ticks."""
+        if not entry.paused or entry not in self._entries:
+            return
+
+        entry.paused = False
+        self._run_entry(entry)
+        self._schedule(entry)
+        self._arm()
+
+    def log_callback_stats(self) -> None:
+        for entry in sorted(self._entries, key=lambda e: e.total_ms, reverse=True):
+            logging.debug(
+                f"Timer '{entry.name}' every {entry.interval}ms: {entry.num_calls} call(s), "
+                f"mean {entry.mean_ms:.2f}ms, max {entry.max_ms:.2f}ms"
+            )
+        logging.debug(f"Timer wheel woke up {self.num_wakeups} time(s) for {len(self._entries)} timer(s)")
+
+    @staticmethod
+    def _current_tick() -> int:
+        # Monotonic, so a wall clock stepping backwards never pushes due ticks into the future
+        return int(time.monotonic() * 1000) // TIMER_WHEEL_TICK_MS
+
+    def _schedule(self, entry: TimerEntry) -> None:
+        self._unschedule(entry)
+
+        if entry.paused or entry not in self._entries:
+            return
+
+        interval_ticks = max(1, round(self._idle_monitor.scale_interval(entry.interval) / TIMER_WHEEL_TICK_MS))
+        entry.due_tick = (max(self._current_tick(), self._last_tick) // interval_ticks + 1) * interval_ticks
+        self._slots[entry.due_tick % TIMER_WHEEL_NUM_SLOTS].add(entry)
+
+    def _unschedule(self, entry: TimerEntry) -> None:
+        if entry.due_tick is not None:
+            self._slots[entry.due_tick % TIMER_WHEEL_NUM_SLOTS].discard(entry)
+            entry.due_tick = None
+
+    def _arm(self) -> None:
+        due_ticks = [entry.due_tick for entry in self._entries if entry.due_tick is not None]
+
+        if not due_ticks:
+            self._timer.stop()
+            return
+
+        delay_ms = min(due_ticks) * TIMER_WHEEL_TICK_MS - int(time.monotonic() * 1000)
+        self._timer.start(max(0, delay_ms))
+
+    def _advance(self) -> None:
+        self.num_wakeups += 1
+        now_tick = self._current_tick()
+
+        if now_tick - self._last_tick >= TIMER_WHEEL_NUM_SLOTS:
+            elapsed_slots = range(TIMER_WHEEL_NUM_SLOTS)
+        else:
+            elapsed_slots = (tick % TIMER_WHEEL_NUM_SLOTS for tick in range(self._last_tick + 1, now_tick + 1))
+
+        due_entries = []
+
+        for slot_index in elapsed_slots:
+            slot_due_entries = [entry for entry in self._slots[slot_index] if entry.due_tick <= now_tick]
+            self._slots[slot_index].difference_update(slot_due_entries)
+            due_entries.extend(slot_due_entries)
+
+        self._last_tick = now_tick
+
+        for entry in due_entries:
+            entry.due_tick = None
+            self._run_entry(entry)
+            self._schedule(entry)
+
+        self._arm()
+
+    def _run_entry(self, entry: TimerEntry) -> None:
+        callback_start = time.perf_counter()
+
+        try:
+            entry.callback()
+        except RuntimeError:
+            logging.debug(f"Removing timer of deleted widget '{entry.name}'")
+            self._entries.discard(entry)
+            return
+        except Exception:
+            logging.exception(f"Timer callback of '{entry.name}' failed")
+
+        callback_ms = (time.perf_counter() - callback_start) * 1000
+        entry.num_calls += 1
+        entry.total_ms += callback_ms
+        entry.max_ms = max(entry.max_ms, callback_ms)
+
+    def _on_idle_changed(self, is_idle: bool) -> None:
+        for entry in list(self._entries):
+            if entry.paused:
+                continue
+
+            # Refresh immediately once the user is back rather than waiting out a slowed interval
+            if not is_idle:
+                self._run_entry(entry)
+
+            self._schedule(entry)
+
+        self._arm()
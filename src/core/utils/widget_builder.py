@@ -1,15 +1,24 @@
+import json
+import time
 import yaml
 import logging
+from copy import deepcopy
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtCore import QObject
 from typing import Optional
 from cerberus import Validator
 from importlib import import_module
 from core.utils.alert_dialog import raise_info_alert
+from core.utils.startup_profiler import StartupProfiler
 from settings import DEFAULT_CONFIG_FILENAME
 
 
 class WidgetBuilder(QObject):
+    """
+    Builds widget instances from the widget config. Widget types are resolved and their validators compiled
+    once per type, and normalized options are memoized per widget name, keyed by the hash of its config.
+    """
+
     def __init__(self, widget_configs: dict):
         super().__init__()
         self._widget_event_listeners = set()
@@ -18,17 +27,45 @@ class WidgetBuilder(QObject):
         self._invalid_widget_names = set()
         self._invalid_widget_types = {}
         self._invalid_widget_options = {}
+        self._widget_types: dict[str, tuple[type, Validator]] = {}
+        self._normalized_options: dict[str, tuple[int, dict]] = {}
+        self._build_timings: dict[str, dict[str, float]] = {}
+
+    def update_widget_configs(self, widget_configs: dict) -> None:
+        """
+        Starts a new build pass with the given widget config. Cached options are only dropped for widgets
+        whose config changed, and errors and timings collected in the previous pass are reset.
+        """
+        for widget_name in set(self._widget_configurations) | set(widget_configs):
+            if self._widget_configurations.get(widget_name) != widget_configs.get(widget_name):
+                self._normalized_options.pop(widget_name, None)
+
+        self._widget_configurations = widget_configs
+        self._widget_event_listeners = set()
+        self._missing_widget_types = set()
+        self._invalid_widget_names = set()
+        self._invalid_widget_types = {}
+        self._invalid_widget_options = {}
+        self._build_timings = {}
 
     def build_widgets(self, widget_map: dict[str, list[str]]) -> tuple[dict[str, list[QWidget]], set]:
         bar_widgets = {}
 
         for column, widget_names in widget_map.items():
-            built_widgets = [self._build_widget(widget_name) for widget_name in widget_names]
+            built_widgets = [self.build_widget(widget_name) for widget_name in widget_names]
             bar_widgets[column] = [widget for widget in built_widgets if widget is not None]
 
         return bar_widgets, self._widget_event_listeners
 
-    def _build_widget(self, widget_name: str) -> Optional[QWidget]:
+    @property
+    def widget_event_listeners(self) -> set:
+        return self._widget_event_listeners
+
+    @property
+    def build_timings(self) -> dict[str, dict[str, float]]:
+        return self._build_timings
+
+    def build_widget(self, widget_name: str) -> Optional[QWidget]:
         widget_config = self._widget_configurations.get(widget_name, None)
 
         if (widget_name in self._invalid_widget_names) or (widget_name in self._invalid_widget_options):
@@ -38,28 +75,22 @@ class WidgetBuilder(QObject):
             logging.warning(f"No widget config could be found for widget '{widget_name}")
         else:
             try:
-                widget_module_str, widget_class_str = widget_config['type'].rsplit('.', 1)
-                widget_module = import_module(f"core.widgets.{widget_module_str}")
-                widget_cls = getattr(widget_module, widget_class_str)
-                widget_schema = getattr(widget_cls, 'validation_schema')
+                build_start = time.perf_counter()
+                widget_cls, widget_options_validator = self._resolve_widget_type(widget_config['type'])
                 widget_event_listener = getattr(widget_cls, 'event_listener')
 
-                if type(widget_schema) != dict and not widget_schema:
-                    raise Exception(f"The widget {widget_cls.__name__} has no validation_schema")
-
                 if widget_event_listener:
                     self._widget_event_listeners.add(widget_event_listener)
 
-                widget_options_validator = Validator(widget_schema)
-                widget_options = widget_config.get('options', {})
+                normalized_options = self._get_normalized_options(widget_name, widget_config, widget_options_validator)
 
-                if not widget_options_validator.validate(widget_options, widget_schema):
-                    validation_errors = yaml.dump(widget_options_validator.errors)
-                    indented_validation_errors = f"\n{validation_errors}".replace("\n", "\n      ")
-                    self._invalid_widget_options[widget_name] = indented_validation_errors
-                else:
-                    normalized_options = widget_options_validator.normalized(widget_options)
-                    return widget_cls(**normalized_options)
+                if normalized_options is not None:
+                    construct_start = time.perf_counter()
+                    with StartupProfiler().phase(f"  widget {widget_name} ({widget_cls.__name__})"):
+                        widget = widget_cls(**deepcopy(normalized_options))
+                    widget.widget_name = widget_name
+                    self._record_build_timing(widget_name, build_start, construct_start)
+                    return widget
             except (AttributeError, ValueError, ModuleNotFoundError):
                 logging.exception(f"Failed to import widget with type {widget_config['type']}")
                 self._invalid_widget_types[widget_name] = widget_config['type']
@@ -69,6 +100,59 @@ class WidgetBuilder(QObject):
             except Exception:
                 logging.exception(f"Failed to import widget '{widget_name}'")
 
+    def log_build_timings(self) -> None:
+        if not self._build_timings:
+            return
+
+        num_built = sum(timing['count'] for timing in self._build_timings.values())
+        total_ms = sum(timing['total_ms'] for timing in self._build_timings.values())
+        slowest_widgets = sorted(self._build_timings.items(), key=lambda item: item[1]['total_ms'], reverse=True)[:5]
+        slowest_summary = ", ".join([
+            f"{widget_name} {timing['total_ms']:.1f}ms ({timing['resolve_ms']:.1f}ms resolve/validate)"
+            for widget_name, timing in slowest_widgets
+        ])
+        logging.info(f"Built {num_built} widget(s) in {total_ms:.1f}ms. Slowest: {slowest_summary}")
+
+    def _resolve_widget_type(self, widget_type: str) -> tuple[type, Validator]:
+        if widget_type not in self._widget_types:
+            widget_module_str, widget_class_str = widget_type.rsplit('.', 1)
+            widget_module = import_module(f"core.widgets.{widget_module_str}")
+            widget_cls = getattr(widget_module, widget_class_str)
+            widget_schema = getattr(widget_cls, 'validation_schema')
+
+            if type(widget_schema) != dict and not widget_schema:
+                raise Exception(f"The widget {widget_cls.__name__} has no validation_schema")
+
+            self._widget_types[widget_type] = (widget_cls, Validator(widget_schema))
+
+        return self._widget_types[widget_type]
+
+    def _get_normalized_options(self, widget_name: str, widget_config: dict, validator: Validator) -> Optional[dict]:
+        widget_config_hash = hash(json.dumps(widget_config, sort_keys=True, default=str))
+        cached_options = self._normalized_options.get(widget_name, None)
+
+        if cached_options and cached_options[0] == widget_config_hash:
+            return cached_options[1]
+
+        widget_options = widget_config.get('options', {})
+
+        if not validator.validate(widget_options):
+            validation_errors = yaml.dump(validator.errors)
+            indented_validation_errors = f"\n{validation_errors}".replace("\n", "\n      ")
+            self._invalid_widget_options[widget_name] = indented_validation_errors
+            return None
+
+        normalized_options = validator.normalized(widget_options)
+        self._normalized_options[widget_name] = (widget_config_hash, normalized_options)
+        return normalized_options
+
+    def _record_build_timing(self, widget_name: str, build_start: float, construct_start: float) -> None:
+        build_end = time.perf_counter()
+        timing = self._build_timings.setdefault(widget_name, {'count': 0, 'total_ms': 0.0, 'resolve_ms': 0.0})
+        timing['count'] += 1
+        timing['total_ms'] += (build_end - build_start) * 1000
+        timing['resolve_ms'] += (construct_start - build_start) * 1000
+
     def raise_alerts_if_errors_present(self):
         if self._invalid_widget_names:
             undefined_widgets = "\n".join([
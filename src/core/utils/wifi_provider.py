@@ -0,0 +1,383 @@
+import ctypes
+import functools
+import logging
+import re
+import shutil
+import subprocess
+import threading
+import time
+from abc import ABC, abstractmethod
+from ctypes import wintypes
+from typing import Optional
+
+WIFI_CACHE_TTL_SECS = 0.5
+WIFI_COMMAND_TIMEOUT_SECS = 5
+LINUX_WIRELESS_PATH = "/proc/net/wireless"
+
+WLAN_CLIENT_VERSION = 2
+WLAN_INTERFACE_STATE_CONNECTED = 1
+WLAN_INTF_OPCODE_CURRENT_CONNECTION = 7
+WLAN_INTF_OPCODE_CHANNEL_NUMBER = 8
+
+
+class WifiInfo:
+    """The connection of a wireless interface, queried at once. Fields the backend can't report are None."""
+
+    def __init__(
+            self,
+            ssid: Optional[str] = None,
+            signal: int = 0,
+            bssid: Optional[str] = None,
+            band: Optional[str] = None,
+            link_rate: Optional[float] = None
+    ):
+        self.ssid = ssid
+        self.signal = signal
+        self.bssid = bssid
+        self.band = band
+        self.link_rate = link_rate
+
+    @property
+    def is_connected(self) -> bool:
+        return self.ssid is not None or self.signal > 0
+
+
+def dbm_to_signal(dbm: float) -> int:
+    """Maps a signal level in dBm to the 0-100 quality scale used by Windows, where -50 dBm and above is 100."""
+    return max(0, min(100, int(2 * (dbm + 100))))
+
+
+def channel_to_band(channel: int) -> str:
+    return "2.4 GHz" if channel <= 14 else "5 GHz"
+
+
+def frequency_to_band(frequency_mhz: float) -> str:
+    if frequency_mhz < 3000:
+        return "2.4 GHz"
+    return "5 GHz" if frequency_mhz < 5925 else "6 GHz"
+
+
+def _parse_key_values(output: str) -> dict[str, str]:
+    values = {}
+
+    for line in output.splitlines():
+        key, separator, value = line.partition(":")
+
+        if separator:
+            values.setdefault(key.strip(), value.strip())
+
+    return values
+
+
+def _parse_float(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value.split()[0])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
+def _split_netsh_interfaces(output: str) -> list[dict[str, str]]:
+    """Splits the output of netsh into the key values of each interface, each of which starts with its name."""
+    interfaces = []
+
+    for line in output.splitlines():
+        key, separator, value = line.partition(":")
+        key = key.strip()
+
+        if not separator:
+            continue
+
+        if key == "Name":
+            interfaces.append({})
+
+        if interfaces:
+            interfaces[-1].setdefault(key, value.strip())
+
+    return interfaces
+
+
+def parse_netsh_interfaces(output: str) -> WifiInfo:
+    """
+    Parses the output of "netsh wlan show interfaces" into the connection of the first connected interface. Relies
+    on the English output, as netsh has no other. Windows 11 reports the BSSID as "AP BSSID".
+    """
+    for values in _split_netsh_interfaces(output):
+        if values.get("State", "").lower() != "connected":
+            continue
+
+        signal = _parse_float(values.get("Signal", "").replace("%", ""))
+        channel = _parse_float(values.get("Channel"))
+        band = values.get("Band", None) or (channel_to_band(int(channel)) if channel else None)
+
+        return WifiInfo(
+            ssid=values.get("SSID", None),
+            signal=int(signal) if signal is not None else 0,
+            bssid=values.get("BSSID", values.get("AP BSSID", None)),
+            band=band,
+            link_rate=_parse_float(values.get("Receive rate (Mbps)"))
+        )
+
+    return WifiInfo()
+
+
+def parse_iw_link(output: str) -> WifiInfo:
+    """Parses the output of "iw dev <interface> link"."""
+    connected = re.search(r"^Connected to ([0-9a-fA-F:]{17})", output, re.MULTILINE)
+
+    if not connected:
+        return WifiInfo()
+
+    values = _parse_key_values(output)
+    signal_dbm = _parse_float(values.get("signal"))
+    frequency = _parse_float(values.get("freq"))
+
+    return WifiInfo(
+        ssid=values.get("SSID", None),
+        signal=dbm_to_signal(signal_dbm) if signal_dbm is not None else 0,
+        bssid=connected.group(1),
+        band=frequency_to_band(frequency) if frequency else None,
+        link_rate=_parse_float(values.get("rx bitrate"))
+    )
+
+
+def parse_proc_net_wireless(output: str) -> dict[str, int]:
+    """Parses /proc/net/wireless into the signal of each wireless interface, from its link quality out of 70."""
+    signals = {}
+
+    for line in output.splitlines()[2:]:
+        interface, separator, stats = line.partition(":")
+        fields = stats.split()
+
+        if separator and len(fields) >= 2:
+            link_quality = _parse_float(fields[1].rstrip("."))
+            signals[interface.strip()] = min(100, int(link_quality * 100 / 70)) if link_quality else 0
+
+    return signals
+
+
+class WifiProvider(ABC):
+    @abstractmethod
+    def query(self) -> WifiInfo:
+        ...
+
+
+class NetshWifiProvider(WifiProvider):
+    """Runs netsh once per query without a shell, for systems where the WLAN API can't be loaded."""
+
+    def query(self) -> WifiInfo:
+        proc = subprocess.run(
+            ["netsh", "wlan", "show", "interfaces"],
+            capture_output=True,
+            timeout=WIFI_COMMAND_TIMEOUT_SECS,
+            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+        )
+        return parse_netsh_interfaces(proc.stdout.decode("utf-8", "replace"))
+
+
+class GUID(ctypes.Structure):
+    _fields_ = [
+        ('Data1', wintypes.DWORD),
+        ('Data2', wintypes.WORD),
+        ('Data3', wintypes.WORD),
+        ('Data4', wintypes.BYTE * 8)
+    ]
+
+
+class WLAN_INTERFACE_INFO(ctypes.Structure):
+    _fields_ = [
+        ('InterfaceGuid', GUID),
+        ('strInterfaceDescription', wintypes.WCHAR * 256),
+        ('isState', wintypes.DWORD)
+    ]
+
+
+class WLAN_INTERFACE_INFO_LIST(ctypes.Structure):
+    _fields_ = [
+        ('dwNumberOfItems', wintypes.DWORD),
+        ('dwIndex', wintypes.DWORD),
+        ('InterfaceInfo', WLAN_INTERFACE_INFO * 1)
+    ]
+
+
+class DOT11_SSID(ctypes.Structure):
+    _fields_ = [
+        ('uSSIDLength', wintypes.ULONG),
+        ('ucSSID', ctypes.c_ubyte * 32)
+    ]
+
+
+class WLAN_ASSOCIATION_ATTRIBUTES(ctypes.Structure):
+    _fields_ = [
+        ('dot11Ssid', DOT11_SSID),
+        ('dot11BssType', wintypes.DWORD),
+        ('dot11Bssid', ctypes.c_ubyte * 6),
+        ('dot11PhyType', wintypes.DWORD),
+        ('uDot11PhyIndex', wintypes.ULONG),
+        ('wlanSignalQuality', wintypes.ULONG),
+        ('ulRxRate', wintypes.ULONG),
+        ('ulTxRate', wintypes.ULONG)
+    ]
+
+
+class WLAN_SECURITY_ATTRIBUTES(ctypes.Structure):
+    _fields_ = [
+        ('bSecurityEnabled', wintypes.BOOL),
+        ('bOneXEnabled', wintypes.BOOL),
+        ('dot11AuthAlgorithm', wintypes.DWORD),
+        ('dot11CipherAlgorithm', wintypes.DWORD)
+    ]
+
+
+class WLAN_CONNECTION_ATTRIBUTES(ctypes.Structure):
+    _fields_ = [
+        ('isState', wintypes.DWORD),
+        ('wlanConnectionMode', wintypes.DWORD),
+        ('strProfileName', wintypes.WCHAR * 256),
+        ('wlanAssociationAttributes', WLAN_ASSOCIATION_ATTRIBUTES),
+        ('wlanSecurityAttributes', WLAN_SECURITY_ATTRIBUTES)
+    ]
+
+
+class WlanApiWifiProvider(WifiProvider):
+    """Queries the connection of the first connected interface through the native WLAN API, without a process."""
+
+    def __init__(self):
+        self._wlanapi = ctypes.windll.wlanapi
+        self._handle = wintypes.HANDLE()
+        negotiated_version = wintypes.DWORD()
+        result = self._wlanapi.WlanOpenHandle(
+            WLAN_CLIENT_VERSION, None, ctypes.byref(negotiated_version), ctypes.byref(self._handle)
+        )
+
+        if result != 0:
+            raise OSError(result, "WlanOpenHandle failed")
+
+    def query(self) -> WifiInfo:
+        interface_list = ctypes.POINTER(WLAN_INTERFACE_INFO_LIST)()
+
+        if self._wlanapi.WlanEnumInterfaces(self._handle, None, ctypes.byref(interface_list)) != 0:
+            return WifiInfo()
+
+        try:
+            num_interfaces = interface_list.contents.dwNumberOfItems
+            interfaces = ctypes.cast(
+                interface_list.contents.InterfaceInfo,
+                ctypes.POINTER(WLAN_INTERFACE_INFO * num_interfaces)
+            ).contents
+
+            for interface in interfaces:
+                if interface.isState == WLAN_INTERFACE_STATE_CONNECTED:
+                    return self._query_interface(interface.InterfaceGuid)
+        finally:
+            self._wlanapi.WlanFreeMemory(interface_list)
+
+        return WifiInfo()
+
+    def _query_interface(self, interface_guid: GUID) -> WifiInfo:
+        connection = self._query_opcode(interface_guid, WLAN_INTF_OPCODE_CURRENT_CONNECTION, WLAN_CONNECTION_ATTRIBUTES)
+        channel = self._query_opcode(interface_guid, WLAN_INTF_OPCODE_CHANNEL_NUMBER, wintypes.ULONG)
+
+        if connection is None:
+            return WifiInfo()
+
+        association = connection.wlanAssociationAttributes
+        ssid = bytes(association.dot11Ssid.ucSSID[:association.dot11Ssid.uSSIDLength]).decode("utf-8", "replace")
+
+        return WifiInfo(
+            ssid=ssid,
+            signal=association.wlanSignalQuality,
+            bssid=":".join(f"{byte:02x}" for byte in association.dot11Bssid),
+            band=channel_to_band(channel.value) if channel is not None else None,
+            # The API reports rates in kbps
+            link_rate=association.ulRxRate / 1000
+        )
+
+    def _query_opcode(self, interface_guid: GUID, opcode: int, data_type):
+        data_size = wintypes.DWORD()
+        data = ctypes.c_void_p()
+        result = self._wlanapi.WlanQueryInterface(
+            self._handle, ctypes.byref(interface_guid), opcode, None, ctypes.byref(data_size), ctypes.byref(data), None
+        )
+
+        if result != 0:
+            return None
+
+        try:
+            # Copied out, as the data is freed below
+            return data_type.from_buffer_copy(ctypes.cast(data, ctypes.POINTER(data_type)).contents)
+        finally:
+            self._wlanapi.WlanFreeMemory(data)
+
+
+class LinuxWifiProvider(WifiProvider):
+    """
+    Finds wireless interfaces in /proc/net/wireless, and reads the connection details of the first connected one
+    from iw when it is installed, trying interfaces by signal. Without iw, only the strongest signal is reported.
+    """
+
+    def __init__(self, wireless_path: str = LINUX_WIRELESS_PATH, use_iw: bool = True):
+        self._wireless_path = wireless_path
+        self._iw_path = shutil.which("iw") if use_iw else None
+
+    def query(self) -> WifiInfo:
+        with open(self._wireless_path) as wireless:
+            signals = parse_proc_net_wireless(wireless.read())
+
+        interfaces = sorted(signals, key=signals.get, reverse=True)
+
+        if not interfaces:
+            return WifiInfo()
+
+        if self._iw_path is None:
+            return WifiInfo(signal=signals[interfaces[0]])
+
+        for interface in interfaces:
+            proc = subprocess.run(
+                [self._iw_path, "dev", interface, "link"],
+                capture_output=True,
+                timeout=WIFI_COMMAND_TIMEOUT_SECS
+            )
+            wifi_info = parse_iw_link(proc.stdout.decode("utf-8", "replace"))
+
+            if wifi_info.is_connected:
+                return wifi_info
+
+        return WifiInfo()
+
+
+class CachedWifiProvider(WifiProvider):
+    """
+    Shares one query between all callers within the TTL, so that several wifi widgets updating on the same tick
+    cost a single query. Concurrent callers wait for the query in flight rather than starting their own.
+    """
+
+    def __init__(self, provider: WifiProvider, ttl_secs: float = WIFI_CACHE_TTL_SECS):
+        self._provider = provider
+        self._ttl_secs = ttl_secs
+        self._lock = threading.Lock()
+        self._wifi_info: Optional[WifiInfo] = None
+        self._queried_at = 0.0
+
+    def query(self) -> WifiInfo:
+        with self._lock:
+            if self._wifi_info is None or time.monotonic() - self._queried_at > self._ttl_secs:
+                self._wifi_info = self._provider.query()
+                self._queried_at = time.monotonic()
+
+            return self._wifi_info
+
+
+def create_wifi_provider() -> WifiProvider:
+    if not hasattr(ctypes, 'windll'):
+        return LinuxWifiProvider()
+
+    try:
+        return WlanApiWifiProvider()
+    except OSError:
+        logging.warning("Failed to open the WLAN API. Falling back to netsh for wifi info.")
+        return NetshWifiProvider()
+
+
+@functools.lru_cache()
+def get_wifi_provider() -> WifiProvider:
+    return CachedWifiProvider(create_wifi_provider())
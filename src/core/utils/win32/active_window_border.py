@@ -22,6 +22,8 @@ BORDER_STYLE = "solid"
 BORDER_COLOUR = "red"
 BORDER_OFFSET = int(BORDER_WIDTH / 2)
 HIDE_ON_MAXIMISE = True
+# Z-order changes arrive in bursts, of which only the latest affects the border
+REORDER_COALESCE_MS = 50
 
 
 class ActiveWindowBorder(QWidget):
@@ -57,7 +59,11 @@ class ActiveWindowBorder(QWidget):
         self._event_service.register_event(WinEvent.EventSystemForeground, self.update_active_border)
         self._event_service.register_event(WinEvent.EventSystemMoveSizeStart, self.hide_active_border)
         self._event_service.register_event(WinEvent.EventSystemMoveSizeEnd, self.update_active_border)
-        self._event_service.register_event(WinEvent.EventObjectReorder, self.update_active_border)
+        self._event_service.register_event(
+            WinEvent.EventObjectReorder,
+            self.update_active_border,
+            coalesce_ms=REORDER_COALESCE_MS
+        )
 
         self.show()
 
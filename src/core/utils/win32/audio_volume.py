@@ -0,0 +1,146 @@
+import functools
+import logging
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+from core.event_enums import VolumeEvent
+from core.event_service import EventService
+
+try:
+    from comtypes import CLSCTX_ALL, COMObject
+    from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume, IAudioEndpointVolumeCallback
+    IMPORT_PYCAW_SUCCESSFUL = True
+except ImportError:
+    IMPORT_PYCAW_SUCCESSFUL = False
+
+
+class VolumeState:
+    def __init__(self, level: float, is_muted: bool):
+        self.level = level
+        self.is_muted = is_muted
+
+    @property
+    def percent(self) -> int:
+        return round(self.level * 100)
+
+    def __eq__(self, other):
+        return isinstance(other, VolumeState) and (self.level, self.is_muted) == (other.level, other.is_muted)
+
+    def __hash__(self):
+        return hash((self.level, self.is_muted))
+
+
+class VolumeProvider(ABC):
+    """
+    Reads the volume of the default audio endpoint. A provider which supports notifications calls the callback
+    passed to start() on every change, from whichever thread the platform delivers them on.
+    """
+    supports_notifications = False
+
+    @abstractmethod
+    def start(self, on_volume_change: Callable[[VolumeState], None]) -> None:
+        ...
+
+    @abstractmethod
+    def get_state(self) -> VolumeState:
+        ...
+
+
+if IMPORT_PYCAW_SUCCESSFUL:
+    class AudioEndpointVolumeCallback(COMObject):
+        _com_interfaces_ = [IAudioEndpointVolumeCallback]
+
+        def __init__(self, on_volume_change: Callable[[VolumeState], None]):
+            super().__init__()
+            self._on_volume_change = on_volume_change
+
+        def OnNotify(self, notification_data):
+            notification = notification_data.contents
+            self._on_volume_change(VolumeState(notification.fMasterVolume, bool(notification.bMuted)))
+
+
+class PycawVolumeProvider(VolumeProvider):
+    """Activates the endpoint volume of the default speakers on start, and registers for its change notifications."""
+    supports_notifications = True
+
+    def __init__(self):
+        self._endpoint_volume = None
+        self._callback = None
+
+    def start(self, on_volume_change: Callable[[VolumeState], None]) -> None:
+        speakers = AudioUtilities.GetSpeakers()
+        interface = speakers.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+        self._endpoint_volume = interface.QueryInterface(IAudioEndpointVolume)
+        # The callback must stay referenced for as long as it is registered
+        self._callback = AudioEndpointVolumeCallback(on_volume_change)
+        self._endpoint_volume.RegisterControlChangeNotify(self._callback)
+
+    def get_state(self) -> VolumeState:
+        return VolumeState(self._endpoint_volume.GetMasterVolumeLevelScalar(), self._endpoint_volume.GetMute() == 1)
+
+
+class FakeVolumeProvider(VolumeProvider):
+    """Reports the volume set on it. Only used when injected, such as by tests, as it would report a made up volume."""
+    supports_notifications = True
+
+    def __init__(self, level: float = 0.5, is_muted: bool = False):
+        self._state = VolumeState(level, is_muted)
+        self._on_volume_change = None
+
+    def start(self, on_volume_change: Callable[[VolumeState], None]) -> None:
+        self._on_volume_change = on_volume_change
+
+    def get_state(self) -> VolumeState:
+        return self._state
+
+    def set_volume(self, level: float, is_muted: bool = False) -> None:
+        self._state = VolumeState(level, is_muted)
+
+        if self._on_volume_change:
+            self._on_volume_change(self._state)
+
+
+def create_volume_provider() -> Optional[VolumeProvider]:
+    if IMPORT_PYCAW_SUCCESSFUL:
+        return PycawVolumeProvider()
+
+    logging.error("Failed to import pycaw. The volume widget is unable to read the volume.")
+    return None
+
+
+@functools.lru_cache()
+class VolumeService:
+    """
+    Starts the volume provider once for all volume widgets, and emits its change notifications as VolumeEvents.
+    Without a provider for the platform, the volume is never known and get_state returns None.
+    """
+
+    def __init__(self, provider: VolumeProvider = None):
+        self.provider = provider or create_volume_provider()
+        self._event_service = EventService()
+        self._is_started = False
+
+    @property
+    def supports_notifications(self) -> bool:
+        return self._is_started and self.provider.supports_notifications
+
+    def start(self) -> bool:
+        if not self._is_started and self.provider is not None:
+            try:
+                self.provider.start(self._on_volume_change)
+                self._is_started = True
+            except Exception:
+                logging.exception(f"Failed to start volume provider {self.provider.__class__.__name__}")
+
+        return self._is_started
+
+    def get_state(self) -> Optional[VolumeState]:
+        if not self.start():
+            return None
+
+        return self.provider.get_state()
+
+    def _on_volume_change(self, state: VolumeState) -> None:
+        try:
+            self._event_service.emit_event(VolumeEvent.VolumeChange, state)
+        except Exception:
+            logging.exception("Failed to emit volume change")
@@ -1,23 +1,52 @@
 import ctypes
 import time
 import logging
-from PyQt6.QtCore import QThread
+from PyQt6.QtCore import QThread, pyqtSlot
 from win32gui import GetForegroundWindow
 from core.utils.win32.windows import WinEventProcType, WinEvent, user32, ole32, msg
+from core.utils.win32.hook_ranges import compute_hook_ranges, CallbackRateCounter
 from core.event_service import EventService
 
+kernel32 = ctypes.windll.kernel32
+
+WM_QUIT = 0x0012
+WM_USER = 0x0400
+WM_REHOOK = 0x8000 + 1  # WM_APP + 1
+PM_NOREMOVE = 0x0000
+
+# Marker constants of WinEvent that delimit event ranges rather than being events
+WIN_EVENT_MARKERS = [
+    WinEvent.EventMin,
+    WinEvent.EventMax,
+    WinEvent.EventSystemEnd,
+    WinEvent.EventObjectEnd,
+    WinEvent.WinEventOutOfContext
+]
+
 
 class SystemEventListener(QThread):
+    """
+    Hooks only the WinEvents which subscribers registered with the EventService, as every hooked event crosses
+    into Python. The hooks are rebuilt on the listener thread, which owns them, whenever subscriptions change.
+    """
 
     def __init__(self):
         super().__init__()
-        self._hook = None
+        self._hooks = []
+        self._hook_ranges = []
+        self._thread_id = None
         self._event_service = EventService()
         self._win_event_process = WinEventProcType(self._event_handler)
+        self._callback_counter = CallbackRateCounter()
+        self._event_service.subscriptions_changed.connect(self._on_subscriptions_changed)
 
     def __str__(self):
         return "Win32 System Event Listener"
 
+    @property
+    def callbacks_per_second(self) -> float:
+        return self._callback_counter.callbacks_per_second
+
     def _event_handler(
         self,
         _win_event_hook,
@@ -28,6 +57,8 @@ class SystemEventListener(QThread):
         _event_thread,
         _event_time
     ) -> None:
+        self._callback_counter.increment()
+
         if event in WinEvent:
             event_type = WinEvent._value2member_map_[event]
             try:
@@ -35,10 +66,16 @@ class SystemEventListener(QThread):
             except Exception:
                 logging.exception(f"Failed to emit event {event_type} for {hwnd}")
 
-    def _build_event_hook(self) -> int:
+    def _get_subscribed_hook_ranges(self) -> list[tuple[int, int]]:
+        return compute_hook_ranges(
+            event_type.value for event_type in self._event_service.registered_event_types()
+            if isinstance(event_type, WinEvent) and event_type not in WIN_EVENT_MARKERS
+        )
+
+    def _build_event_hook(self, event_min: int, event_max: int) -> int:
         return user32.SetWinEventHook(
-            WinEvent.EventMin.value,
-            WinEvent.EventObjectEnd.value,
+            event_min,
+            event_max,
             0,
             self._win_event_process,
             0,
@@ -46,6 +83,35 @@ class SystemEventListener(QThread):
             WinEvent.WinEventOutOfContext.value
         )
 
+    def _build_event_hooks(self, hook_ranges: list[tuple[int, int]]) -> bool:
+        hooks = [self._build_event_hook(event_min, event_max) for event_min, event_max in hook_ranges]
+        self._hooks = [hook for hook in hooks if hook]
+        return len(self._hooks) == len(hooks)
+
+    def _remove_event_hooks(self) -> None:
+        for hook in self._hooks:
+            user32.UnhookWinEvent(hook)
+
+        self._hooks = []
+
+    def _rehook(self) -> None:
+        hook_ranges = self._get_subscribed_hook_ranges()
+
+        if hook_ranges == self._hook_ranges:
+            return
+
+        logging.debug(
+            f"Rehooking WinEvent ranges {[(hex(event_min), hex(event_max)) for event_min, event_max in hook_ranges]} "
+            f"at {self.callbacks_per_second:.1f} callbacks/s"
+        )
+        self._remove_event_hooks()
+
+        if not self._build_event_hooks(hook_ranges):
+            logging.warning("SetWinEventHook failed for some of the subscribed WinEvents")
+
+        self._hook_ranges = hook_ranges
+        self._callback_counter.reset()
+
     def _emit_foreground_window_event(self):
         foreground_event = WinEvent.EventSystemForeground
         foreground_window_hwnd = GetForegroundWindow()
@@ -53,20 +119,53 @@ class SystemEventListener(QThread):
         if foreground_window_hwnd:
             self._event_service.emit_event(foreground_event, foreground_window_hwnd, foreground_event)
 
+    def _post_thread_message(self, message: int) -> bool:
+        thread_id = self._thread_id
+
+        if not thread_id:
+            return False
+
+        if not user32.PostThreadMessageW(thread_id, message, 0, 0):
+            logging.warning(
+                f"Failed to post message {hex(message)} to the WinEvent listener thread: {ctypes.WinError()}"
+            )
+            return False
+
+        return True
+
+    @pyqtSlot()
+    def _on_subscriptions_changed(self) -> None:
+        self._post_thread_message(WM_REHOOK)
+
     def run(self):
-        self._hook = self._build_event_hook()
+        # A thread only gets a message queue once it calls a message function, and posts to a thread without one
+        # fail. Peeking creates the queue before the thread id is published to the posting threads.
+        user32.PeekMessageW(ctypes.byref(msg), 0, WM_USER, WM_USER, PM_NOREMOVE)
+        self._thread_id = kernel32.GetCurrentThreadId()
+        self._hook_ranges = self._get_subscribed_hook_ranges()
 
-        if self._hook == 0:
+        hooks_built = self._build_event_hooks(self._hook_ranges)
+
+        if not hooks_built:
             logging.warning("SetWinEventHook failed. Retrying indefinitely...")
 
-        while self._hook == 0:
+        while not hooks_built:
+            self._remove_event_hooks()
             time.sleep(1)
-            self._hook = self._build_event_hook()
+            self._hook_ranges = self._get_subscribed_hook_ranges()
+            hooks_built = self._build_event_hooks(self._hook_ranges)
 
+        self._callback_counter.reset()
         self._emit_foreground_window_event()
 
-        user32.GetMessageW(ctypes.byref(msg), 0, 0, 0)
+        while user32.GetMessageW(ctypes.byref(msg), 0, 0, 0) > 0:
+            if msg.message == WM_REHOOK:
+                self._rehook()
+
+        logging.debug(f"WinEvent hooks received {self.callbacks_per_second:.1f} callbacks/s")
+        self._remove_event_hooks()
+        self._thread_id = None
 
     def stop(self):
-        user32.UnhookWinEvent(self._hook)
+        self._post_thread_message(WM_QUIT)
         ole32.CoUninitialize()
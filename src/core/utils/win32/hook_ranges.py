@@ -0,0 +1,39 @@
+import time
+from typing import Iterable
+
+
+def compute_hook_ranges(event_ids: Iterable[int], max_gap: int = 0) -> list[tuple[int, int]]:
+    """
+    Returns the fewest inclusive (event_min, event_max) ranges covering the given event ids. Ranges separated by
+    at most max_gap unrequested ids are merged, trading a few unwanted callbacks for one hook fewer.
+    """
+    ranges = []
+
+    for event_id in sorted(set(event_ids)):
+        if ranges and event_id <= ranges[-1][1] + max_gap + 1:
+            ranges[-1] = (ranges[-1][0], event_id)
+        else:
+            ranges.append((event_id, event_id))
+
+    return ranges
+
+
+class CallbackRateCounter:
+    """Counts hook callbacks, so the cost of a set of hook ranges can be compared in callbacks per second."""
+
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self.num_callbacks = 0
+        self._started_at = clock()
+
+    def increment(self) -> None:
+        self.num_callbacks += 1
+
+    def reset(self) -> None:
+        self.num_callbacks = 0
+        self._started_at = self._clock()
+
+    @property
+    def callbacks_per_second(self) -> float:
+        elapsed = self._clock() - self._started_at
+        return self.num_callbacks / elapsed if elapsed > 0 else 0.0
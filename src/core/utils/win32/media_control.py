@@ -1,95 +1,115 @@
+import functools
+import threading
+from collections import OrderedDict
 from enum import Enum
+from typing import Optional
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QImage
-from winsdk.windows.media.control import GlobalSystemMediaTransportControlsSessionManager
-from winsdk.windows.storage.streams import DataReader, Buffer, InputStreamOptions
 
 THUMBNAIL_BUFFER_SIZE = 5 * 1024 * 1024
+THUMBNAIL_CACHE_SIZE = 8
 
 class WindowsMediaRepeat(Enum):
     Off = 0
     Track = 1
     List = 2
 
-async def get_current_session():
-    try:
-        sessions = await GlobalSystemMediaTransportControlsSessionManager.request_async()
-        return sessions.get_current_session()
-    except Exception as e:
-        print(f"Error getting current session: {e}")
-        return None
-
 def props_to_dict(props):
     return {
         attr: props.__getattribute__(attr) for attr in dir(props) if attr[0] != '_'
     }
 
-async def get_media_info():
-    try:
-        current_session = await get_current_session()
-
-        if current_session:
-            media_props = await current_session.try_get_media_properties_async()
-            media_props = props_to_dict(media_props)
-            del media_props['genres']
-            return media_props
-    except Exception as e:
-        print(f"Error getting media info: {e}")
-
-    return {
-        'title': 'No media',
-        'artist': 'Unknown',
-        'album_title': '',
-        'album_artist': '',
-        'album_track_count': 0,
-        'playback_type': 0,
-        'subtitle': '',
-        'thumbnail': None,
-        'track_number': 0
-    }
+DEFAULT_MEDIA_INFO = {
+    'title': 'No media',
+    'artist': 'Unknown',
+    'album_title': '',
+    'album_artist': '',
+    'album_track_count': 0,
+    'playback_type': 0,
+    'subtitle': '',
+    'thumbnail': None,
+    'track_number': 0
+}
 
-async def get_playback_info():
-    try:
-        current_session = await get_current_session()
+DEFAULT_PLAYBACK_INFO = {
+    'auto_repeat_mode': None,
+    'controls': {
+        'is_channel_down_enabled': False,
+        'is_channel_up_enabled': False,
+        'is_fast_forward_enabled': False,
+        'is_next_enabled': False,
+        'is_pause_enabled': False,
+        'is_play_enabled': False,
+        'is_play_pause_toggle_enabled': False,
+        'is_playback_position_enabled': False,
+        'is_playback_rate_enabled': False,
+        'is_previous_enabled': False,
+        'is_record_enabled': False,
+        'is_repeat_enabled': False,
+        'is_rewind_enabled': False,
+        'is_shuffle_enabled': False,
+        'is_stop_enabled': False
+    },
+    'is_shuffle_active': None,
+    'playback_rate': None,
+    'playback_status': 0,
+    'playback_type': 0
+}
 
-        if current_session:
-            playback_props = current_session.get_playback_info()
-            playback_props = props_to_dict(playback_props)
-            playback_props['controls'] = props_to_dict(playback_props['controls'])
-            return playback_props
-    except Exception as e:
-        print(f"Error getting playback info: {e}")
+def media_props_to_dict(media_props) -> dict:
+    media_info = props_to_dict(media_props)
+    del media_info['genres']
+    return media_info
 
-    return {
-        'auto_repeat_mode': None,
-        'controls': {
-            'is_channel_down_enabled': False,
-            'is_channel_up_enabled': False,
-            'is_fast_forward_enabled': False,
-            'is_next_enabled': False,
-            'is_pause_enabled': False,
-            'is_play_enabled': False,
-            'is_play_pause_toggle_enabled': False,
-            'is_playback_position_enabled': False,
-            'is_playback_rate_enabled': False,
-            'is_previous_enabled': False,
-            'is_record_enabled': False,
-            'is_repeat_enabled': False,
-            'is_rewind_enabled': False,
-            'is_shuffle_enabled': False,
-            'is_stop_enabled': False
-        },
-        'is_shuffle_active': None,
-        'playback_rate': None,
-        'playback_status': 0,
-        'playback_type': 0
-    }
+def playback_props_to_dict(playback_props) -> dict:
+    playback_info = props_to_dict(playback_props)
+    playback_info['controls'] = props_to_dict(playback_info['controls'])
+    return playback_info
 
-async def stream_to_image(thumbnail_ref) -> QImage:
-    buffer = Buffer(THUMBNAIL_BUFFER_SIZE)
+async def read_thumbnail(thumbnail_ref) -> bytes:
+    from winsdk.windows.storage.streams import Buffer, InputStreamOptions
     readable_stream = await thumbnail_ref.open_read_async()
+    # Streams of unknown size report 0, for which the read is capped at THUMBNAIL_BUFFER_SIZE
+    buffer = Buffer(min(readable_stream.size, THUMBNAIL_BUFFER_SIZE) or THUMBNAIL_BUFFER_SIZE)
     await readable_stream.read_async(buffer, buffer.capacity, InputStreamOptions.READ_AHEAD)
-    buffer_reader = DataReader.from_buffer(buffer)
-    thumbnail_buffer = buffer_reader.read_bytes(buffer.length)
+    # The buffer exposes its bytes through the buffer protocol, so they are copied once without a list of ints
+    return bytes(memoryview(buffer)[:buffer.length])
+
+def decode_thumbnail(thumbnail_data: bytes, size: int, aspect_ratio_mode: Qt.AspectRatioMode) -> tuple[QImage, QImage]:
+    """Returns the full size thumbnail and the thumbnail scaled to size. QImage is safe to use off the GUI thread."""
     thumbnail_image = QImage()
-    thumbnail_image.loadFromData(bytearray(thumbnail_buffer))
-    return thumbnail_image
+    thumbnail_image.loadFromData(thumbnail_data)
+    scaled_image = thumbnail_image.scaled(size, size, aspect_ratio_mode, Qt.TransformationMode.SmoothTransformation)
+    return thumbnail_image, scaled_image
+
+@functools.lru_cache()
+class ThumbnailCache:
+    """
+    A least recently used cache of decoded thumbnails, keyed by track and target size, so that returning to a
+    recent track needs no read or decode. Shared by the media widgets of all bars.
+    """
+
+    def __init__(self, max_size: int = THUMBNAIL_CACHE_SIZE):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, tuple[QImage, QImage]] = OrderedDict()
+
+    def get(self, track_key: tuple, target_size: tuple) -> Optional[tuple[QImage, QImage]]:
+        with self._lock:
+            thumbnail = self._entries.get((track_key, target_size), None)
+
+            if thumbnail:
+                self._entries.move_to_end((track_key, target_size))
+
+            return thumbnail
+
+    def put(self, track_key: tuple, target_size: tuple, thumbnail: tuple[QImage, QImage]) -> None:
+        with self._lock:
+            self._entries[(track_key, target_size)] = thumbnail
+            self._entries.move_to_end((track_key, target_size))
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+def get_track_key(media_info: dict) -> tuple:
+    return media_info.get('title'), media_info.get('artist'), media_info.get('album_title')
@@ -0,0 +1,318 @@
+import asyncio
+import functools
+import logging
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from typing import Any, Callable, Coroutine, Optional
+from PyQt6.QtCore import QObject, pyqtSignal
+from core.utils.win32.media_control import (
+    DEFAULT_MEDIA_INFO,
+    DEFAULT_PLAYBACK_INFO,
+    media_props_to_dict,
+    playback_props_to_dict
+)
+
+try:
+    from winsdk.windows.media.control import GlobalSystemMediaTransportControlsSessionManager
+except ImportError:
+    GlobalSystemMediaTransportControlsSessionManager = None
+
+MEDIA_ACTIONS = ["prev", "next", "shuffle", "play_pause", "repeat"]
+
+
+class MediaSessionState:
+    """The media properties and playback info of the current media session. Never mutated once created."""
+
+    def __init__(self, media_info: dict, playback_info: dict, has_session: bool):
+        self.media_info = media_info
+        self.playback_info = playback_info
+        self.has_session = has_session
+
+
+class MediaSessionListener(ABC):
+    @abstractmethod
+    def on_media_properties(self, media_info: Optional[dict]) -> None:
+        ...
+
+    @abstractmethod
+    def on_playback_info(self, playback_info: Optional[dict]) -> None:
+        ...
+
+
+class MediaSessionProvider(ABC):
+    """
+    A source of media session changes. All of its coroutines run on the media session service's loop, and it
+    reports changes to the listener from that loop, passing None once there is no current session.
+    """
+
+    @abstractmethod
+    async def start(self, listener: MediaSessionListener) -> None:
+        ...
+
+    @abstractmethod
+    async def stop(self) -> None:
+        ...
+
+    @abstractmethod
+    async def send_action(self, action: str, *args: Any) -> bool:
+        """Sends a playback action to the current session. Returns False if there is no current session."""
+
+
+class WinsdkMediaSessionProvider(MediaSessionProvider):
+    """
+    Holds the system media transport controls session manager for the lifetime of the service, and subscribes
+    to the change events of the current session rather than polling it.
+    """
+
+    def __init__(self):
+        self._loop = None
+        self._listener = None
+        self._manager = None
+        self._session = None
+        self._manager_token = None
+        self._session_tokens = []
+
+    async def start(self, listener: MediaSessionListener) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._listener = listener
+        self._manager = await GlobalSystemMediaTransportControlsSessionManager.request_async()
+        self._manager_token = self._manager.add_current_session_changed(
+            lambda _manager, _args: self._call_soon(self._attach_current_session)
+        )
+        await self._attach_current_session()
+
+    async def stop(self) -> None:
+        self._detach_session()
+
+        if self._manager and self._manager_token:
+            self._manager.remove_current_session_changed(self._manager_token)
+
+        self._manager = None
+        self._manager_token = None
+
+    async def send_action(self, action: str, *args: Any) -> bool:
+        if self._session is None:
+            return False
+
+        callbacks = {
+            "prev": self._session.try_skip_previous_async,
+            "next": self._session.try_skip_next_async,
+            "shuffle": self._session.try_change_shuffle_active_async,
+            "play_pause": self._session.try_toggle_play_pause_async,
+            "repeat": self._session.try_change_auto_repeat_mode_async
+        }
+
+        await callbacks[action](*args)
+        return True
+
+    def _call_soon(self, callback: Callable[[], Coroutine]) -> None:
+        # WinRT raises events on its own threads, so handling is moved onto the service loop
+        self._loop.call_soon_threadsafe(lambda: self._loop.create_task(callback()))
+
+    async def _attach_current_session(self) -> None:
+        self._detach_session()
+        self._session = self._manager.get_current_session()
+
+        if self._session is None:
+            self._listener.on_media_properties(None)
+            self._listener.on_playback_info(None)
+            return
+
+        self._session_tokens = [
+            (
+                self._session.remove_media_properties_changed,
+                self._session.add_media_properties_changed(
+                    lambda _session, _args: self._call_soon(self._refresh_media_properties)
+                )
+            ),
+            (
+                self._session.remove_playback_info_changed,
+                self._session.add_playback_info_changed(
+                    lambda _session, _args: self._call_soon(self._refresh_playback_info)
+                )
+            )
+        ]
+        await self._refresh_media_properties()
+        await self._refresh_playback_info()
+
+    def _detach_session(self) -> None:
+        for remove_handler, token in self._session_tokens:
+            try:
+                remove_handler(token)
+            except OSError:
+                logging.debug("Failed to remove media session event handler")
+
+        self._session_tokens = []
+        self._session = None
+
+    async def _refresh_media_properties(self) -> None:
+        session = self._session
+
+        if session is None:
+            return
+
+        try:
+            media_props = await session.try_get_media_properties_async()
+            # The session may have changed while the properties were requested
+            if session is self._session:
+                self._listener.on_media_properties(media_props_to_dict(media_props))
+        except OSError:
+            logging.exception("Failed to get media properties")
+
+    async def _refresh_playback_info(self) -> None:
+        if self._session is None:
+            return
+
+        try:
+            self._listener.on_playback_info(playback_props_to_dict(self._session.get_playback_info()))
+        except OSError:
+            logging.exception("Failed to get media playback info")
+
+
+class FakeMediaSessionProvider(MediaSessionProvider):
+    """Reports the media properties and playback info pushed to it, for systems without media transport controls."""
+
+    def __init__(self):
+        self._loop = None
+        self._listener = None
+        self.actions = []
+
+    async def start(self, listener: MediaSessionListener) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._listener = listener
+
+    async def stop(self) -> None:
+        self._listener = None
+
+    async def send_action(self, action: str, *args: Any) -> bool:
+        self.actions.append((action, *args))
+        return True
+
+    def push(self, media_info: Optional[dict], playback_info: Optional[dict]) -> None:
+        """Reports a change from any thread, as a session's change events would."""
+        self._loop.call_soon_threadsafe(self._report, media_info, playback_info)
+
+    def _report(self, media_info: Optional[dict], playback_info: Optional[dict]) -> None:
+        if self._listener:
+            self._listener.on_media_properties(media_info)
+            self._listener.on_playback_info(playback_info)
+
+
+def create_media_session_provider() -> MediaSessionProvider:
+    if GlobalSystemMediaTransportControlsSessionManager is not None:
+        return WinsdkMediaSessionProvider()
+
+    return FakeMediaSessionProvider()
+
+
+@functools.lru_cache()
+# Registered rather than subclassed, as the ABC metaclass conflicts with that of QObject
+@MediaSessionListener.register
+class MediaSessionService(QObject):
+    """
+    Runs one asyncio loop on a background thread for the lifetime of the app, on which the media session provider
+    holds the session manager and reports changes. Each change is pushed to widgets as a new MediaSessionState.
+    """
+    session_changed = pyqtSignal(MediaSessionState)
+
+    def __init__(self, provider: MediaSessionProvider = None):
+        super().__init__()
+        self._provider = provider or create_media_session_provider()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.state = MediaSessionState(DEFAULT_MEDIA_INFO, DEFAULT_PLAYBACK_INFO, has_session=False)
+
+    @property
+    def provider(self) -> MediaSessionProvider:
+        return self._provider
+
+    def start(self) -> None:
+        with self._start_lock:
+            if self._thread is not None:
+                return
+
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._run_loop, name="MediaSessionService", daemon=True)
+            self._thread.start()
+
+        self.run_coroutine(self._start_provider())
+
+    def stop(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                return
+
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+
+        asyncio.run_coroutine_threadsafe(self._provider.stop(), loop).add_done_callback(
+            lambda _future: loop.call_soon_threadsafe(loop.stop)
+        )
+        thread.join(timeout=1)
+
+    def run_coroutine(self, coroutine: Coroutine) -> Future:
+        """
+        Schedules a coroutine on the service loop. Returns a future which may be waited on from other threads, and
+        which fails right away if the service is not running.
+        """
+        loop = self._loop
+
+        if loop is None:
+            coroutine.close()
+            future = Future()
+            future.set_exception(RuntimeError("The media session service is not running"))
+            return future
+
+        return asyncio.run_coroutine_threadsafe(coroutine, loop)
+
+    def send_action(self, action: str, *args: Any) -> Future:
+        if action not in MEDIA_ACTIONS:
+            raise ValueError(f"Unknown media action '{action}'")
+
+        future = self.run_coroutine(self._provider.send_action(action, *args))
+        future.add_done_callback(functools.partial(self._on_action_done, action))
+        return future
+
+    def on_media_properties(self, media_info: Optional[dict]) -> None:
+        self._set_state(
+            media_info if media_info is not None else DEFAULT_MEDIA_INFO,
+            self.state.playback_info if media_info is not None else DEFAULT_PLAYBACK_INFO,
+            has_session=media_info is not None
+        )
+
+    def on_playback_info(self, playback_info: Optional[dict]) -> None:
+        self._set_state(
+            self.state.media_info if playback_info is not None else DEFAULT_MEDIA_INFO,
+            playback_info if playback_info is not None else DEFAULT_PLAYBACK_INFO,
+            has_session=playback_info is not None
+        )
+
+    def _set_state(self, media_info: dict, playback_info: dict, has_session: bool) -> None:
+        self.state = MediaSessionState(media_info, playback_info, has_session)
+        # Emitted from the loop thread, so widgets on the GUI thread receive it through a queued connection
+        self.session_changed.emit(self.state)
+
+    @staticmethod
+    def _on_action_done(action: str, future: Future) -> None:
+        if future.exception():
+            logging.error(f"Failed to send media action '{action}': {future.exception()}")
+        elif not future.result():
+            logging.warning(f"No active media session. Cannot perform the action '{action}'.")
+
+    def _run_loop(self) -> None:
+        loop = self._loop
+        asyncio.set_event_loop(loop)
+
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    async def _start_provider(self) -> None:
+        try:
+            await self._provider.start(self)
+        except Exception:
+            logging.exception(f"Failed to start media session provider {self._provider.__class__.__name__}")
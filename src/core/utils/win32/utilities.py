@@ -6,6 +6,7 @@ from win32process import GetWindowThreadProcessId
 from win32gui import GetWindowText, GetClassName, GetWindowRect, GetWindowPlacement
 from win32api import MonitorFromWindow, GetMonitorInfo
 from contextlib import suppress
+from core.utils.process_cache import ProcessCache
 
 from ctypes import wintypes
 
@@ -40,18 +41,18 @@ def get_monitor_info(monitor_hwnd: int) -> dict:
 
 
 def get_process_info(hwnd: int) -> dict:
-    process_id = GetWindowThreadProcessId(hwnd)
-    process = psutil.Process(process_id[-1])
-    return {
-        'name': process.name(),
-        'pid': process.pid,
-        'ppid': process.ppid(),
-        'cpu_percent': process.cpu_percent(),
-        'mem_percent': process.memory_percent(),
-        'num_threads': process.num_threads(),
-        'username': process.username(),
-        'status': process.status()
-    }
+    process_id = GetWindowThreadProcessId(hwnd)[-1]
+    process_info = ProcessCache().get(process_id)
+
+    if process_info is None:
+        raise psutil.NoSuchProcess(process_id)
+
+    try:
+        return process_info.to_dict()
+    except psutil.NoSuchProcess:
+        # Exited since it was last validated
+        ProcessCache().invalidate(process_id)
+        raise
 
 
 def get_window_extended_frame_bounds(hwnd: int) -> dict:
@@ -112,8 +113,29 @@ def get_executable_name(hwnd) -> str:
     try:
         pid = wintypes.DWORD()
         ctypes.windll.user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
-        process = psutil.Process(pid.value)
-        return process.name()
+        process_info = ProcessCache().get(pid.value)
+
+        if process_info is None:
+            raise psutil.NoSuchProcess(pid.value)
+
+        return process_info.name
     except Exception as e:
         logging.error(f"Error retrieving executable name: {e}")
-        return "N/A"
\ No newline at end of file
+        return "N/A"
+
+class LASTINPUTINFO(ctypes.Structure):
+    _fields_ = [
+        ('cbSize', wintypes.UINT),
+        ('dwTime', wintypes.DWORD)
+    ]
+
+
+def get_idle_duration_ms() -> int:
+    last_input_info = LASTINPUTINFO()
+    last_input_info.cbSize = ctypes.sizeof(LASTINPUTINFO)
+
+    if not ctypes.windll.user32.GetLastInputInfo(ctypes.byref(last_input_info)):
+        return 0
+
+    # Both tick counts are 32-bit and wrap around after ~49.7 days
+    return (ctypes.windll.kernel32.GetTickCount() - last_input_info.dwTime) & 0xFFFFFFFF
@@ -0,0 +1,51 @@
+import functools
+import logging
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from typing import Any, Callable
+
+WORKER_POOL_MAX_THREADS = 4
+
+
+@functools.lru_cache()
+def get_worker_pool() -> QThreadPool:
+    worker_pool = QThreadPool()
+    worker_pool.setMaxThreadCount(WORKER_POOL_MAX_THREADS)
+    return worker_pool
+
+
+class WorkerSignals(QObject):
+    result = pyqtSignal(str, object)
+    error = pyqtSignal(str)
+    finished = pyqtSignal(str)
+
+
+class Worker(QRunnable):
+    """
+    Runs a blocking function on the shared worker pool. The signals object is created on the calling
+    thread, so slots of objects living on the GUI thread receive the result through a queued connection.
+    """
+
+    def __init__(self, name: str, fn: Callable[..., Any], *args: Any):
+        super().__init__()
+        self.name = name
+        self.signals = WorkerSignals()
+        self._fn = fn
+        self._args = args
+        self.setAutoDelete(False)
+
+    def run(self):
+        try:
+            result = self._fn(*self._args)
+        except Exception:
+            logging.exception(f"Worker '{self.name}' failed to execute {self._fn}")
+            self._try_emit(self.signals.error, self.name)
+        else:
+            self._try_emit(self.signals.result, self.name, result)
+        finally:
+            self._try_emit(self.signals.finished, self.name)
+
+    def _try_emit(self, signal: pyqtSignal, *args: Any):
+        try:
+            signal.emit(*args)
+        except RuntimeError:
+            logging.debug(f"Worker '{self.name}' finished after its receiver was deleted")
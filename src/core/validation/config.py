@@ -9,6 +9,30 @@ CONFIG_SCHEMA = {
         'type': 'boolean',
         'default': True,
     },
+    'idle_throttle': {
+        'type': 'dict',
+        'schema': {
+            'enabled': {
+                'type': 'boolean',
+                'default': True
+            },
+            'idle_timeout': {
+                'type': 'integer',
+                'min': 1,
+                'default': 300
+            },
+            'interval_multiplier': {
+                'type': 'integer',
+                'min': 1,
+                'default': 4
+            }
+        },
+        'default': {
+            'enabled': True,
+            'idle_timeout': 300,
+            'interval_multiplier': 4
+        }
+    },
     'bars': {
         'type': 'dict',
         'keysrules': {
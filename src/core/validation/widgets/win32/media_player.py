@@ -1,7 +1,6 @@
 DEFAULTS = {
     'label': "{media[title]} - {media[artist]}",
     'label_alt': "{media[title]} - {media[artist]}",
-    'update_interval': 1000,
     'keep_thumbnail_aspect_ratio': False,
     'layout': ["thumbnail", "label", "close"],
     'icons': {
@@ -26,9 +25,9 @@ VALIDATION_SCHEMA = {
         'type': 'string',
         'default': DEFAULTS['label_alt']
     },
+    # Deprecated: media session changes are pushed to the widget, so it is never polled
     'update_interval': {
         'type': 'integer',
-        'default': DEFAULTS['update_interval'],
         'min': 0
     },
     'keep_thumbnail_aspect_ratio': {
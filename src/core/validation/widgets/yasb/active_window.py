@@ -5,6 +5,7 @@ DEFAULTS = {
     'max_length': None,
     'max_length_ellipsis': '...',
     'monitor_exclusive': True,
+    'update_interval': 5000,
     'ignore_windows': {
         'classes': [],
         'processes': [],
@@ -46,6 +47,11 @@ VALIDATION_SCHEMA = {
         'required': False,
         'default': DEFAULTS['monitor_exclusive']
     },
+    'update_interval': {
+        'type': 'integer',
+        'min': 0,
+        'default': DEFAULTS['update_interval']
+    },
     'ignore_window': {
         'type': 'dict',
         'schema': {
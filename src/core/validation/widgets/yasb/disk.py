@@ -2,6 +2,8 @@ DEFAULTS = {
     'label': "{volume_label} {space[used][percent]:.1f}%",
     'label_alt': "{volume_label} {space[used][gb]:.1f}GB / {space[total][gb]:.1f}GB",
     'volume_label': "C",
+    'volume_labels': None,
+    'volume_separator': " ",
     'update_interval': 1000,
     'callbacks': {
         'on_left': 'toggle_label',
@@ -23,6 +25,18 @@ VALIDATION_SCHEMA = {
         'type': 'string',
         'default': DEFAULTS['volume_label']
     },
+    'volume_labels': {
+        'type': 'list',
+        'schema': {
+            'type': 'string'
+        },
+        'nullable': True,
+        'default': DEFAULTS['volume_labels']
+    },
+    'volume_separator': {
+        'type': 'string',
+        'default': DEFAULTS['volume_separator']
+    },
     'update_interval': {
         'type': 'integer',
         'default': DEFAULTS['update_interval'],
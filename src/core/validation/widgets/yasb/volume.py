@@ -1,7 +1,7 @@
 DEFAULTS = {
     'label': "VOL {volume[percent]}%",
     'label_alt': "VOL {volume[percent]}%",
-    'update_interval': 1000,
+    'update_interval': 5000,
     'callbacks': {
         'on_left': 'toggle_label',
         'on_middle': 'do_nothing',
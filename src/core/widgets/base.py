@@ -1,9 +1,16 @@
 import logging
 import subprocess
-from PyQt6.QtWidgets import QWidget, QHBoxLayout, QFrame
-from PyQt6.QtGui import QMouseEvent
-from PyQt6.QtCore import QTimer, QThread, Qt
-from typing import Union
+import functools
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QFrame, QLabel, QAbstractButton
+from PyQt6.QtGui import QMouseEvent, QEnterEvent, QShowEvent, QHideEvent
+from PyQt6.QtCore import QThread, Qt, pyqtBoundSignal, pyqtSlot
+from typing import Any, Callable, Optional, Union
+from core.utils.worker_pool import Worker, get_worker_pool
+from core.utils.timer_wheel import TimerEntry, TimerWheel
+from core.utils.idle_monitor import IdleMonitor
+from core.metrics_service import SystemMetricsService, SystemMetric
+from core.event_enums import Event
+from core.event_service import EventService
 
 
 class BaseWidget(QWidget):
@@ -21,13 +28,19 @@ class BaseWidget(QWidget):
         self.widget_layout = QHBoxLayout()
         self.timer_interval = timer_interval
         self.bar_id = None
+        self.widget_name = None
+        self.elided_label_updates = 0
 
         if class_name:
             self._widget_frame.setProperty("class", f"widget {class_name}")
         else:
             self._widget_frame.setProperty("class", "widget")
 
-        self.timer = QTimer(self)
+        self._timer_entry: Optional[TimerEntry] = None
+        self._metric_subscriptions: list[tuple[SystemMetric, pyqtBoundSignal]] = []
+        self._event_subscriptions: list[tuple[Event, pyqtBoundSignal]] = []
+        self._pending_workers: dict[str, Worker] = {}
+        self._worker_result_callbacks: dict[str, Callable[[Any], None]] = {}
         self.mousePressEvent = self._handle_mouse_events
 
         self.widget_layout.setSpacing(0)
@@ -56,10 +69,106 @@ class BaseWidget(QWidget):
 
     def start_timer(self):
         if self.timer_interval and self.timer_interval > 0:
-            self.timer.timeout.connect(self._timer_callback)
-            self.timer.start(self.timer_interval)
+            timer_wheel = TimerWheel()
+            self._timer_entry = timer_wheel.register(self, self._timer_callback, self.timer_interval)
+            self.destroyed.connect(functools.partial(timer_wheel.unregister, self._timer_entry))
         self._timer_callback()
 
+    def subscribe_metric(self, metric: SystemMetric, interval: int, metric_signal: pyqtBoundSignal):
+        """Subscribes to a system metric for as long as the widget is shown. While hidden, no samples are sent."""
+        self._metric_subscriptions.append((metric, metric_signal))
+        SystemMetricsService().subscribe(metric, interval, metric_signal)
+
+    def register_event(self, event_type: Event, event_signal: pyqtBoundSignal, **kwargs):
+        """Registers a signal for an event with the event service until the widget is torn down."""
+        self._event_subscriptions.append((event_type, event_signal))
+        EventService().register_event(event_type, event_signal, **kwargs)
+
+    def teardown(self):
+        """
+        Drops the widget's metric and event subscriptions. Called by the bar before deleting a widget it no longer
+        shows, as the services would otherwise keep emitting to the signals of a deleted widget.
+        """
+        for metric, metric_signal in self._metric_subscriptions:
+            SystemMetricsService().unsubscribe(metric, metric_signal)
+
+        for event_type, event_signal in self._event_subscriptions:
+            EventService().unregister_event(event_type, event_signal)
+
+        self._metric_subscriptions.clear()
+        self._event_subscriptions.clear()
+
+    def showEvent(self, event: QShowEvent):
+        super().showEvent(event)
+
+        if self._timer_entry:
+            TimerWheel().resume(self._timer_entry)
+
+        for metric, metric_signal in self._metric_subscriptions:
+            SystemMetricsService().resume(metric, metric_signal)
+
+    def hideEvent(self, event: QHideEvent):
+        super().hideEvent(event)
+
+        if self._timer_entry:
+            TimerWheel().pause(self._timer_entry)
+
+        for metric, metric_signal in self._metric_subscriptions:
+            SystemMetricsService().pause(metric, metric_signal)
+
+    def enterEvent(self, event: QEnterEvent):
+        super().enterEvent(event)
+        IdleMonitor().notify_activity()
+
+    def set_label_text(self, label: Union[QLabel, QAbstractButton], text: str) -> None:
+        """Sets the text of a label, skipping the relayout and repaint if it already shows that text."""
+        if label.text() == text:
+            self.elided_label_updates += 1
+            return
+
+        label.setText(text)
+
+    def set_label_class(self, label: Union[QLabel, QAbstractButton], class_name: str) -> None:
+        """Sets the class property of a label and re-polishes its stylesheet only if the class changed."""
+        if label.property("class") == class_name:
+            self.elided_label_updates += 1
+            return
+
+        label.setProperty("class", class_name)
+        label.setStyleSheet('')
+
+    def run_in_worker(self, worker_name: str, fn: Callable[[], Any], result_callback: Callable[[Any], None]) -> bool:
+        """
+        Runs a blocking data fetch on the shared worker pool and passes its result to result_callback on the
+        GUI thread. Returns False if a fetch with the same name is still in flight, so slow fetches never stack.
+        """
+        if worker_name in self._pending_workers:
+            logging.debug(f"Skipping worker '{worker_name}' for {self.__class__.__name__}: previous run in flight")
+            return False
+
+        worker = Worker(worker_name, fn)
+        worker.signals.result.connect(self._on_worker_result)
+        worker.signals.finished.connect(self._on_worker_finished)
+        self._pending_workers[worker_name] = worker
+        self._worker_result_callbacks[worker_name] = result_callback
+        get_worker_pool().start(worker)
+        return True
+
+    @pyqtSlot(str, object)
+    def _on_worker_result(self, worker_name: str, result: Any):
+        result_callback = self._worker_result_callbacks.get(worker_name, None)
+
+        if result_callback:
+            try:
+                result_callback(result)
+            except Exception:
+                logging.exception(f"Failed to handle result of worker '{worker_name}'")
+
+    @pyqtSlot(str)
+    def _on_worker_finished(self, worker_name: str):
+        self._pending_workers.pop(worker_name, None)
+        self._worker_result_callbacks.pop(worker_name, None)
+
     def _handle_mouse_events(self, event: QMouseEvent):
         if event.button() == Qt.MouseButton.LeftButton:
             self._run_callback(self.callback_left)
@@ -3,10 +3,11 @@ from collections import deque
 from PyQt6.QtWidgets import QWidget, QLabel
 from PyQt6.QtCore import pyqtSignal
 from core.utils.win32.utilities import get_monitor_hwnd
-from core.event_service import EventService
 from core.event_enums import KomorebiEvent
 from core.widgets.base import BaseWidget
 from core.utils.komorebi.client import KomorebiClient
+from core.utils.komorebi.state_store import KomorebiStateStore, KomorebiSnapshot, KomorebiChange, KomorebiChangeType
+from core.utils.label_template import LabelTemplate
 from core.validation.widgets.komorebi.active_layout import VALIDATION_SCHEMA
 
 try:
@@ -37,24 +38,24 @@ layout_snake_case = {
 class ActiveLayoutWidget(BaseWidget):
     k_signal_connect = pyqtSignal(dict)
     k_signal_disconnect = pyqtSignal()
-    k_signal_layout_change = pyqtSignal(dict, dict)
+    k_signal_state_change = pyqtSignal(list, object)
 
     validation_schema = VALIDATION_SCHEMA
     event_listener = KomorebiEventListener
 
     def __init__(self, label: str, layout_icons: dict[str, str], hide_if_offline: bool, callbacks: dict[str, str]):
         super().__init__(class_name="komorebi-active-layout")
-        self._label = label
+        self._label = LabelTemplate(label, ['icon', 'layout_name'])
         self._layout_icons = layout_icons
         self._layouts = deque([
             'bsp', 'columns', 'rows', 'vertical-stack', 'horizontal-stack', 'ultrawide-vertical-stack'
         ])
         self._hide_if_offline = hide_if_offline
-        self._event_service = EventService()
         self._komorebic = KomorebiClient()
+        self._screen_hwnd = None
+        self._komorebi_snapshot = None
         self._komorebi_screen = None
-        self._komorebi_workspaces = []
-        self._focused_workspace = {}
+        self._focused_workspace = None
 
         self._active_layout_text = QLabel()
         self._active_layout_text.setProperty("class", "label")
@@ -88,46 +89,58 @@ class ActiveLayoutWidget(BaseWidget):
             self._komorebic.change_layout(self._layouts[0])
 
     def _is_shift_layout_allowed(self):
-        return not bool(
-            not self._focused_workspace.get('tile', False) or
-            self._focused_workspace.get('monocle_container', None) or
-            self._focused_workspace.get('maximized_window', None) or
-            self._komorebi_state.get('is_paused', False)
+        return bool(
+            self._focused_workspace and
+            self._focused_workspace.tile and
+            not self._focused_workspace.monocle and
+            not self._focused_workspace.maximised and
+            not self._komorebi_snapshot.is_paused
         )
 
     def _register_signals_and_events(self):
-        active_layout_change_event_watchlist = [
-            KomorebiEvent.ChangeLayout,
-            KomorebiEvent.TogglePause,
-            KomorebiEvent.ToggleTiling,
-            KomorebiEvent.ToggleMonocle,
-            KomorebiEvent.ToggleMaximise
-        ]
-
         self.k_signal_connect.connect(self._on_komorebi_connect_event)
         self.k_signal_disconnect.connect(self._on_komorebi_disconnect_event)
-        self.k_signal_layout_change.connect(self._on_komorebi_layout_change_event)
-
-        self._event_service.register_event(KomorebiEvent.KomorebiConnect,  self.k_signal_connect)
-        self._event_service.register_event(KomorebiEvent.KomorebiDisconnect, self.k_signal_disconnect)
-
-        for event_type in active_layout_change_event_watchlist:
-            self._event_service.register_event(event_type, self.k_signal_layout_change)
+        self.k_signal_state_change.connect(self._on_komorebi_state_change_event)
+
+        self.register_event(KomorebiEvent.KomorebiConnect,  self.k_signal_connect)
+        self.register_event(KomorebiEvent.KomorebiDisconnect, self.k_signal_disconnect)
+        self.register_event(
+            KomorebiEvent.KomorebiStateChange,
+            self.k_signal_state_change,
+            event_filter=self._is_screen_state_change
+        )
 
-    def _on_komorebi_connect_event(self, state: dict) -> None:
-        self._update_active_layout(state, is_connect_event=True)
+    def _is_screen_state_change(self, changes: list[KomorebiChange], _snapshot: KomorebiSnapshot) -> bool:
+        # Called on the listener thread, skipping changes to other monitors before they reach the GUI thread
+        komorebi_screen = self._komorebi_screen
+        return komorebi_screen is None or any(change.monitor_id in (None, komorebi_screen.id) for change in changes)
+
+    def _on_komorebi_connect_event(self, _state: dict) -> None:
+        self._update_active_layout(KomorebiStateStore().snapshot, is_connect_event=True)
+
+    def _on_komorebi_state_change_event(self, changes: list[KomorebiChange], snapshot: KomorebiSnapshot) -> None:
+        screen_id = self._komorebi_screen.id if self._komorebi_screen else None
+        layout_changed = any(
+            change.change_type == KomorebiChangeType.PauseToggled or (
+                change.monitor_id == screen_id and change.change_type in (
+                    KomorebiChangeType.MonitorAdded,
+                    KomorebiChangeType.WorkspaceFocused,
+                    KomorebiChangeType.WorkspaceLayoutChanged
+                )
+            ) for change in changes
+        )
 
-    def _on_komorebi_layout_change_event(self, _event: dict, state: dict) -> None:
-        self._update_active_layout(state)
+        if layout_changed or not self._komorebi_screen:
+            self._update_active_layout(snapshot)
 
     def _on_komorebi_disconnect_event(self) -> None:
         if self._hide_if_offline:
             self._active_layout_text.hide()
 
-    def _update_active_layout(self, state: dict, is_connect_event=False):
+    def _update_active_layout(self, snapshot: KomorebiSnapshot, is_connect_event=False):
         try:
-            if self._update_komorebi_state(state):
-                self._focused_workspace = self._komorebic.get_focused_workspace(self._komorebi_screen)
+            if self._update_komorebi_screen(snapshot):
+                self._focused_workspace = self._komorebi_screen.focused_workspace
 
                 if not self._focused_workspace:
                     return
@@ -135,14 +148,14 @@ class ActiveLayoutWidget(BaseWidget):
                 layout_name, layout_icon = self._get_layout_label_info()
 
                 if is_connect_event:
-                    conn_layout_name = self._focused_workspace['layout']['Default']
-                    conn_layout_cmd = layout_cmds.get(conn_layout_name, 'bsp')
+                    conn_layout_cmd = layout_cmds.get(self._focused_workspace.layout, 'bsp')
 
                     while self._layouts[0] != conn_layout_cmd:
                         self._layouts.rotate(1)
 
-                self._active_layout_text.setText(
-                    self._label.replace("{icon}", layout_icon).replace("{layout_name}", layout_name)
+                self.set_label_text(
+                    self._active_layout_text,
+                    self._label.render({'icon': layout_icon, 'layout_name': layout_name})
                 )
 
                 if self._active_layout_text.isHidden():
@@ -151,32 +164,37 @@ class ActiveLayoutWidget(BaseWidget):
             logging.exception("Failed to update komorebi status and widget button state")
 
     def _get_layout_label_info(self):
-        if self._komorebi_state.get('is_paused', False):
+        if self._komorebi_snapshot.is_paused:
             layout_name = 'Paused'
             layout_icon = self._layout_icons['paused']
-        elif not self._focused_workspace.get('tile', False):
+        elif not self._focused_workspace.tile:
             layout_name = 'Floating'
             layout_icon = self._layout_icons['floating']
-        elif self._focused_workspace.get('maximized_window', None):
+        elif self._focused_workspace.maximised:
             layout_name = 'Maximised'
             layout_icon = self._layout_icons['maximised']
-        elif self._focused_workspace.get('monocle_container', None):
+        elif self._focused_workspace.monocle:
             layout_name = 'Monocle'
             layout_icon = self._layout_icons['monocle']
         else:
-            layout_name = self._focused_workspace['layout']['Default']
+            layout_name = self._focused_workspace.layout
             layout_icon = self._layout_icons.get(layout_snake_case[layout_name], 'unknown layout')
 
         return layout_name, layout_icon
 
-    def _update_komorebi_state(self, komorebi_state: dict):
-        try:
+    def _update_komorebi_screen(self, snapshot: KomorebiSnapshot) -> bool:
+        if snapshot is None:
+            return False
+
+        komorebi_screen = snapshot.get_monitor(self._screen_hwnd)
+
+        if komorebi_screen is None:
             self._screen_hwnd = get_monitor_hwnd(int(QWidget.winId(self)))
-            self._komorebi_state = komorebi_state
+            komorebi_screen = snapshot.get_monitor(self._screen_hwnd)
 
-            if self._komorebi_state:
-                self._komorebi_screen = self._komorebic.get_screen_by_hwnd(self._komorebi_state, self._screen_hwnd)
-                self._komorebi_workspaces = self._komorebic.get_workspaces(self._komorebi_screen)
-                return True
-        except TypeError:
+        if komorebi_screen is None:
             return False
+
+        self._komorebi_snapshot = snapshot
+        self._komorebi_screen = komorebi_screen
+        return True
@@ -4,10 +4,12 @@ from PyQt6.QtCore import pyqtSignal
 from typing import Literal
 from contextlib import suppress
 from core.utils.win32.utilities import get_monitor_hwnd
-from core.event_service import EventService
 from core.event_enums import KomorebiEvent
 from core.widgets.base import BaseWidget
 from core.utils.komorebi.client import KomorebiClient
+from core.utils.komorebi.state_store import (
+    KomorebiStateStore, KomorebiSnapshot, KomorebiChange, KomorebiChangeType, WorkspaceSnapshot
+)
 from core.validation.widgets.komorebi.workspaces import VALIDATION_SCHEMA
 
 try:
@@ -36,8 +38,11 @@ class WorkspaceButton(QPushButton):
 
     def update_and_redraw(self, status: WorkspaceStatus):
         self.status = status
-        self.setProperty("class", f"ws-btn {status.lower()}")
-        self.setStyleSheet('')
+        class_name = f"ws-btn {status.lower()}"
+
+        if self.property("class") != class_name:
+            self.setProperty("class", class_name)
+            self.setStyleSheet('')
 
     def activate_workspace(self):
         try:
@@ -48,7 +53,7 @@ class WorkspaceButton(QPushButton):
 
 class WorkspaceWidget(BaseWidget):
     k_signal_connect = pyqtSignal(dict)
-    k_signal_update = pyqtSignal(dict, dict)
+    k_signal_state_change = pyqtSignal(list, object)
     k_signal_disconnect = pyqtSignal()
 
     validation_schema = VALIDATION_SCHEMA
@@ -64,39 +69,17 @@ class WorkspaceWidget(BaseWidget):
     ):
         super().__init__(class_name="komorebi-workspaces")
 
-        self._event_service = EventService()
         self._komorebic = KomorebiClient()
         self._label_workspace_btn = label_workspace_btn
         self._label_default_name = label_default_name
         self._label_zero_index = label_zero_index
+        self._screen_hwnd = None
         self._komorebi_screen = None
-        self._komorebi_workspaces = []
         self._prev_workspace_index = None
         self._curr_workspace_index = None
         self._workspace_buttons: list[WorkspaceButton] = []
         self._hide_empty_workspaces = hide_empty_workspaces
 
-        self._workspace_focus_events = [
-            KomorebiEvent.CycleFocusWorkspace.value,
-            KomorebiEvent.CycleFocusMonitor.value,
-            KomorebiEvent.FocusMonitorWorkspaceNumber.value,
-            KomorebiEvent.FocusMonitorNumber.value,
-            KomorebiEvent.FocusWorkspaceNumber.value
-        ]
-
-        self._update_buttons_event_watchlist = [
-            KomorebiEvent.EnsureWorkspaces.value,
-            KomorebiEvent.Manage.value,
-            KomorebiEvent.MoveContainerToWorkspaceNumber.value,
-            KomorebiEvent.NewWorkspace.value,
-            KomorebiEvent.ReloadConfiguration.value,
-            KomorebiEvent.SendContainerToMonitorNumber.value,
-            KomorebiEvent.SendContainerToWorkspaceNumber.value,
-            KomorebiEvent.Unmanage.value,
-            KomorebiEvent.WatchConfiguration.value,
-            KomorebiEvent.WorkspaceName.value
-        ]
-
         # Disable default mouse event handling inherited from BaseWidget
         self.mousePressEvent = None
 
@@ -121,58 +104,68 @@ class WorkspaceWidget(BaseWidget):
 
     def _register_signals_and_events(self):
         self.k_signal_connect.connect(self._on_komorebi_connect_event)
-        self.k_signal_update.connect(self._on_komorebi_update_event)
+        self.k_signal_state_change.connect(self._on_komorebi_state_change_event)
         self.k_signal_disconnect.connect(self._on_komorebi_disconnect_event)
 
-        self._event_service.register_event(KomorebiEvent.KomorebiConnect, self.k_signal_connect)
-        self._event_service.register_event(KomorebiEvent.KomorebiDisconnect, self.k_signal_disconnect)
-        self._event_service.register_event(KomorebiEvent.KomorebiUpdate, self.k_signal_update)
+        self.register_event(KomorebiEvent.KomorebiConnect, self.k_signal_connect)
+        self.register_event(KomorebiEvent.KomorebiDisconnect, self.k_signal_disconnect)
+        self.register_event(
+            KomorebiEvent.KomorebiStateChange,
+            self.k_signal_state_change,
+            event_filter=self._is_screen_state_change
+        )
+
+    def _is_screen_state_change(self, changes: list[KomorebiChange], _snapshot: KomorebiSnapshot) -> bool:
+        # Called on the listener thread, skipping changes to other monitors before they reach the GUI thread
+        komorebi_screen = self._komorebi_screen
+        return komorebi_screen is None or any(change.monitor_id == komorebi_screen.id for change in changes)
 
     def _reset(self):
-        self._komorebi_state = None
         self._komorebi_screen = None
-        self._komorebi_workspaces = []
         self._curr_workspace_index = None
         self._prev_workspace_index = None
         self._workspace_buttons = []
         self._clear_container_layout()
 
-    def _on_komorebi_connect_event(self, state: dict) -> None:
+    def _on_komorebi_connect_event(self, _state: dict) -> None:
         self._reset()
         self._hide_offline_status()
 
-        if self._update_komorebi_state(state):
+        if self._update_komorebi_screen(KomorebiStateStore().snapshot):
             self._add_or_update_buttons()
 
     def _on_komorebi_disconnect_event(self) -> None:
         self._show_offline_status()
 
-    def _on_komorebi_update_event(self, event: dict, state: dict) -> None:
-        if self._update_komorebi_state(state):
-            if event['type'] == KomorebiEvent.MoveWorkspaceToMonitorNumber.value:
-                if event['content'] != self._komorebi_screen['index']:
-                    workspaces = self._komorebic.get_workspaces(self._komorebi_screen)
-                    screen_workspace_indexes = list(map(lambda ws: ws['index'], workspaces))
-                    button_workspace_indexes = list(map(lambda ws: ws.workspace_index, self._workspace_buttons))
-                    unknown_indexes = set(button_workspace_indexes) - set(screen_workspace_indexes)
+    def _on_komorebi_state_change_event(self, changes: list[KomorebiChange], snapshot: KomorebiSnapshot) -> None:
+        if not self._update_komorebi_screen(snapshot):
+            return
 
-                    if len(unknown_indexes) >= 0:
-                        for workspace_index in unknown_indexes:
-                            self._try_remove_workspace_button(workspace_index)
+        screen_changes = [change for change in changes if change.monitor_id == self._komorebi_screen.id]
 
-                self._add_or_update_buttons()
+        for change in screen_changes:
+            if change.change_type == KomorebiChangeType.WorkspaceRemoved:
+                self._try_remove_workspace_button(change.workspace_index)
 
-            elif event['type'] in self._workspace_focus_events and self._has_active_workspace_index_changed():
+            elif change.change_type == KomorebiChangeType.WorkspaceRenamed:
+                with suppress(IndexError):
+                    workspace_button = self._workspace_buttons[change.workspace_index]
+                    workspace_button.setText(self._get_workspace_label(change.workspace_index))
+
+            elif change.change_type == KomorebiChangeType.WorkspaceFocused:
                 try:
-                    prev_workspace_button = self._workspace_buttons[self._prev_workspace_index]
-                    self._update_button(prev_workspace_button)
-                    new_workspace_button = self._workspace_buttons[self._curr_workspace_index]
-                    self._update_button(new_workspace_button)
+                    self._update_button(self._workspace_buttons[self._prev_workspace_index])
+                    self._update_button(self._workspace_buttons[self._curr_workspace_index])
                 except (IndexError, TypeError):
                     self._add_or_update_buttons()
 
-            elif event['type'] in self._update_buttons_event_watchlist:
-                self._add_or_update_buttons()
+            elif change.change_type in (KomorebiChangeType.WorkspacePopulated, KomorebiChangeType.WorkspaceEmptied):
+                with suppress(IndexError):
+                    self._update_button(self._workspace_buttons[change.workspace_index])
+
+        if any(change.change_type in (KomorebiChangeType.WorkspaceAdded, KomorebiChangeType.MonitorAdded)
+               for change in screen_changes):
+            self._add_or_update_buttons()
 
     def _clear_container_layout(self):
         for i in reversed(range(self._workspace_container_layout.count())):
@@ -180,41 +173,39 @@ class WorkspaceWidget(BaseWidget):
             self._workspace_container_layout.removeWidget(old_workspace_widget)
             old_workspace_widget.setParent(None)
 
-    def _update_komorebi_state(self, komorebi_state: dict) -> bool:
-        try:
-            self._screen_hwnd = get_monitor_hwnd(int(QWidget.winId(self)))
-            self._komorebi_state = komorebi_state
-            if self._komorebi_state:
-                self._komorebi_screen = self._komorebic.get_screen_by_hwnd(self._komorebi_state, self._screen_hwnd)
-                self._komorebi_workspaces = self._komorebic.get_workspaces(self._komorebi_screen)
+    def _update_komorebi_screen(self, snapshot: KomorebiSnapshot) -> bool:
+        if snapshot is None:
+            return False
 
-                focused_workspace = self._get_focused_workspace()
+        komorebi_screen = snapshot.get_monitor(self._screen_hwnd)
 
-                if focused_workspace:
-                    self._prev_workspace_index = self._curr_workspace_index
-                    self._curr_workspace_index = focused_workspace['index']
+        if komorebi_screen is None:
+            self._screen_hwnd = get_monitor_hwnd(int(QWidget.winId(self)))
+            komorebi_screen = snapshot.get_monitor(self._screen_hwnd)
 
-                return True
-        except TypeError:
+        if komorebi_screen is None:
             return False
 
-    def _get_focused_workspace(self):
-        return self._komorebic.get_focused_workspace(self._komorebi_screen)
-
-    def _has_active_workspace_index_changed(self):
-        return self._prev_workspace_index != self._curr_workspace_index
+        self._komorebi_screen = komorebi_screen
+        self._prev_workspace_index = self._curr_workspace_index
+        self._curr_workspace_index = komorebi_screen.focused_workspace_index
+        return True
 
-    def _get_workspace_new_status(self, workspace) -> WorkspaceStatus:
-        if self._curr_workspace_index == workspace['index']:
+    def _get_workspace_new_status(self, workspace: WorkspaceSnapshot) -> WorkspaceStatus:
+        if self._curr_workspace_index == workspace.index:
             return WORKSPACE_STATUS_ACTIVE
-        elif self._komorebic.get_num_windows(workspace) > 0:
+        elif workspace.has_windows:
             return WORKSPACE_STATUS_POPULATED
         else:
             return WORKSPACE_STATUS_EMPTY
 
     def _update_button(self, workspace_btn: WorkspaceButton) -> None:
-        workspace_index = workspace_btn.workspace_index
-        workspace = self._komorebic.get_workspace_by_index(self._komorebi_screen, workspace_index)
+        workspace = self._komorebi_screen.get_workspace(workspace_btn.workspace_index)
+
+        if workspace is None:
+            workspace_btn.hide()
+            return
+
         workspace_status = self._get_workspace_new_status(workspace)
 
         if self._hide_empty_workspaces and workspace_status == WORKSPACE_STATUS_EMPTY:
@@ -227,11 +218,11 @@ class WorkspaceWidget(BaseWidget):
 
     def _add_or_update_buttons(self) -> None:
         buttons_added = False
-        for workspace_index, workspace in enumerate(self._komorebi_workspaces):
+        for workspace in self._komorebi_screen.workspaces:
             try:
-                button = self._workspace_buttons[workspace_index]
+                button = self._workspace_buttons[workspace.index]
             except IndexError:
-                button = self._try_add_workspace_button(workspace_index)
+                button = self._try_add_workspace_button(workspace.index)
                 buttons_added = True
 
             self._update_button(button)
@@ -244,12 +235,12 @@ class WorkspaceWidget(BaseWidget):
                 self._workspace_container_layout.addWidget(workspace_btn)
 
     def _get_workspace_label(self, workspace_index):
-        workspace = self._komorebic.get_workspace_by_index(self._komorebi_screen, workspace_index)
-        monitor_index = self._komorebi_screen['index']
+        workspace = self._komorebi_screen.get_workspace(workspace_index)
+        monitor_index = self._komorebi_screen.index
 
         ws_index = workspace_index if self._label_zero_index else workspace_index + 1
         ws_monitor_index = monitor_index if self._label_zero_index else monitor_index + 1
-        ws_name = workspace['name'] if workspace['name'] else self._label_default_name.format(
+        ws_name = workspace.name if workspace.name else self._label_default_name.format(
             index=ws_index,
             monitor_index=ws_monitor_index
         )
@@ -1,11 +1,12 @@
-import asyncio
+import logging
 from itertools import cycle, islice
 from core.widgets.base import BaseWidget
 from core.validation.widgets.win32.media_player import VALIDATION_SCHEMA
 from core.utils.win32 import media_control
+from core.utils.win32.media_session import MediaSessionService, MediaSessionState
 from PyQt6.QtWidgets import QLabel, QPushButton
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap, QCursor
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QPixmap, QCursor, QImage
 
 class MediaWidgetButton(QPushButton):
     def __init__(self, button_type: str, button_label: str):
@@ -15,15 +16,11 @@ class MediaWidgetButton(QPushButton):
         self.setProperty("class", f"media-btn {button_type}")
 
     def set_active(self, is_active: bool):
-        if is_active:
-            self.setProperty("class", f"media-btn {self.button_type} active")
-        else:
-            self.setProperty("class", f"media-btn {self.button_type}")
-
-        self.setStyleSheet('')
+        class_name = f"media-btn {self.button_type} active" if is_active else f"media-btn {self.button_type}"
 
-async def call_async_callback(callback, *args):
-    await callback(*args)
+        if self.property("class") != class_name:
+            self.setProperty("class", class_name)
+            self.setStyleSheet('')
 
 class MediaWidget(BaseWidget):
     validation_schema = VALIDATION_SCHEMA
@@ -32,14 +29,22 @@ class MediaWidget(BaseWidget):
             self,
             label: str,
             label_alt: str,
-            update_interval: int,
             keep_thumbnail_aspect_ratio: bool,
             layout: list[str],
-            icons: dict[str, str]
+            icons: dict[str, str],
+            update_interval: int = None
     ):
-        super().__init__(update_interval, class_name="media-widget")
+        # Media session changes are pushed by the media session service, so the widget has no update timer
+        super().__init__(class_name="media-widget")
+
+        if update_interval is not None:
+            logging.warning(
+                "The media widget option 'update_interval' is deprecated and ignored, as media session changes "
+                "are pushed to the widget"
+            )
+
         self._icons = icons
-        self._update_interval = update_interval
+        self._media_service = MediaSessionService()
         self._keep_thumbnail_aspect_ratio = keep_thumbnail_aspect_ratio
         self._show_alt_label = False
         self._label_content = label
@@ -59,6 +64,9 @@ class MediaWidget(BaseWidget):
         self._next_btn = None
         self._prev_btn = None
         self._close_btn = None
+        self._thumbnail = None
+        self._thumbnail_image = None
+        self._thumbnail_track_key = None
 
         self.bar = None  # Initialize the bar attribute to None
 
@@ -76,11 +84,15 @@ class MediaWidget(BaseWidget):
         for media_component_type in layout:
             media_component_builders[media_component_type]()
 
+        self._media_info = None
+        self._playback_info = None
+
         self.register_callback("update_label", self._update_label)
         self.register_callback("toggle_label", self._toggle_label)
 
-        self.callback_timer = "update_label"
-        self.start_timer()
+        self._media_service.session_changed.connect(self._on_session_changed)
+        self._media_service.start()
+        self._on_session_changed(self._media_service.state)
 
     def _toggle_label(self):
         self._show_alt_label = not self._show_alt_label
@@ -94,18 +106,57 @@ class MediaWidget(BaseWidget):
 
         self._update_label()
 
-    async def _update_thumbnail(self, thumbnail_ref) -> None:
-        if thumbnail_ref:
-            wh = self.bar.dimensions['height']
-            thumbnail_image = await media_control.stream_to_image(thumbnail_ref)
-            self._thumbnail_pixmap = QPixmap.fromImage(thumbnail_image)
-            self._thumbnail.setPixmap(self._thumbnail_pixmap.scaled(wh, wh, self._thumbnail_aspect_ratio))
+    def _on_session_changed(self, session_state: MediaSessionState):
+        self._media_info = session_state.media_info
+        self._playback_info = session_state.playback_info
+        self._update_label()
+
+    def _request_thumbnail(self, media_info: dict) -> None:
+        if not media_info.get('thumbnail'):
+            return
+
+        track_key = media_control.get_track_key(media_info)
+        target_size = (self.bar.dimensions['height'], self._thumbnail_aspect_ratio)
+        thumbnail = media_control.ThumbnailCache().get(track_key, target_size)
+        self._thumbnail_track_key = track_key
+
+        if thumbnail:
+            self._set_thumbnail(thumbnail)
+        else:
+            thumbnail_ref = media_info['thumbnail']
+            self.run_in_worker(
+                "media_thumbnail",
+                lambda: self._fetch_thumbnail(thumbnail_ref, track_key, target_size),
+                self._update_thumbnail
+            )
+
+    def _fetch_thumbnail(self, thumbnail_ref, track_key: tuple, target_size: tuple) -> tuple[tuple, tuple[QImage, QImage]]:
+        thumbnail_data = self._media_service.run_coroutine(media_control.read_thumbnail(thumbnail_ref)).result()
+        thumbnail = media_control.decode_thumbnail(thumbnail_data, *target_size)
+        media_control.ThumbnailCache().put(track_key, target_size, thumbnail)
+        return track_key, thumbnail
+
+    def _update_thumbnail(self, track_thumbnail: tuple[tuple, tuple[QImage, QImage]]) -> None:
+        track_key, thumbnail = track_thumbnail
+
+        if track_key == self._thumbnail_track_key:
+            self._set_thumbnail(thumbnail)
+        else:
+            # The track changed while this thumbnail loaded, so the load of the current track was skipped
+            QTimer.singleShot(0, lambda: self._request_thumbnail(self._media_info))
+
+    def _set_thumbnail(self, thumbnail: tuple[QImage, QImage]) -> None:
+        self._thumbnail_image, scaled_image = thumbnail
+        self._thumbnail.setPixmap(QPixmap.fromImage(scaled_image))
 
     def _update_label(self):
+        if self._media_info is None or self._playback_info is None:
+            return
+
         active_label = self._label_alt if self._show_alt_label else self._label
         active_label_content = self._label_alt_content if self._show_alt_label else self._label_content
-        media_info = asyncio.run(media_control.get_media_info())
-        playback_info = asyncio.run(media_control.get_playback_info())
+        media_info = self._media_info
+        playback_info = self._playback_info
 
         try:
             title_artist = f"{media_info['title']} - {media_info['artist']}"
@@ -117,15 +168,15 @@ class MediaWidget(BaseWidget):
 
         if self._playing_media != title_artist and self.bar:
             if self._thumbnail:
-                asyncio.run(self._update_thumbnail(media_info.get('thumbnail')))
+                self._request_thumbnail(media_info)
             self._playing_media = title_artist
             self.show()
 
         if self._play_pause_btn:
             if is_play_enabled:
-                self._play_pause_btn.setText(self._icons["play"])
+                self.set_label_text(self._play_pause_btn, self._icons["play"])
             else:
-                self._play_pause_btn.setText(self._icons["pause"])
+                self.set_label_text(self._play_pause_btn, self._icons["pause"])
 
         if self._shuffle_btn:
             self._shuffle = playback_info.get('is_shuffle_active', False)
@@ -139,21 +190,21 @@ class MediaWidget(BaseWidget):
             self._update_repeat_btn_label()
 
         try:
-            active_label.setText(active_label_content.format(media=media_info, playback=playback_info))
+            self.set_label_text(active_label, active_label_content.format(media=media_info, playback=playback_info))
         except KeyError:
-            active_label.setText(active_label_content)
+            self.set_label_text(active_label, active_label_content)
         except TypeError:
-            active_label.setText("No media playing")
+            self.set_label_text(active_label, "No media playing")
 
     def _update_repeat_btn_label(self):
         if self._repeat == media_control.WindowsMediaRepeat.Off:
-            self._repeat_btn.setText(self._icons["repeat_off"])
+            self.set_label_text(self._repeat_btn, self._icons["repeat_off"])
             self._repeat_btn.set_active(False)
         elif self._repeat == media_control.WindowsMediaRepeat.Track:
-            self._repeat_btn.setText(self._icons["repeat_track"])
+            self.set_label_text(self._repeat_btn, self._icons["repeat_track"])
             self._repeat_btn.set_active(True)
         else:
-            self._repeat_btn.setText(self._icons["repeat_list"])
+            self.set_label_text(self._repeat_btn, self._icons["repeat_list"])
             self._repeat_btn.set_active(True)
 
     def _update_shuffle_btn_label(self):
@@ -173,10 +224,10 @@ class MediaWidget(BaseWidget):
     def _preview_thumbnail(self):
         if self._thumbnail_preview.isVisible():
             self._thumbnail_preview.hide()
-        else:
+        elif self._thumbnail_image is not None:
             cursor = QCursor()
 
-            self._thumbnail_preview.setPixmap(self._thumbnail_pixmap)
+            self._thumbnail_preview.setPixmap(QPixmap.fromImage(self._thumbnail_image))
             self._thumbnail_preview.show()
 
             x_pos = cursor.pos().x()
@@ -242,31 +293,19 @@ class MediaWidget(BaseWidget):
         self.widget_layout.addWidget(self._repeat_btn)
 
     def _handle_btn_press(self, btn_name):
-        session = asyncio.run(media_control.get_current_session())
-
-        if session is None:
-            print("No active media session. Cannot perform the action.")
-            return
-
-        callbacks = {
-            "prev": session.try_skip_previous_async,
-            "next": session.try_skip_next_async,
-            "shuffle": session.try_change_shuffle_active_async,
-            "play_pause": session.try_toggle_play_pause_async,
-            "repeat": session.try_change_auto_repeat_mode_async
-        }
-
         if btn_name == "close":
             self.hide()
+            return
         elif btn_name == "shuffle":
             self._shuffle = not self._shuffle
             self._update_shuffle_btn_label()
-            asyncio.run(call_async_callback(callbacks[btn_name], self._shuffle))
+            btn_args = (self._shuffle,)
         elif btn_name == "repeat":
             self._repeat = next(self._repeat_options)
             self._update_repeat_btn_label()
-            asyncio.run(call_async_callback(callbacks[btn_name], self._repeat.value))
+            btn_args = (self._repeat.value,)
         else:
-            asyncio.run(call_async_callback(callbacks[btn_name]))
+            btn_args = ()
 
-        self._update_label()
+        # The session reports the resulting media and playback changes through the media session service
+        self._media_service.send_action(btn_name, *btn_args)
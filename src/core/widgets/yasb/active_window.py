@@ -1,12 +1,22 @@
 import logging
+import psutil
+from collections import OrderedDict
 from settings import APP_BAR_TITLE
 from core.utils.win32.windows import WinEvent
+from core.utils.win32.event_listener import SystemEventListener
 from core.widgets.base import BaseWidget
-from core.event_service import EventService
-from PyQt6.QtCore import pyqtSignal, QTimer
+from core.utils.label_template import LabelTemplate
+from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtWidgets import QLabel
 from core.validation.widgets.yasb.active_window import VALIDATION_SCHEMA
-from core.utils.win32.utilities import get_hwnd_info, get_foreground_window, get_executable_name
+from core.utils.win32.utilities import (
+    get_foreground_window,
+    get_monitor_hwnd,
+    get_monitor_info,
+    get_process_info,
+    get_window_rect
+)
+from win32gui import GetWindowText, GetClassName
 
 
 IGNORED_TITLES = ['', ' ']
@@ -19,10 +29,18 @@ IGNORED_YASB_CLASSES = [
     'Qt620QWindowToolSaveBits',
     'Qt621QWindowToolSaveBits'
 ]
+# Browsers and terminals may retitle their window many times a second, of which only the latest is shown
+TITLE_CHANGE_DEBOUNCE_MS = 100
+WIN_INFO_CACHE_SIZE = 64
+UNKNOWN_PROCESS_FIELDS = ['name', 'pid', 'ppid', 'cpu_percent', 'mem_percent', 'num_threads', 'username', 'status']
+
 
 class ActiveWindowWidget(BaseWidget):
     foreground_change = pyqtSignal(int, WinEvent)
+    window_name_change = pyqtSignal(int, WinEvent)
+    window_destroy = pyqtSignal(int, WinEvent)
     validation_schema = VALIDATION_SCHEMA
+    event_listener = SystemEventListener
 
     def __init__(
             self,
@@ -34,21 +52,29 @@ class ActiveWindowWidget(BaseWidget):
             monitor_exclusive: bool,
             max_length: int,
             max_length_ellipsis: str,
-            update_interval: int = 1000  # Add update_interval to use with the timer
+            update_interval: int
     ):
-        super().__init__(class_name="dropdown-active-window-widget")
+        # Window changes arrive as events, so the timer only polls as a fallback for missed events
+        super().__init__(update_interval, class_name="dropdown-active-window-widget")
 
         self._win_info = None
+        self._win_info_cache: OrderedDict[int, str] = OrderedDict()
+        self._foreground_hwnd = None
         self._show_alt_label = False
-        self._label_content = label
-        self._label_alt_content = label_alt
-        self._active_label = label
+        self._label_fields = {
+            'title': lambda: self._win_info['title'],
+            'process': lambda: self._win_info['process'],
+            'class_name': lambda: self._win_info['class_name'],
+            'executable': lambda: self._win_info['process']['name']
+        }
+        self._label_template = LabelTemplate(label, self._label_fields)
+        self._label_alt_template = LabelTemplate(label_alt, self._label_fields)
+        self._active_label = self._label_template
         self._label_no_window = label_no_window
         self._monitor_exclusive = monitor_exclusive
         self._max_length = max_length
         self._max_length_ellipsis = max_length_ellipsis
         self._ignore_window = ignore_window
-        self._event_service = EventService()
 
         self._window_title_text = QLabel()
         self._window_title_text.setProperty("class", "label")
@@ -63,67 +89,119 @@ class ActiveWindowWidget(BaseWidget):
         self.callback_middle = callbacks['on_middle']
         self.callback_timer = "update_label"
 
-        self._start_timer(update_interval)
+        self._register_signals_and_events()
+        self.start_timer()
+
+    def _register_signals_and_events(self):
+        self.foreground_change.connect(self._on_foreground_change_event)
+        self.window_name_change.connect(self._on_window_name_change_event)
+        self.window_destroy.connect(self._on_window_destroy_event)
+
+        self.register_event(WinEvent.EventSystemForeground, self.foreground_change)
+        self.register_event(
+            WinEvent.EventObjectNameChange,
+            self.window_name_change,
+            event_filter=lambda hwnd, _event: hwnd == self._foreground_hwnd,
+            coalesce_ms=TITLE_CHANGE_DEBOUNCE_MS
+        )
+        self.register_event(
+            WinEvent.EventObjectDestroy,
+            self.window_destroy,
+            event_filter=lambda hwnd, _event: hwnd in self._win_info_cache
+        )
+
+    def _on_foreground_change_event(self, hwnd: int, _event: WinEvent) -> None:
+        self._update_window(hwnd)
+
+    def _on_window_name_change_event(self, hwnd: int, _event: WinEvent) -> None:
+        if hwnd == self._foreground_hwnd:
+            self._update_window(hwnd)
+
+    def _on_window_destroy_event(self, hwnd: int, _event: WinEvent) -> None:
+        self._win_info_cache.pop(hwnd, None)
 
     def _toggle_label(self):
         self._show_alt_label = not self._show_alt_label
-        self._active_label = self._label_alt_content if self._show_alt_label else self._label_content
+        self._active_label = self._label_alt_template if self._show_alt_label else self._label_template
         self._update_text()
 
-    def _get_active_window_info(self) -> dict:
-        hwnd = get_foreground_window()
-        win_info = get_hwnd_info(hwnd)
-        executable_name = get_executable_name(hwnd)  # Retrieve the executable name
-        if (not win_info or not hwnd or
+    def _get_cached_hwnd_info(self, hwnd: int) -> dict:
+        """
+        Returns the window's info. Only its class name is cached per hwnd, the title, monitor and process usage
+        are read on every update. The process lookup itself is cached by the shared process cache.
+        """
+        class_name = self._win_info_cache.get(hwnd, None)
+
+        if class_name is None:
+            class_name = GetClassName(hwnd)
+            self._win_info_cache[hwnd] = class_name
+
+            if len(self._win_info_cache) > WIN_INFO_CACHE_SIZE:
+                self._win_info_cache.popitem(last=False)
+        else:
+            self._win_info_cache.move_to_end(hwnd)
+
+        monitor_hwnd = get_monitor_hwnd(hwnd)
+
+        return {
+            'hwnd': hwnd,
+            'title': GetWindowText(hwnd),
+            'class_name': class_name,
+            'process': self._get_process_info(hwnd),
+            'monitor_hwnd': monitor_hwnd,
+            'monitor_info': get_monitor_info(monitor_hwnd),
+            'rect': get_window_rect(hwnd)
+        }
+
+    @staticmethod
+    def _get_process_info(hwnd: int) -> dict:
+        try:
+            return get_process_info(hwnd)
+        except (psutil.Error, OSError):
+            # Elevated processes can't be opened and others exit while being looked up, neither of which is a bug
+            return {field_name: 'N/A' for field_name in UNKNOWN_PROCESS_FIELDS}
+
+    def _get_active_window_info(self, hwnd: int) -> dict:
+        win_info = self._get_cached_hwnd_info(hwnd) if hwnd else None
+        if (not win_info or
                 not win_info['title'] or
                 win_info['title'] in IGNORED_YASB_TITLES or
                 win_info['class_name'] in IGNORED_YASB_CLASSES):
-            return {
-                'title': 'N/A',
-                'process': 'N/A',
-                'class_name': 'N/A',
-                'executable': 'N/A'
-            }
+            return None
 
         if self._monitor_exclusive and self.screen().name() != win_info['monitor_info'].get('device', None):
-            return {
-                'title': 'N/A',
-                'process': 'N/A',
-                'class_name': 'N/A',
-                'executable': 'N/A'
-            }
+            return None
 
         if self._max_length and len(win_info['title']) > self._max_length:
             win_info['title'] = f"{win_info['title'][:self._max_length]}{self._max_length_ellipsis}"
 
-        win_info['executable'] = executable_name  # Add the executable name to the window info
-
         return win_info
 
     def _update_label(self):
-        try:
-            active_window_info = self._get_active_window_info()
-
-            label_options = [
-                ("{title}", active_window_info['title']),
-                ("{process}", active_window_info['process']),
-                ("{class_name}", active_window_info['class_name']),
-                ("{executable}", active_window_info['executable']),  # Add the executable label option
-            ]
+        self._update_window(get_foreground_window())
 
-            active_label_formatted = self._active_label
-            for fmt_str, value in label_options:
-                active_label_formatted = active_label_formatted.replace(fmt_str, str(value))
+    def _update_window(self, hwnd: int):
+        self._foreground_hwnd = hwnd
 
-            self._window_title_text.setText(active_label_formatted)
+        try:
+            self._win_info = self._get_active_window_info(hwnd)
         except Exception:
-            self._window_title_text.setText(self._active_label)
+            self._win_info = None
+            self._win_info_cache.pop(hwnd, None)
+            self.set_label_text(self._window_title_text, self._active_label.template)
             logging.exception("Failed to retrieve updated active window info")
+            return
 
-    def _update_text(self):
-        self._update_label()
+        self._update_text()
 
-    def _start_timer(self, update_interval: int):
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._update_text)
-        self.timer.start(update_interval)
+    def _update_text(self):
+        try:
+            if self._win_info is None:
+                self.set_label_text(self._window_title_text, self._active_label.render({
+                    field_name: 'N/A' for field_name in self._active_label.fields
+                }))
+            else:
+                self.set_label_text(self._window_title_text, self._active_label.render_lazy(self._label_fields))
+        except Exception:
+            self.set_label_text(self._window_title_text, self._active_label.template)
+            logging.exception("Failed to render active window label")
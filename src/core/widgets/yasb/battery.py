@@ -1,21 +1,28 @@
-import psutil
 from core.widgets.base import BaseWidget
+from core.metrics_service import SystemMetric
+from core.utils.label_template import LabelTemplate
 from core.validation.widgets.yasb.battery import VALIDATION_SCHEMA
 from PyQt6.QtWidgets import QLabel
+from PyQt6.QtCore import pyqtSignal
 import logging
 
+BATTERY_LABEL_FIELDS = ['battery_percent', 'battery_secsleft', 'battery_power_plugged', 'icon']
+
+
 class BatteryWidget(BaseWidget):
+    battery_sample = pyqtSignal(dict)
     validation_schema = VALIDATION_SCHEMA
 
     def __init__(self, label: str, label_alt: str, update_interval: int, callbacks: dict[str, str], 
                  time_remaining_natural: bool, charging_options: dict, status_thresholds: dict, status_icons: dict):
         super().__init__(update_interval, class_name="battery-widget")
-        self._label_content = label
-        self._label_alt_content = label_alt
+        self._label_template = LabelTemplate(label, BATTERY_LABEL_FIELDS)
+        self._label_alt_template = LabelTemplate(label_alt, BATTERY_LABEL_FIELDS)
         self._time_remaining_natural = time_remaining_natural
         self._charging_options = charging_options
         self._status_thresholds = status_thresholds
         self._status_icons = status_icons
+        self._battery_sample = None
 
         self._label = QLabel()
         self._label_alt = QLabel()
@@ -32,12 +39,12 @@ class BatteryWidget(BaseWidget):
         self.callback_left = callbacks['on_left']
         self.callback_right = callbacks['on_right']
         self.callback_middle = callbacks['on_middle']
-        self.callback_timer = "update_label"
 
         self._label.show()
         self._label_alt.hide()
 
-        self.start_timer()
+        self.battery_sample.connect(self._on_battery_sample)
+        self.subscribe_metric(SystemMetric.Battery, update_interval, self.battery_sample)
 
     def _toggle_label(self):
         self._show_alt_label = not self._show_alt_label
@@ -51,8 +58,12 @@ class BatteryWidget(BaseWidget):
 
         self._update_label()
 
+    def _on_battery_sample(self, battery_sample: dict):
+        self._battery_sample = battery_sample
+        self._update_label()
+
     def _get_battery_info(self) -> dict:
-        battery = psutil.sensors_battery()
+        battery = self._battery_sample['battery'] if self._battery_sample else None
         if battery is None:
             return {
                 'percent': 'N/A',
@@ -84,23 +95,17 @@ class BatteryWidget(BaseWidget):
 
     def _update_label(self):
         active_label = self._label_alt if self._show_alt_label else self._label
-        active_label_content = self._label_alt_content if self._show_alt_label else self._label_content
-        active_label_formatted = active_label_content
+        active_label_template = self._label_alt_template if self._show_alt_label else self._label_template
 
         try:
             battery_info = self._get_battery_info()
 
-            label_options = [
-                ("{battery_percent}", battery_info['percent']),
-                ("{battery_secsleft}", battery_info['secsleft']),
-                ("{battery_power_plugged}", battery_info['power_plugged']),
-                ("{icon}", battery_info['icon']),
-            ]
-
-            for fmt_str, value in label_options:
-                active_label_formatted = active_label_formatted.replace(fmt_str, str(value))
-
-            active_label.setText(active_label_formatted)
+            self.set_label_text(active_label, active_label_template.render({
+                'battery_percent': battery_info['percent'],
+                'battery_secsleft': battery_info['secsleft'],
+                'battery_power_plugged': battery_info['power_plugged'],
+                'icon': battery_info['icon']
+            }))
 
             # Determine battery status
             if battery_info['power_plugged']:
@@ -119,9 +124,8 @@ class BatteryWidget(BaseWidget):
                 status_class = "status-full"
 
             # Apply the status class
-            active_label.setProperty("class", f"label {status_class}")
-            active_label.setStyleSheet('')  # This triggers the CSS update
+            self.set_label_class(active_label, f"label {status_class}")
 
         except Exception:
-            active_label.setText(active_label_content)
+            self.set_label_text(active_label, active_label_template.template)
             logging.exception("Failed to retrieve updated battery info")
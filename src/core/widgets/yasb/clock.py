@@ -1,6 +1,6 @@
 import re
-import pytz
 from core.widgets.base import BaseWidget
+from core.utils.label_template import LabelTemplate
 from core.validation.widgets.yasb.clock import VALIDATION_SCHEMA
 from PyQt6.QtWidgets import QLabel
 from datetime import datetime, timezone
@@ -14,8 +14,13 @@ class ClockWidget(BaseWidget):
     def __init__(self, label: str, label_alt: str, update_interval: int, timezones: list[str], callbacks: dict[str, str]):
         super().__init__(update_interval, class_name="dropdown-clock-widget")
         self._timezones = cycle(timezones if timezones else [get_localzone_name()])
-        self._label_content = label
-        self._label_alt_content = label_alt
+        self._datetime_format = "%Y-%m-%d %H:%M:%S"
+        self._label_fields = {
+            'formatted_time': self._get_formatted_time,
+            'timezone': lambda: self._active_tz
+        }
+        self._label_template = LabelTemplate(label, self._label_fields)
+        self._label_alt_template = LabelTemplate(label_alt, self._label_fields)
 
         self._label = QLabel()
         self._label_alt = QLabel()
@@ -54,43 +59,24 @@ class ClockWidget(BaseWidget):
 
         self._update_label()
 
-    def _get_clock_info(self) -> dict:
+    def _get_formatted_time(self) -> str:
         try:
+            import pytz
             # Get the current time in UTC and then convert it to the active timezone
             datetime_now = datetime.now(timezone.utc).astimezone(pytz.timezone(self._active_tz))
-            formatted_time = datetime_now.strftime(self._datetime_format)
-        except Exception as e:
+            return datetime_now.strftime(self._datetime_format)
+        except Exception:
             logging.exception("Failed to retrieve updated clock info")
-            formatted_time = "N/A"
-        
-        return {
-            'formatted_time': formatted_time,
-            'timezone': self._active_tz
-        }
+            return "N/A"
 
     def _update_label(self):
         active_label = self._label_alt if self._show_alt_label else self._label
-        active_label_content = self._label_alt_content if self._show_alt_label else self._label_content
-        active_label_formatted = active_label_content
+        active_label_template = self._label_alt_template if self._show_alt_label else self._label_template
 
         try:
-            # Set default datetime format if not already set
-            self._datetime_format = "%Y-%m-%d %H:%M:%S"
-
-            clock_info = self._get_clock_info()
-
-            label_options = [
-                ("{formatted_time}", clock_info['formatted_time']),
-                ("{timezone}", clock_info['timezone']),
-            ]
-
-            for fmt_str, value in label_options:
-                active_label_formatted = active_label_formatted.replace(fmt_str, str(value))
-
-
-            active_label.setText(active_label_formatted)
+            self.set_label_text(active_label, active_label_template.render_lazy(self._label_fields))
         except Exception as e:
-            active_label.setText(active_label_content)
+            self.set_label_text(active_label, active_label_template.template)
             logging.exception("Failed to retrieve updated clock info: %s", str(e))
 
     def _next_timezone(self):
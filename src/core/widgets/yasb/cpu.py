@@ -1,11 +1,14 @@
-import psutil
 from collections import deque
 from core.widgets.base import BaseWidget
+from core.metrics_service import SystemMetric
+from core.utils.label_template import LabelTemplate
 from core.validation.widgets.yasb.cpu import VALIDATION_SCHEMA
 from PyQt6.QtWidgets import QLabel
+from PyQt6.QtCore import pyqtSignal
 import logging
 
 class CpuWidget(BaseWidget):
+    cpu_sample = pyqtSignal(dict)
     validation_schema = VALIDATION_SCHEMA
 
     def __init__(
@@ -22,9 +25,25 @@ class CpuWidget(BaseWidget):
         self._cpu_freq_history = deque([0] * histogram_num_columns, maxlen=histogram_num_columns)
         self._cpu_perc_history = deque([0] * histogram_num_columns, maxlen=histogram_num_columns)
 
+        self._cpu_sample = None
+
         self._show_alt_label = False
-        self._label_content = label
-        self._label_alt_content = label_alt
+        self._label_fields = {
+            'cpu_freq_min': lambda: self._cpu_sample['freq']['min'],
+            'cpu_freq_max': lambda: self._cpu_sample['freq']['max'],
+            'cpu_freq_current': lambda: self._cpu_sample['freq']['current'],
+            'cpu_percent_total': lambda: self._cpu_sample['percent']['total'],
+            'cpu_percent_cores': lambda: ", ".join(map(str, self._cpu_sample['percent']['cores'])),
+            'cpu_stats_context_switches': lambda: self._cpu_sample['stats']['context_switches'],
+            'cpu_stats_interrupts': lambda: self._cpu_sample['stats']['interrupts'],
+            'cpu_stats_soft_interrupts': lambda: self._cpu_sample['stats']['soft_interrupts'],
+            'cpu_stats_sys_calls': lambda: self._cpu_sample['stats']['sys_calls'],
+            'histogram_cpu_freq': self._get_cpu_freq_histogram,
+            'histogram_cpu_percent': self._get_cpu_percent_histogram,
+            'histogram_cores': self._get_cores_histogram
+        }
+        self._label_template = LabelTemplate(label, self._label_fields)
+        self._label_alt_template = LabelTemplate(label_alt, self._label_fields)
 
         self._label = QLabel()
         self._label_alt = QLabel()
@@ -39,12 +58,12 @@ class CpuWidget(BaseWidget):
         self.callback_left = callbacks['on_left']
         self.callback_right = callbacks['on_right']
         self.callback_middle = callbacks['on_middle']
-        self.callback_timer = "update_label"
 
         self._label.show()
         self._label_alt.hide()
 
-        self.start_timer()
+        self.cpu_sample.connect(self._on_cpu_sample)
+        self.subscribe_metric(SystemMetric.Cpu, update_interval, self.cpu_sample)
 
     def _toggle_label(self):
         self._show_alt_label = not self._show_alt_label
@@ -65,74 +84,37 @@ class CpuWidget(BaseWidget):
         bar_index = min(max(bar_index, 0), len(self._histogram_icons) - 1)
         return self._histogram_icons[bar_index]
 
-    def _get_cpu_info(self) -> dict:
-        cpu_freq = psutil.cpu_freq()
-        cpu_stats = psutil.cpu_stats()
-        min_freq = cpu_freq.min
-        max_freq = cpu_freq.max
-        current_freq = cpu_freq.current
-        current_perc = psutil.cpu_percent()
-        cores_perc = psutil.cpu_percent(percpu=True)
-
-        self._cpu_freq_history.append(current_freq)
-        self._cpu_perc_history.append(current_perc)
-
-        return {
-            'cpu_freq': {
-                'min': min_freq,
-                'max': max_freq,
-                'current': current_freq
-            },
-            'cpu_percent': {
-                'total': current_perc,
-                'cores': cores_perc
-            },
-            'cpu_stats': {
-                'context_switches': cpu_stats.ctx_switches,
-                'interrupts': cpu_stats.interrupts,
-                'soft_interrupts': cpu_stats.soft_interrupts,
-                'sys_calls': cpu_stats.syscalls
-            },
-            'histograms': {
-                'cpu_freq': "".join([
-                    self._get_histogram_bar(freq, min_freq, max_freq) for freq in self._cpu_freq_history
-                ]).encode('utf-8').decode('unicode_escape'),
-                'cpu_percent': "".join([
-                    self._get_histogram_bar(percent, 0, 100) for percent in self._cpu_perc_history
-                ]).encode('utf-8').decode('unicode_escape'),
-                'cores': "".join([
-                    self._get_histogram_bar(percent, 0, 100) for percent in cores_perc
-                ]).encode('utf-8').decode('unicode_escape'),
-            }
-        }
+    def _on_cpu_sample(self, cpu_sample: dict):
+        self._cpu_sample = cpu_sample
+        self._cpu_freq_history.append(cpu_sample['freq']['current'])
+        self._cpu_perc_history.append(cpu_sample['percent']['total'])
+        self._update_label()
+
+    def _get_histogram(self, values, num_min, num_max) -> str:
+        return "".join([
+            self._get_histogram_bar(value, num_min, num_max) for value in values
+        ]).encode('utf-8').decode('unicode_escape')
+
+    def _get_cpu_freq_histogram(self) -> str:
+        cpu_freq = self._cpu_sample['freq']
+        return self._get_histogram(self._cpu_freq_history, cpu_freq['min'], cpu_freq['max'])
+
+    def _get_cpu_percent_histogram(self) -> str:
+        return self._get_histogram(self._cpu_perc_history, 0, 100)
+
+    def _get_cores_histogram(self) -> str:
+        return self._get_histogram(self._cpu_sample['percent']['cores'], 0, 100)
 
     def _update_label(self):
         active_label = self._label_alt if self._show_alt_label else self._label
-        active_label_content = self._label_alt_content if self._show_alt_label else self._label_content
-        active_label_formatted = active_label_content
+        active_label_template = self._label_alt_template if self._show_alt_label else self._label_template
+
+        if not self._cpu_sample:
+            self.set_label_text(active_label, active_label_template.template)
+            return
 
         try:
-            cpu_info = self._get_cpu_info()
-
-            label_options = [
-                ("{cpu_freq_min}", cpu_info['cpu_freq']['min']),
-                ("{cpu_freq_max}", cpu_info['cpu_freq']['max']),
-                ("{cpu_freq_current}", cpu_info['cpu_freq']['current']),
-                ("{cpu_percent_total}", cpu_info['cpu_percent']['total']),
-                ("{cpu_percent_cores}", ", ".join(map(str, cpu_info['cpu_percent']['cores']))),
-                ("{cpu_stats_context_switches}", cpu_info['cpu_stats']['context_switches']),
-                ("{cpu_stats_interrupts}", cpu_info['cpu_stats']['interrupts']),
-                ("{cpu_stats_soft_interrupts}", cpu_info['cpu_stats']['soft_interrupts']),
-                ("{cpu_stats_sys_calls}", cpu_info['cpu_stats']['sys_calls']),
-                ("{histogram_cpu_freq}", cpu_info['histograms']['cpu_freq']),
-                ("{histogram_cpu_percent}", cpu_info['histograms']['cpu_percent']),
-                ("{histogram_cores}", cpu_info['histograms']['cores']),
-            ]
-
-            for fmt_str, value in label_options:
-                active_label_formatted = active_label_formatted.replace(fmt_str, str(value))
-
-            active_label.setText(active_label_formatted)
+            self.set_label_text(active_label, active_label_template.render_lazy(self._label_fields))
         except Exception:
-            active_label.setText(active_label_content)
+            self.set_label_text(active_label, active_label_template.template)
             logging.exception("Failed to retrieve updated CPU info")
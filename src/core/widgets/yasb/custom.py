@@ -74,23 +74,26 @@ class CustomWidget(BaseWidget):
         active_label_content = self._label_alt_content if self._show_alt_label else self._label_content
 
         try:
-            active_label.setText(self._truncate_label(active_label_content.format(data=self._exec_data)))
+            self.set_label_text(active_label, self._truncate_label(active_label_content.format(data=self._exec_data)))
         except Exception:
-            active_label.setText(self._truncate_label(active_label_content))
+            self.set_label_text(active_label, self._truncate_label(active_label_content))
 
     def _exec_callback(self):
-        self._exec_data = None
-
         if self._exec_cmd:
-            proc = subprocess.Popen(self._exec_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, shell=True)
-            output = proc.stdout.read()
+            self.run_in_worker("exec_custom", self._exec_cmd_output, self._on_exec_data)
 
-            if self._exec_return_type == "json":
-                self._exec_data = json.loads(output)
-            else:
-                self._exec_data = output.decode('utf-8').strip()
+    def _exec_cmd_output(self):
+        proc = subprocess.Popen(self._exec_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, shell=True)
+        output, _stderr = proc.communicate()
 
-            self._update_label()
+        if self._exec_return_type == "json":
+            return json.loads(output)
+        else:
+            return output.decode('utf-8').strip()
+
+    def _on_exec_data(self, exec_data):
+        self._exec_data = exec_data
+        self._update_label()
 
     def _cb_execute_subprocess(self, cmd: str, *cmd_args: list[str]):
         # Overrides the default 'exec' callback from BaseWidget to allow for data formatting
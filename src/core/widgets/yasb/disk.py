@@ -1,17 +1,40 @@
-import os
 from core.widgets.base import BaseWidget
+from core.metrics_service import SystemMetric
+from core.utils.disk_metrics import DiskPartitionCache, normalize_volume_label
+from core.utils.label_template import LabelTemplate
 from core.validation.widgets.yasb.disk import VALIDATION_SCHEMA
 from PyQt6.QtWidgets import QLabel
+from PyQt6.QtCore import pyqtSignal
 import logging
 
+DISK_LABEL_FIELDS = [
+    'total_mb', 'total_gb', 'used_mb', 'used_gb', 'used_percent', 'free_mb', 'free_gb', 'free_percent',
+    'volume_label', 'read_speed', 'write_speed'
+]
+DISK_IO_FIELDS = ['read_speed', 'write_speed']
+
+
 class DiskWidget(BaseWidget):
+    disk_sample = pyqtSignal(dict)
     validation_schema = VALIDATION_SCHEMA
 
-    def __init__(self, label: str, label_alt: str, volume_label: str, update_interval: int, callbacks: dict[str, str]):
+    def __init__(
+            self,
+            label: str,
+            label_alt: str,
+            volume_label: str,
+            volume_labels: list[str],
+            volume_separator: str,
+            update_interval: int,
+            callbacks: dict[str, str]
+    ):
         super().__init__(update_interval, class_name="dropdown-disk-widget")
-        self._label_content = label
-        self._label_alt_content = label_alt
-        self._volume_label = volume_label
+        self._volume_labels = volume_labels or [volume_label]
+        self._volume_separator = volume_separator
+        self._label_template = LabelTemplate(label, DISK_LABEL_FIELDS)
+        self._label_alt_template = LabelTemplate(label_alt, DISK_LABEL_FIELDS)
+        self._disk_sample = None
+        self._io_info = None
 
         self._label = QLabel()
         self._label_alt = QLabel()
@@ -28,12 +51,13 @@ class DiskWidget(BaseWidget):
         self.callback_left = callbacks["on_left"]
         self.callback_right = callbacks["on_right"]
         self.callback_middle = callbacks["on_middle"]
-        self.callback_timer = "update_label"
 
         self._label.show()
         self._label_alt.hide()
 
-        self.start_timer()
+        DiskPartitionCache().request_volumes(self._volume_labels)
+        self.disk_sample.connect(self._on_disk_sample)
+        self.subscribe_metric(SystemMetric.Disk, update_interval, self.disk_sample)
 
     def _toggle_label(self):
         self._show_alt_label = not self._show_alt_label
@@ -47,61 +71,67 @@ class DiskWidget(BaseWidget):
 
         self._update_label()
 
-    def _get_disk_info(self) -> dict:
-        result = os.popen("WMIC LOGICALDISK GET Name,Size,FreeSpace").read()  # WMIC is deprecated, but all other options require elevation
-        used_space = 0
-        total_space = 0
-        for line in result.split("\n"):
-            if self._volume_label in line:
-                used_space = int(line.split()[0].strip())
-                total_space = int(line.split()[2].strip())
-
-        if used_space and total_space:
-            return {
-                'total_mb': total_space / 1024,
-                'total_gb': total_space / 1024**3,
-                'used_mb': used_space / 1024,
-                'used_gb': used_space / 1024**3,
-                'used_percent': (used_space / total_space) * 100,
-                'free_mb': (total_space - used_space) / 1024,
-                'free_gb': (total_space / 1024**3) - (used_space / 1024**3),
-                'free_percent': ((total_space - used_space) / total_space) * 100
-            }
+    def _on_disk_sample(self, disk_sample: dict):
+        prev_sample = self._disk_sample or disk_sample
+        self._io_info = self._get_io_info(prev_sample, disk_sample)
+        self._disk_sample = disk_sample
+        self._update_label()
+
+    @staticmethod
+    def _get_io_info(prev_sample: dict, curr_sample: dict) -> dict:
+        if not curr_sample['io'] or not prev_sample['io']:
+            return {field_name: 'N/A' for field_name in DISK_IO_FIELDS}
+
+        from humanize import naturalsize
+        elapsed_secs = max(curr_sample['timestamp'] - prev_sample['timestamp'], 1e-3)
+        read_rate = int((curr_sample['io']['read_bytes'] - prev_sample['io']['read_bytes']) / elapsed_secs)
+        write_rate = int((curr_sample['io']['write_bytes'] - prev_sample['io']['write_bytes']) / elapsed_secs)
+
         return {
-            'total_mb': 'N/A',
-            'total_gb': 'N/A',
-            'used_mb': 'N/A',
-            'used_gb': 'N/A',
-            'used_percent': 'N/A',
-            'free_mb': 'N/A',
-            'free_gb': 'N/A',
-            'free_percent': 'N/A'
+            'read_speed': f"{read_rate} B/s" if read_rate < 1024 else naturalsize(read_rate) + "/s",
+            'write_speed': f"{write_rate} B/s" if write_rate < 1024 else naturalsize(write_rate) + "/s"
         }
 
+    @staticmethod
+    def _get_disk_info(usage: dict) -> dict:
+        total_space = usage['total']
+        used_space = usage['used']
+        free_space = usage['free']
+
+        return {
+            'total_mb': total_space / 1024**2,
+            'total_gb': total_space / 1024**3,
+            'used_mb': used_space / 1024**2,
+            'used_gb': used_space / 1024**3,
+            'used_percent': usage['percent'],
+            'free_mb': free_space / 1024**2,
+            'free_gb': free_space / 1024**3,
+            'free_percent': (free_space / total_space) * 100 if total_space else 0
+        }
+
+    def _render_volume(self, label_template: LabelTemplate, volume_label: str) -> str:
+        usage = self._disk_sample['volumes'].get(normalize_volume_label(volume_label), None)
+        disk_info = self._get_disk_info(usage) if usage else {}
+        label_values = {
+            field_name: f"{disk_info[field_name]:.2f}" if field_name in disk_info else 'N/A'
+            for field_name in label_template.fields if field_name not in DISK_IO_FIELDS
+        }
+        label_values['volume_label'] = volume_label
+        label_values.update(self._io_info)
+        return label_template.render(label_values)
+
     def _update_label(self):
         active_label = self._label_alt if self._show_alt_label else self._label
-        active_label_content = self._label_alt_content if self._show_alt_label else self._label_content
-        active_label_formatted = active_label_content
+        active_label_template = self._label_alt_template if self._show_alt_label else self._label_template
+
+        if not self._disk_sample:
+            self.set_label_text(active_label, active_label_template.template)
+            return
 
         try:
-            disk_info = self._get_disk_info()
-
-            label_options = [
-                ("{total_mb}", f"{disk_info['total_mb']:.2f}"),
-                ("{total_gb}", f"{disk_info['total_gb']:.2f}"),
-                ("{used_mb}", f"{disk_info['used_mb']:.2f}"),
-                ("{used_gb}", f"{disk_info['used_gb']:.2f}"),
-                ("{used_percent}", f"{disk_info['used_percent']:.2f}"),
-                ("{free_mb}", f"{disk_info['free_mb']:.2f}"),
-                ("{free_gb}", f"{disk_info['free_gb']:.2f}"),
-                ("{free_percent}", f"{disk_info['free_percent']:.2f}"),
-                ("{volume_label}", self._volume_label)
-            ]
-
-            for fmt_str, value in label_options:
-                active_label_formatted = active_label_formatted.replace(fmt_str, str(value))
-
-            active_label.setText(active_label_formatted)
+            self.set_label_text(active_label, self._volume_separator.join(
+                self._render_volume(active_label_template, volume_label) for volume_label in self._volume_labels
+            ))
         except Exception:
-            active_label.setText(active_label_content)
+            self.set_label_text(active_label, active_label_template.template)
             logging.exception("Failed to retrieve updated disk info")
@@ -1,12 +1,14 @@
 import logging
-import psutil
-from humanize import naturalsize
 from core.widgets.base import BaseWidget
+from core.metrics_service import SystemMetric
+from core.utils.label_template import LabelTemplate
 from core.validation.widgets.yasb.memory import VALIDATION_SCHEMA
 from PyQt6.QtWidgets import QLabel
+from PyQt6.QtCore import pyqtSignal
 
 
 class MemoryWidget(BaseWidget):
+    memory_sample = pyqtSignal(dict)
     validation_schema = VALIDATION_SCHEMA
 
     def __init__(
@@ -19,10 +21,20 @@ class MemoryWidget(BaseWidget):
     ):
         super().__init__(update_interval, class_name="dropdown-memory-widget")
         self._memory_thresholds = memory_thresholds
+        self._memory_sample = None
 
         self._show_alt_label = False
-        self._label_content = label
-        self._label_alt_content = label_alt
+        self._label_fields = {
+            'virtual_mem_free': lambda: self._naturalsize(self._memory_sample['virtual'].free),
+            'virtual_mem_percent': lambda: self._memory_sample['virtual'].percent,
+            'virtual_mem_total': lambda: self._naturalsize(self._memory_sample['virtual'].total),
+            'virtual_mem_avail': lambda: self._naturalsize(self._memory_sample['virtual'].available),
+            'swap_mem_free': lambda: self._naturalsize(self._memory_sample['swap'].free),
+            'swap_mem_percent': lambda: self._memory_sample['swap'].percent,
+            'swap_mem_total': lambda: self._naturalsize(self._memory_sample['swap'].total)
+        }
+        self._label_template = LabelTemplate(label, self._label_fields)
+        self._label_alt_template = LabelTemplate(label_alt, self._label_fields)
 
         self._label = QLabel()
         self._label_alt = QLabel()
@@ -37,11 +49,12 @@ class MemoryWidget(BaseWidget):
         self.callback_left = callbacks['on_left']
         self.callback_right = callbacks['on_right']
         self.callback_middle = callbacks['on_middle']
-        self.callback_timer = "update_label"
 
         self._label.show()
         self._label_alt.hide()
-        self.start_timer()
+
+        self.memory_sample.connect(self._on_memory_sample)
+        self.subscribe_metric(SystemMetric.Memory, update_interval, self.memory_sample)
 
     def _toggle_label(self):
         self._show_alt_label = not self._show_alt_label
@@ -55,37 +68,32 @@ class MemoryWidget(BaseWidget):
 
         self._update_label()
 
+    def _on_memory_sample(self, memory_sample: dict):
+        self._memory_sample = memory_sample
+        self._update_label()
+
     def _update_label(self):
         active_label = self._label_alt if self._show_alt_label else self._label
-        active_label_content = self._label_alt_content if self._show_alt_label else self._label_content
-        active_label_formatted = active_label_content
+        active_label_template = self._label_alt_template if self._show_alt_label else self._label_template
 
-        try:
-            virtual_mem = psutil.virtual_memory()
-            swap_mem = psutil.swap_memory()
-
-            threshold = self._get_virtual_memory_threshold(virtual_mem.percent)
-            label_options = [
-                ("{virtual_mem_free}", naturalsize(virtual_mem.free)),
-                ("{virtual_mem_percent}", virtual_mem.percent),
-                ("{virtual_mem_total}", naturalsize(virtual_mem.total)),
-                ("{virtual_mem_avail}", naturalsize(virtual_mem.available)),
-                ("{swap_mem_free}", naturalsize(swap_mem.free)),
-                ("{swap_mem_percent}", swap_mem.percent),
-                ("{swap_mem_total}", naturalsize(swap_mem.total)),
-            ]
-
-            for fmt_str, value in label_options:
-                active_label_formatted = active_label_formatted.replace(fmt_str, str(value))
+        if not self._memory_sample:
+            self.set_label_text(active_label, active_label_template.template)
+            return
 
+        try:
+            threshold = self._get_virtual_memory_threshold(self._memory_sample['virtual'].percent)
             alt_class = "alt" if self._show_alt_label else ""
-            active_label.setText(active_label_formatted)
-            active_label.setProperty("class", f"label {alt_class} status-{threshold}")
-            active_label.setStyleSheet('')
+            self.set_label_text(active_label, active_label_template.render_lazy(self._label_fields))
+            self.set_label_class(active_label, f"label {alt_class} status-{threshold}")
         except Exception:
-            active_label.setText(active_label_content)
+            self.set_label_text(active_label, active_label_template.template)
             logging.exception("Failed to retrieve updated memory info")
 
+    @staticmethod
+    def _naturalsize(value: int) -> str:
+        from humanize import naturalsize
+        return naturalsize(value)
+
     def _get_virtual_memory_threshold(self, virtual_memory_percent) -> str:
         if virtual_memory_percent <= self._memory_thresholds['low']:
             return "low"
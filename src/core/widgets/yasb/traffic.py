@@ -1,20 +1,23 @@
-import psutil
-from humanize import naturalsize
 from core.widgets.base import BaseWidget
+from core.metrics_service import SystemMetric
+from core.utils.label_template import LabelTemplate
 from core.validation.widgets.yasb.traffic import VALIDATION_SCHEMA
 from PyQt6.QtWidgets import QLabel
+from PyQt6.QtCore import pyqtSignal
 import logging
 
 class TrafficWidget(BaseWidget):
+    traffic_sample = pyqtSignal(dict)
     validation_schema = VALIDATION_SCHEMA
 
     def __init__(self, label: str, label_alt: str, update_interval: int, callbacks: dict[str, str]):
         super().__init__(update_interval, class_name="dropdown-traffic-widget")
-        self.interval = update_interval // 1000
+        self._traffic_info = None
+        self._prev_sample = None
 
         self._show_alt_label = False
-        self._label_content = label
-        self._label_alt_content = label_alt
+        self._label_template = LabelTemplate(label, ['upload_speed', 'download_speed'])
+        self._label_alt_template = LabelTemplate(label_alt, ['upload_speed', 'download_speed'])
 
         self._label = QLabel()
         self._label_alt = QLabel()
@@ -31,16 +34,12 @@ class TrafficWidget(BaseWidget):
         self.callback_left = callbacks["on_left"]
         self.callback_right = callbacks["on_right"]
         self.callback_middle = callbacks["on_middle"]
-        self.callback_timer = "update_label"
 
         self._label.show()
         self._label_alt.hide()
 
-        self.io = psutil.net_io_counters()
-        self.bytes_sent = self.io.bytes_sent
-        self.bytes_recv = self.io.bytes_recv
-
-        self.start_timer()
+        self.traffic_sample.connect(self._on_traffic_sample)
+        self.subscribe_metric(SystemMetric.Traffic, update_interval, self.traffic_sample)
 
     def _toggle_label(self):
         self._show_alt_label = not self._show_alt_label
@@ -54,23 +53,26 @@ class TrafficWidget(BaseWidget):
 
         self._update_label()
 
-    def _get_traffic_info(self) -> dict:
-        current_io = psutil.net_io_counters()
-        upload_diff = current_io.bytes_sent - self.bytes_sent
-        download_diff = current_io.bytes_recv - self.bytes_recv
+    def _on_traffic_sample(self, traffic_sample: dict):
+        self._traffic_info = self._get_traffic_info(self._prev_sample or traffic_sample, traffic_sample)
+        self._prev_sample = traffic_sample
+        self._update_label()
+
+    def _get_traffic_info(self, prev_sample: dict, curr_sample: dict) -> dict:
+        from humanize import naturalsize
+        elapsed_secs = max(curr_sample['timestamp'] - prev_sample['timestamp'], 1e-3)
+        upload_rate = int((curr_sample['bytes_sent'] - prev_sample['bytes_sent']) / elapsed_secs)
+        download_rate = int((curr_sample['bytes_recv'] - prev_sample['bytes_recv']) / elapsed_secs)
 
-        if upload_diff < 1024:
-            upload_speed = f"{upload_diff} B/s"
+        if upload_rate < 1024:
+            upload_speed = f"{upload_rate} B/s"
         else:
-            upload_speed = naturalsize(upload_diff // self.interval) + "/s"
+            upload_speed = naturalsize(upload_rate) + "/s"
 
-        if download_diff < 1024:
-            download_speed = f"{download_diff} B/s"
+        if download_rate < 1024:
+            download_speed = f"{download_rate} B/s"
         else:
-            download_speed = naturalsize(download_diff // self.interval) + "/s"
-
-        self.bytes_sent = current_io.bytes_sent
-        self.bytes_recv = current_io.bytes_recv
+            download_speed = naturalsize(download_rate) + "/s"
 
         return {
             'upload_speed': upload_speed,
@@ -79,21 +81,14 @@ class TrafficWidget(BaseWidget):
 
     def _update_label(self):
         active_label = self._label_alt if self._show_alt_label else self._label
-        active_label_content = self._label_alt_content if self._show_alt_label else self._label_content
-        active_label_formatted = active_label_content
+        active_label_template = self._label_alt_template if self._show_alt_label else self._label_template
 
-        try:
-            traffic_info = self._get_traffic_info()
-
-            label_options = [
-                ("{upload_speed}", traffic_info['upload_speed']),
-                ("{download_speed}", traffic_info['download_speed']),
-            ]
+        if not self._traffic_info:
+            self.set_label_text(active_label, active_label_template.template)
+            return
 
-            for fmt_str, value in label_options:
-                active_label_formatted = active_label_formatted.replace(fmt_str, str(value))
-
-            active_label.setText(active_label_formatted)
+        try:
+            self.set_label_text(active_label, active_label_template.render(self._traffic_info))
         except Exception:
-            active_label.setText(active_label_content)
+            self.set_label_text(active_label, active_label_template.template)
             logging.exception("Failed to retrieve updated traffic info")
@@ -1,14 +1,16 @@
 from core.widgets.base import BaseWidget
 from core.validation.widgets.yasb.volume import VALIDATION_SCHEMA
+from core.event_enums import VolumeEvent
+from core.utils.win32.audio_volume import VolumeService, VolumeState
+from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtWidgets import QLabel
-from comtypes import CLSCTX_ALL
-from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
 
-devices = AudioUtilities.GetSpeakers()
-interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-volume = interface.QueryInterface(IAudioEndpointVolume)
+# Dragging the volume slider notifies many changes a second, of which only the latest is shown
+VOLUME_CHANGE_COALESCE_MS = 50
+
 
 class VolumeWidget(BaseWidget):
+    volume_change = pyqtSignal(VolumeState)
     validation_schema = VALIDATION_SCHEMA
 
     def __init__(
@@ -18,7 +20,10 @@ class VolumeWidget(BaseWidget):
         update_interval: int,
         callbacks: dict[str, str],
     ):
+        # Volume changes arrive as events, so the timer only polls as a fallback for missed notifications
         super().__init__(update_interval, class_name="dropdown-volume-widget")
+        self._volume_service = VolumeService()
+        self._volume_state = None
         self._show_alt_label = False
         self._label_content = label
         self._label_alt_content = label_alt
@@ -41,6 +46,13 @@ class VolumeWidget(BaseWidget):
         self._label.show()
         self._label_alt.hide()
 
+        self.volume_change.connect(self._on_volume_change_event)
+        self.register_event(
+            VolumeEvent.VolumeChange,
+            self.volume_change,
+            coalesce_ms=VOLUME_CHANGE_COALESCE_MS
+        )
+        self._volume_service.start()
         self.start_timer()
 
     def _toggle_label(self):
@@ -53,28 +65,37 @@ class VolumeWidget(BaseWidget):
             self._label.show()
             self._label_alt.hide()
 
-        self._update_label()
+        self._update_text()
+
+    def _on_volume_change_event(self, volume_state: VolumeState):
+        self._volume_state = volume_state
+        self._update_text()
 
     def _update_label(self):
-        # Determine which label is active
+        try:
+            self._volume_state = self._volume_service.get_state()
+        except Exception:
+            self._volume_state = None
+
+        self._update_text()
+
+    def _update_text(self):
         active_label = self._label_alt if self._show_alt_label else self._label
         active_label_content = self._label_alt_content if self._show_alt_label else self._label_content
-        active_label.setText(active_label_content)
 
-        # Format the label content
         try:
-            volume = self._get_volume()
-
-            active_label.setText(active_label_content.format(volume=volume))
+            self.set_label_text(active_label, active_label_content.format(volume=self._get_volume()))
         except Exception:
-            active_label.setText(active_label_content)
+            self.set_label_text(active_label, active_label_content)
 
-    def _get_volume(self):
-        if volume.GetMute() == 1:
-            volumePercent = '<span style="color: #656766">muted</span>'
+    def _get_volume(self) -> dict:
+        if self._volume_state is None:
+            volume_percent = 'N/A'
+        elif self._volume_state.is_muted:
+            volume_percent = '<span style="color: #656766">muted</span>'
         else:
-            volumePercent = f'{ round(volume.GetMasterVolumeLevelScalar() * 100) }%'
+            volume_percent = f'{self._volume_state.percent}%'
 
         return {
-            'percent': volumePercent
-        }
\ No newline at end of file
+            'percent': volume_percent
+        }
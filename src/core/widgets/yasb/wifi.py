@@ -1,19 +1,23 @@
-import psutil
 from core.widgets.base import BaseWidget
+from core.utils.label_template import LabelTemplate
+from core.utils.wifi_provider import WifiInfo, get_wifi_provider
 from core.validation.widgets.yasb.wifi import VALIDATION_SCHEMA
 from PyQt6.QtWidgets import QLabel
-import os
 import logging
 
+WIFI_LABEL_FIELDS = ['wifi_icon', 'wifi_name', 'wifi_strength', 'wifi_bssid', 'wifi_band', 'wifi_rate']
+
+
 class WifiWidget(BaseWidget):
     validation_schema = VALIDATION_SCHEMA
 
     def __init__(self, label: str, label_alt: str, update_interval: int, wifi_icons: list[str], callbacks: dict[str, str]):
         super().__init__(update_interval, class_name="dropdown-wifi-widget")
         self._wifi_icons = wifi_icons
+        self._wifi_info = None
 
-        self._label_content = label
-        self._label_alt_content = label_alt
+        self._label_template = LabelTemplate(label, WIFI_LABEL_FIELDS)
+        self._label_alt_template = LabelTemplate(label_alt, WIFI_LABEL_FIELDS)
 
         self._label = QLabel()
         self._label_alt = QLabel()
@@ -25,7 +29,7 @@ class WifiWidget(BaseWidget):
         self._show_alt_label = False
 
         self.register_callback("toggle_label", self._toggle_label)
-        self.register_callback("update_label", self._update_label)
+        self.register_callback("update_label", self._update_wifi_info)
 
         self.callback_left = callbacks["on_left"]
         self.callback_right = callbacks["on_right"]
@@ -49,74 +53,43 @@ class WifiWidget(BaseWidget):
 
         self._update_label()
 
-    def _get_wifi_info(self) -> dict:
-        wifi_icon, strength = self._get_wifi_icon()
-        wifi_name = self._get_wifi_name()
-
-        return {
-            'wifi_icon': wifi_icon,
-            'wifi_name': wifi_name,
-            'wifi_strength': strength
+    def _update_wifi_info(self):
+        self.run_in_worker("wifi_info", get_wifi_provider().query, self._on_wifi_info)
+
+    def _on_wifi_info(self, wifi_info: WifiInfo):
+        self._wifi_info = {
+            'wifi_icon': self._get_wifi_icon(wifi_info.signal),
+            'wifi_name': wifi_info.ssid or "No WiFi",
+            'wifi_strength': wifi_info.signal,
+            'wifi_bssid': wifi_info.bssid or "N/A",
+            'wifi_band': wifi_info.band or "N/A",
+            'wifi_rate': f"{wifi_info.link_rate:g}" if wifi_info.link_rate is not None else "N/A"
         }
+        self._update_label()
 
     def _update_label(self):
         active_label = self._label_alt if self._show_alt_label else self._label
-        active_label_content = self._label_alt_content if self._show_alt_label else self._label_content
-        active_label_formatted = active_label_content
+        active_label_template = self._label_alt_template if self._show_alt_label else self._label_template
 
-        try:
-            wifi_info = self._get_wifi_info()
-
-            label_options = [
-                ("{wifi_icon}", wifi_info['wifi_icon']),
-                ("{wifi_name}", wifi_info['wifi_name']),
-                ("{wifi_strength}", wifi_info['wifi_strength']),
-            ]
+        if not self._wifi_info:
+            self.set_label_text(active_label, active_label_template.template)
+            return
 
-            for fmt_str, value in label_options:
-                active_label_formatted = active_label_formatted.replace(fmt_str, str(value))
-
-            active_label.setText(active_label_formatted)
+        try:
+            self.set_label_text(active_label, active_label_template.render(self._wifi_info))
         except Exception:
-            active_label.setText(active_label_content)
+            self.set_label_text(active_label, active_label_template.template)
             logging.exception("Failed to retrieve updated wifi info")
 
-    def _get_wifi_strength(self):
-        # Get the wifi strength from the system
-        result = os.popen("netsh wlan show interfaces").read()
-
-        # Return 0 if no wifi interface is found
-        if "There is no wireless interface on the system." in result:
-            return 0
-
-        # Extract signal strength from the result
-        for line in result.split("\n"):
-            if "Signal" in line:  # FIXME: This will break if the system language is not English
-                strength = line.split(":")[1].strip().split(" ")[0].replace("%", "")
-                return int(strength)
-
-        return 0
-
-    def _get_wifi_name(self):
-        result = os.popen("netsh wlan show interfaces").read()
-
-        for line in result.split("\n"):
-            if "SSID" in line:
-                return line.split(":")[1].strip()
-
-        return "No WiFi"
-
-    def _get_wifi_icon(self):
+    def _get_wifi_icon(self, strength: int) -> str:
         # Map strength to its corresponding icon
-        strength = self._get_wifi_strength()
-
         if strength == 0:
-            return self._wifi_icons[0], strength
+            return self._wifi_icons[0]
         elif strength <= 25:
-            return self._wifi_icons[1], strength
+            return self._wifi_icons[1]
         elif strength <= 50:
-            return self._wifi_icons[2], strength
+            return self._wifi_icons[2]
         elif strength <= 75:
-            return self._wifi_icons[3], strength
+            return self._wifi_icons[3]
         else:
-            return self._wifi_icons[4], strength
+            return self._wifi_icons[4]
@@ -1,25 +1,31 @@
+from core.utils.startup_profiler import StartupProfiler
 from sys import argv, exit
 from PyQt6.QtWidgets import QApplication
 from core.bar_manager import BarManager
 from core.config import get_config_and_stylesheet
 from core.log import init_logger
 from core.tray import TrayIcon
-from core.watcher import create_observer
 import logging
-import asyncio
 
 
 logging.getLogger('asyncio').setLevel(logging.WARNING)
 
 def main():
+    profiler = StartupProfiler()
+
+    if "--profile-startup" in argv:
+        profiler.enable()
+
     config, stylesheet = get_config_and_stylesheet()
 
-    app = QApplication(argv)
-    app.setQuitOnLastWindowClosed(False)
+    with profiler.phase("QApplication init"):
+        app = QApplication(argv)
+        app.setQuitOnLastWindowClosed(False)
 
     # Initialise bars and background event listeners
-    manager = BarManager(config, stylesheet)
-    manager.initialize_bars(init=True)
+    with profiler.phase("initialize bars"):
+        manager = BarManager(config, stylesheet)
+        manager.initialize_bars(init=True)
 
     # Build system tray icon
     tray_icon = TrayIcon(manager)
@@ -27,11 +33,14 @@ def main():
 
     # Initialise file watcher
     if config['watch_config'] or config['watch_stylesheet']:
+        from core.watcher import create_observer
         observer = create_observer(manager)
         observer.start()
     else:
         observer = None
 
+    profiler.report()
+
     # Start Application
     exit_status = app.exec()
 
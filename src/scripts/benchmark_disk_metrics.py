@@ -0,0 +1,53 @@
+"""
+Times disk usage sampling with a warm partition cache, as on every update, against a cold one, as after a volume
+is mounted, and against spawning a process per sample, as the disk widget did with WMIC. On Linux the mount
+signature is read from /proc/self/mounts and df stands in for WMIC. Run from the src directory:
+
+    python -m scripts.benchmark_disk_metrics --volumes / /home
+"""
+import argparse
+import shutil
+import subprocess
+import timeit
+import psutil
+from core.utils.disk_metrics import DiskPartitionCache, sample_disk_usage
+
+
+def report(name: str, total_secs: float, count: int) -> None:
+    print(f"{name:<32} {total_secs / count * 1e6:>12.1f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--volumes", nargs="+", help="volumes to sample, defaults to every mounted partition")
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    partition_cache = DiskPartitionCache()
+    volumes = args.volumes or [partition.mountpoint for partition in psutil.disk_partitions()]
+    partition_cache.request_volumes(volumes)
+    print(f"Sampling {len(partition_cache.get_requested_volumes())} of {len(partition_cache.get_volumes())} volumes")
+
+    def get_volumes_cold():
+        partition_cache.invalidate()
+        partition_cache.get_volumes()
+
+    def sample_disk_usage_cold():
+        partition_cache.invalidate()
+        sample_disk_usage()
+
+    report("get_volumes, warm cache", timeit.timeit(partition_cache.get_volumes, number=args.runs), args.runs)
+    report("get_volumes, cold cache", timeit.timeit(get_volumes_cold, number=args.runs), args.runs)
+    report("sample_disk_usage, warm cache", timeit.timeit(sample_disk_usage, number=args.runs), args.runs)
+    report("sample_disk_usage, cold cache", timeit.timeit(sample_disk_usage_cold, number=args.runs), args.runs)
+
+    df_path = shutil.which("df")
+
+    if df_path:
+        runs = max(1, args.runs // 10)
+        df_secs = timeit.timeit(lambda: subprocess.run([df_path, "-k"], capture_output=True), number=runs)
+        report("df process per sample", df_secs, runs)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Times decoding komorebi messages with json and orjson: parsing the full state of a message, and decoding only its
+event while the state is left unparsed, as for events nobody needs the state of. Also times reassembling a large
+message fed to the decoder in small chunks. Run from the src directory:
+
+    python -m scripts.benchmark_message_decoder --monitors 4 --workspaces 10 --windows 50
+    python -m scripts.benchmark_message_decoder --stream scripts/samples/komorebi_events.jsonl
+"""
+import argparse
+import json
+import timeit
+from core.utils.komorebi import message_decoder
+from core.utils.komorebi.message_decoder import KomorebiMessageDecoder
+from scripts.benchmark_state_index import generate_state
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_BACKENDS = {'json': json.loads}
+
+if orjson is not None:
+    JSON_BACKENDS['orjson'] = orjson.loads
+
+
+def generate_message(num_monitors: int, num_workspaces: int, num_windows: int) -> bytes:
+    event = {'type': "FocusChange", 'content': ["SystemForeground", {'hwnd': 1, 'title': "Window 1"}]}
+    state = generate_state(num_monitors, num_workspaces, num_windows)
+    return json.dumps({'event': event, 'state': state}, separators=(",", ":")).encode("utf-8")
+
+
+def load_messages(stream_path: str) -> list[bytes]:
+    with open(stream_path, "rb") as stream:
+        return [line.rstrip(b"\r\n") for line in stream if line.strip()]
+
+
+def decode_all(messages: list[bytes], needs_state: bool, chunk_size: int = 0) -> int:
+    decoder = KomorebiMessageDecoder(lambda _event: needs_state)
+    num_decoded = 0
+
+    for message in messages:
+        chunks = [message[i:i + chunk_size] for i in range(0, len(message), chunk_size)] if chunk_size else [message]
+
+        # Like a transport, the chunk ending each message is marked as the end of its frame
+        for i, chunk in enumerate(chunks):
+            num_decoded += len(decoder.feed(chunk, end_of_frame=i == len(chunks) - 1))
+
+    return num_decoded
+
+
+def report(name: str, total_secs: float, count: int, num_bytes: int) -> None:
+    per_run_secs = total_secs / count
+    print(f"{name:<36} {per_run_secs * 1e3:>10.3f} ms {num_bytes / per_run_secs / 1024 ** 2:>10.1f} MiB/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stream", help="recorded stream, one message per line. Defaults to a synthetic message")
+    parser.add_argument("--monitors", type=int, default=4)
+    parser.add_argument("--workspaces", type=int, default=10)
+    parser.add_argument("--windows", type=int, default=50, help="windows per workspace")
+    parser.add_argument("--chunk-size", type=int, default=4096, help="bytes per chunk when reassembling")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.stream:
+        messages = load_messages(args.stream)
+    else:
+        messages = [generate_message(args.monitors, args.workspaces, args.windows)]
+
+    num_bytes = sum(map(len, messages))
+    print(f"{len(messages)} messages, {num_bytes / 1024:.1f} KiB in total")
+
+    if orjson is None:
+        print("orjson is not installed, so only json is timed")
+
+    for backend_name, json_loads in JSON_BACKENDS.items():
+        # The decoder parses states with the backend chosen at import, which is swapped here for each run
+        message_decoder.json_loads = json_loads
+        texts = [message.decode("utf-8") for message in messages]
+
+        full_secs = timeit.timeit(lambda: [json_loads(text) for text in texts], number=args.runs)
+        report(f"{backend_name} full message parse", full_secs, args.runs, num_bytes)
+
+        state_secs = timeit.timeit(lambda: decode_all(messages, needs_state=True), number=args.runs)
+        report(f"{backend_name} decoder, state parsed", state_secs, args.runs, num_bytes)
+
+        event_secs = timeit.timeit(lambda: decode_all(messages, needs_state=False), number=args.runs)
+        report(f"{backend_name} decoder, event only", event_secs, args.runs, num_bytes)
+
+        chunked_secs = timeit.timeit(
+            lambda: decode_all(messages, needs_state=False, chunk_size=args.chunk_size), number=args.runs
+        )
+        report(f"{backend_name} decoder, {args.chunk_size} B chunks", chunked_secs, args.runs, num_bytes)
+
+    assert decode_all(messages, needs_state=True, chunk_size=args.chunk_size) == len(messages)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Times building the komorebi state index and looking windows up through it, against scanning the state for
+each lookup, on a large synthetic state. Run from the src directory:
+
+    python -m scripts.benchmark_state_index --monitors 4 --workspaces 10 --windows 50
+"""
+import argparse
+import random
+import timeit
+from typing import Optional
+from core.utils.komorebi.state_index import KomorebiStateIndex, get_state_index
+
+
+def generate_state(num_monitors: int, num_workspaces: int, num_windows: int) -> dict:
+    """Returns a state with num_windows windows on every workspace, a fifth of which float."""
+    hwnd = 0
+    monitors = []
+
+    for monitor_index in range(num_monitors):
+        workspaces = []
+
+        for workspace_index in range(num_workspaces):
+            containers = []
+            floating_windows = []
+
+            for window_index in range(num_windows):
+                hwnd += 1
+                window = {'hwnd': hwnd, 'title': f"Window {hwnd}", 'exe': "app.exe", 'class': "AppWindow"}
+
+                if window_index % 5 == 0:
+                    floating_windows.append(window)
+                else:
+                    containers.append({'id': f"container-{hwnd}", 'windows': {'elements': [window], 'focused': 0}})
+
+            workspaces.append({
+                'name': f"{monitor_index}-{workspace_index}",
+                'containers': {'elements': containers, 'focused': 0},
+                'floating_windows': floating_windows,
+                'layout': {'Default': "BSP"}
+            })
+
+        monitors.append({
+            'id': 65537 + monitor_index,
+            'workspaces': {'elements': workspaces, 'focused': 0}
+        })
+
+    return {'monitors': {'elements': monitors, 'focused': 0}, 'is_paused': False}
+
+
+def scan_workspace_by_window_hwnd(state: dict, window_hwnd: int) -> Optional[dict]:
+    """The lookup as done before the index, by walking the whole state."""
+    for monitor in state['monitors']['elements']:
+        for workspace in monitor['workspaces']['elements']:
+            for floating_window in workspace.get('floating_windows', []):
+                if floating_window['hwnd'] == window_hwnd:
+                    return workspace
+
+            for container in workspace['containers']['elements']:
+                for managed_window in container['windows']['elements']:
+                    if managed_window['hwnd'] == window_hwnd:
+                        return workspace
+
+    return None
+
+
+def report(name: str, total_secs: float, count: int) -> None:
+    print(f"{name:<28} {total_secs / count * 1e6:>12.2f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--monitors", type=int, default=4)
+    parser.add_argument("--workspaces", type=int, default=10)
+    parser.add_argument("--windows", type=int, default=50, help="windows per workspace")
+    parser.add_argument("--lookups", type=int, default=1000)
+    parser.add_argument("--builds", type=int, default=20)
+    args = parser.parse_args()
+
+    state = generate_state(args.monitors, args.workspaces, args.windows)
+    num_windows = args.monitors * args.workspaces * args.windows
+    hwnds = [random.randint(1, num_windows) for _ in range(args.lookups)]
+    print(f"{args.monitors} monitors, {args.workspaces} workspaces each, {num_windows} windows in total")
+
+    report("index build", timeit.timeit(lambda: KomorebiStateIndex(state), number=args.builds), args.builds)
+
+    state_index = get_state_index(state)
+    indexed_secs = timeit.timeit(lambda: [state_index.window_locations.get(hwnd) for hwnd in hwnds], number=1)
+    report("indexed lookup", indexed_secs, args.lookups)
+
+    cached_secs = timeit.timeit(lambda: [get_state_index(state).window_locations.get(hwnd) for hwnd in hwnds], number=1)
+    report("get_state_index + lookup", cached_secs, args.lookups)
+
+    scan_secs = timeit.timeit(lambda: [scan_workspace_by_window_hwnd(state, hwnd) for hwnd in hwnds], number=1)
+    report("scanning lookup", scan_secs, args.lookups)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Times one tick of several wifi widgets: with the old widget, which ran netsh through os.popen once for the signal and
+once for the name, against querying LinuxWifiProvider per widget, and against sharing one query through
+CachedWifiProvider. On Linux, cat over /proc/net/wireless stands in for netsh. Without wireless interfaces, the
+recorded sample is read instead. Run from the src directory:
+
+    python -m scripts.benchmark_wifi_provider --widgets 3
+"""
+import argparse
+import os
+import timeit
+from core.utils.wifi_provider import (
+    LINUX_WIRELESS_PATH,
+    CachedWifiProvider,
+    LinuxWifiProvider,
+    parse_proc_net_wireless
+)
+
+SAMPLE_WIRELESS_PATH = os.path.join(os.path.dirname(__file__), "samples", "proc_net_wireless.txt")
+
+
+def report(name: str, total_secs: float, count: int) -> None:
+    print(f"{name:<36} {total_secs / count * 1e3:>10.3f} ms per tick")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--wireless", help="path of /proc/net/wireless or a recording of it")
+    parser.add_argument("--widgets", type=int, default=3, help="wifi widgets updating on each tick")
+    parser.add_argument("--runs", type=int, default=100)
+    args = parser.parse_args()
+
+    wireless_path = args.wireless or LINUX_WIRELESS_PATH
+
+    if not os.path.exists(wireless_path):
+        wireless_path = SAMPLE_WIRELESS_PATH
+
+    provider = LinuxWifiProvider(wireless_path)
+    print(f"Reading {wireless_path}, {provider.query().signal}% signal, {args.widgets} widgets")
+
+    def popen_tick():
+        for _ in range(args.widgets):
+            for _field in ["signal", "name"]:
+                with os.popen(f"cat {wireless_path}") as output:
+                    parse_proc_net_wireless(output.read())
+
+    def provider_tick():
+        for _ in range(args.widgets):
+            provider.query()
+
+    def cached_provider_tick():
+        # A fresh cache per tick, as the TTL runs out between ticks
+        cached_provider = CachedWifiProvider(provider)
+
+        for _ in range(args.widgets):
+            cached_provider.query()
+
+    popen_runs = max(1, args.runs // 10)
+    report("os.popen twice per widget", timeit.timeit(popen_tick, number=popen_runs), popen_runs)
+    report("LinuxWifiProvider per widget", timeit.timeit(provider_tick, number=args.runs), args.runs)
+    report("CachedWifiProvider, shared query", timeit.timeit(cached_provider_tick, number=args.runs), args.runs)
+
+
+if __name__ == '__main__':
+    main()
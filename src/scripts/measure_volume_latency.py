@@ -0,0 +1,75 @@
+"""
+Measures the time from a volume change reported by the provider to the volume widget's label showing it, through
+VolumeService and the coalescing EventService. A FakeVolumeProvider stands in for the audio endpoint, so this runs
+without pycaw. Run from the src directory:
+
+    python -m scripts.measure_volume_latency --changes 50 --burst 20
+"""
+import argparse
+import os
+import statistics
+import time
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QCoreApplication
+from PyQt6.QtWidgets import QApplication
+from core.utils.win32.audio_volume import FakeVolumeProvider, VolumeService
+from core.widgets.yasb import volume
+from core.widgets.yasb.volume import VOLUME_CHANGE_COALESCE_MS, VolumeWidget
+
+LABEL_TIMEOUT_SECS = 1
+
+
+def wait_for_label(widget: VolumeWidget, text: str) -> float:
+    started_at = time.perf_counter()
+
+    while widget._label.text() != text:
+        if time.perf_counter() - started_at > LABEL_TIMEOUT_SECS:
+            raise TimeoutError(f"Label never showed {text}")
+
+        QCoreApplication.processEvents()
+
+    return time.perf_counter()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--changes", type=int, default=50, help="volume changes to time")
+    parser.add_argument("--burst", type=int, default=1, help="changes notified at once per change, as when dragging")
+    args = parser.parse_args()
+
+    app = QApplication([])
+    provider = FakeVolumeProvider(level=0)
+
+    with mock.patch.object(volume, 'VolumeService', return_value=VolumeService(provider)):
+        widget = VolumeWidget(
+            label="{volume[percent]}",
+            label_alt="{volume[percent]}",
+            update_interval=0,
+            callbacks={'on_left': "do_nothing", 'on_middle': "do_nothing", 'on_right': "do_nothing"}
+        )
+
+    delivered_states = []
+    widget.volume_change.connect(delivered_states.append)
+    latencies_ms = []
+
+    for change in range(args.changes):
+        # Alternates between ranges, so every change shows a different label than the one before
+        levels = [(change % 2 * 50 + step % 50) / 100 for step in range(args.burst)]
+        started_at = time.perf_counter()
+
+        for level in levels:
+            provider.set_volume(level)
+
+        latencies_ms.append((wait_for_label(widget, f"{round(levels[-1] * 100)}%") - started_at) * 1e3)
+
+    print(f"{args.changes} changes of {args.burst} notifications, coalesced over {VOLUME_CHANGE_COALESCE_MS} ms")
+    print(f"Label updated after {statistics.median(latencies_ms):.1f} ms median, {max(latencies_ms):.1f} ms max")
+    print(f"{len(delivered_states)} of {args.changes * args.burst} notifications delivered to the widget")
+    app.quit()
+
+
+if __name__ == '__main__':
+    main()
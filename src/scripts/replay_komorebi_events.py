@@ -0,0 +1,99 @@
+"""
+Replays a recorded komorebi event stream into the socket the komorebi event listener listens on where win32
+pipes are unavailable, to exercise the socket transport, the listener's reconnect loop and the message decoder
+without komorebi. Start yasb first, then run from the src directory:
+
+    python -m scripts.replay_komorebi_events --reconnects 2 --chunk-size 512
+
+Each line of the stream file is one komorebi message. Writes are split into chunks of --chunk-size bytes, and
+the connection is dropped and re-established --reconnects times, each time replaying the stream again.
+"""
+import argparse
+import glob
+import os
+import socket
+import sys
+import tempfile
+import time
+from typing import Optional
+
+SAMPLE_STREAM_PATH = os.path.join(os.path.dirname(__file__), "samples", "komorebi_events.jsonl")
+# The listener names its socket after its pipe, "yasb-<uuid>"
+LISTENER_SOCKET_PATTERN = "yasb-*.sock"
+CONNECT_TIMEOUT_SECS = 10
+
+
+def find_socket_path() -> Optional[str]:
+    """Returns the most recently created listener socket, as its name carries a random suffix per listener."""
+    socket_paths = glob.glob(os.path.join(tempfile.gettempdir(), LISTENER_SOCKET_PATTERN))
+    return max(socket_paths, key=os.path.getmtime) if socket_paths else None
+
+
+def connect(socket_path: str, previous_identity: Optional[tuple] = None) -> tuple[socket.socket, tuple]:
+    """
+    Connects to the listener. After a dropped connection, the listener closes its socket and opens a new one,
+    so a connection is only made once the socket file was recreated, rather than to the closing socket.
+    """
+    deadline = time.monotonic() + CONNECT_TIMEOUT_SECS
+
+    while True:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            socket_stat = os.stat(socket_path)
+            # Inodes are reused right away on some file systems, so the creation time tells sockets apart
+            identity = (socket_stat.st_ino, socket_stat.st_ctime_ns)
+
+            if identity == previous_identity:
+                raise ConnectionRefusedError(f"{socket_path} has not been recreated yet")
+
+            client.connect(socket_path)
+            return client, identity
+        except OSError:
+            client.close()
+
+            if time.monotonic() > deadline:
+                raise
+
+            time.sleep(0.1)
+
+
+def replay(client: socket.socket, messages: list[bytes], chunk_size: int, interval_secs: float) -> None:
+    for message in messages:
+        data = message + b"\n"
+
+        for chunk_start in range(0, len(data), chunk_size):
+            client.sendall(data[chunk_start:chunk_start + chunk_size])
+
+        time.sleep(interval_secs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stream", default=SAMPLE_STREAM_PATH, help="recorded stream, one message per line")
+    parser.add_argument("--socket", help="listener socket path, defaults to the most recent yasb socket")
+    parser.add_argument("--chunk-size", type=int, default=4096, help="bytes per write")
+    parser.add_argument("--interval", type=float, default=0.5, help="seconds between messages")
+    parser.add_argument("--reconnects", type=int, default=0, help="times to drop and re-establish the connection")
+    args = parser.parse_args()
+
+    socket_path = args.socket or find_socket_path()
+
+    if socket_path is None:
+        sys.exit(f"No komorebi listener socket found in {tempfile.gettempdir()}. Is yasb running?")
+
+    with open(args.stream, "rb") as stream:
+        messages = [line.rstrip(b"\r\n") for line in stream if line.strip()]
+
+    socket_identity = None
+
+    for connection in range(args.reconnects + 1):
+        client, socket_identity = connect(socket_path, socket_identity)
+        print(f"Replaying {len(messages)} messages into {socket_path} (connection {connection + 1})")
+
+        with client:
+            replay(client, messages, args.chunk_size, args.interval)
+
+
+if __name__ == '__main__':
+    main()
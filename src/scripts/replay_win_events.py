@@ -0,0 +1,106 @@
+"""
+Replays a WinEvent sequence through the hook range computation and callback counter of the system event listener,
+and prints the callbacks per second the listener would receive when hooking EventMin to EventObjectEnd, as it used
+to, against hooking only the ranges of the subscribed events. Runs without win32. From the src directory:
+
+    python -m scripts.replay_win_events --duration 60
+    python -m scripts.replay_win_events --stream recorded.jsonl --subscribe 0x3 0x800C 0x8001
+
+Without --stream, a synthetic desktop session is generated. A recorded stream holds one JSON object per line
+with the event id, hwnd and time in seconds, e.g. {"event": 32779, "hwnd": 65890, "time": 0.013}.
+"""
+import argparse
+import json
+import random
+from core.utils.win32.hook_ranges import CallbackRateCounter, compute_hook_ranges
+
+EVENT_SYSTEM_FOREGROUND = 0x0003
+EVENT_OBJECT_DESTROY = 0x8001
+EVENT_OBJECT_NAME_CHANGE = 0x800C
+EVENT_OBJECT_END = 0x80FF
+EVENT_MIN = 0x0001
+
+# The events subscribed to by the active window widget, the only WinEvent subscriber
+DEFAULT_SUBSCRIBED_EVENTS = [EVENT_SYSTEM_FOREGROUND, EVENT_OBJECT_NAME_CHANGE, EVENT_OBJECT_DESTROY]
+
+# Events per second of a typical desktop session, dominated by location changes of carets, cursors and windows
+SYNTHETIC_EVENT_RATES = {
+    0x0003: 0.5,   # EventSystemForeground
+    0x000A: 0.2,   # EventSystemMoveSizeStart
+    0x000B: 0.2,   # EventSystemMoveSizeEnd
+    0x8000: 3,     # EventObjectCreate
+    0x8001: 3,     # EventObjectDestroy
+    0x8002: 8,     # EventObjectShow
+    0x8003: 8,     # EventObjectHide
+    0x8004: 4,     # EventObjectReorder
+    0x8005: 6,     # EventObjectFocus
+    0x800A: 25,    # EventObjectStateChange
+    0x800B: 400,   # EventObjectLocationChange
+    0x800C: 20,    # EventObjectNameChange
+    0x800E: 12,    # EventObjectValueChange
+    0x8017: 1,     # EventObjectCloaked
+    0x8018: 1      # EventObjectUncloaked
+}
+SYNTHETIC_NUM_WINDOWS = 40
+
+
+def generate_events(duration_secs: float, seed: int) -> list[tuple[float, int, int]]:
+    """Returns (time, event, hwnd) tuples of a session, with each event type arriving as a Poisson process."""
+    rng = random.Random(seed)
+    hwnds = [0x10000 + 0x12 * i for i in range(SYNTHETIC_NUM_WINDOWS)]
+    events = []
+
+    for event, rate in SYNTHETIC_EVENT_RATES.items():
+        event_time = rng.expovariate(rate)
+
+        while event_time < duration_secs:
+            events.append((event_time, event, rng.choice(hwnds)))
+            event_time += rng.expovariate(rate)
+
+    events.sort()
+    return events
+
+
+def load_events(stream_path: str) -> list[tuple[float, int, int]]:
+    with open(stream_path) as stream:
+        records = [json.loads(line) for line in stream if line.strip()]
+
+    return sorted((record['time'], record['event'], record['hwnd']) for record in records)
+
+
+def replay(events: list[tuple[float, int, int]], hook_ranges: list[tuple[int, int]]) -> tuple[float, int]:
+    """Returns the callbacks per second and the number of callbacks the hooks would have received."""
+    clock_secs = events[0][0] if events else 0.0
+    counter = CallbackRateCounter(clock=lambda: clock_secs)
+
+    for clock_secs, event, _hwnd in events:
+        if any(event_min <= event <= event_max for event_min, event_max in hook_ranges):
+            counter.increment()
+
+    return counter.callbacks_per_second, counter.num_callbacks
+
+
+def format_ranges(hook_ranges: list[tuple[int, int]]) -> str:
+    return ", ".join(f"{hex(event_min)}-{hex(event_max)}" for event_min, event_max in hook_ranges)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stream", help="recorded stream, one event per line. Defaults to a synthetic session")
+    parser.add_argument("--duration", type=float, default=60, help="seconds of synthetic session")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--subscribe", nargs="+", type=lambda value: int(value, 0), default=DEFAULT_SUBSCRIBED_EVENTS)
+    parser.add_argument("--max-gap", type=int, default=0, help="unrequested ids merged between hook ranges")
+    args = parser.parse_args()
+
+    events = load_events(args.stream) if args.stream else generate_events(args.duration, args.seed)
+    hook_ranges = compute_hook_ranges(args.subscribe, args.max_gap)
+    print(f"{len(events)} events over {events[-1][0] - events[0][0]:.1f} s" if events else "No events")
+
+    for name, ranges in [("full range", [(EVENT_MIN, EVENT_OBJECT_END)]), ("subscribed ranges", hook_ranges)]:
+        callbacks_per_second, num_callbacks = replay(events, ranges)
+        print(f"{name:<18} {callbacks_per_second:>10.1f} callbacks/s {num_callbacks:>9} callbacks  [{format_ranges(ranges)}]")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,6 +7,7 @@ GITHUB_URL = "https://github.com/denBot/yasb"
 
 # Development Settings
 DEBUG = True
+STARTUP_TIME_BUDGET_MS = 1500
 
 # Configuration Settings
 DEFAULT_CONFIG_DIRECTORY = ".yasb"
@@ -0,0 +1,144 @@
+import threading
+import unittest
+from core.utils.komorebi.command_dispatcher import CommandExecutor, KomorebiCommand, KomorebiCommandDispatcher
+
+WAIT_TIMEOUT_SECS = 5
+
+
+class FakeExecutor(CommandExecutor):
+    """Records the commands it runs. The first command blocks until released, so later ones queue up behind it."""
+
+    def __init__(self, supported: bool = True, block_first: bool = False, fail_on: str = None):
+        self.commands = []
+        self._supported = supported
+        self._fail_on = fail_on
+        self._release = threading.Event()
+        self._started = threading.Event()
+        self._done = threading.Condition()
+
+        if not block_first:
+            self._release.set()
+
+    def execute(self, command_args: list[str]) -> bool:
+        self._started.set()
+        self._release.wait(WAIT_TIMEOUT_SECS)
+
+        if command_args[0] == self._fail_on:
+            raise RuntimeError(f"{self._fail_on} failed")
+
+        with self._done:
+            if self._supported:
+                self.commands.append(command_args)
+            self._done.notify_all()
+
+        return self._supported
+
+    def wait_started(self) -> None:
+        assert self._started.wait(WAIT_TIMEOUT_SECS)
+
+    def release(self) -> None:
+        self._release.set()
+
+    def wait_for(self, count: int) -> list[list[str]]:
+        with self._done:
+            assert self._done.wait_for(lambda: len(self.commands) >= count, WAIT_TIMEOUT_SECS)
+            return self.commands
+
+
+class KomorebiCommandTests(unittest.TestCase):
+    def test_cycles_coalesce_into_net_steps(self):
+        command = KomorebiCommand("cycle-workspace", "next")
+
+        for direction in ["next", "next", "prev", "next"]:
+            self.assertTrue(command.coalesce(KomorebiCommand("cycle-workspace", direction)))
+
+        self.assertEqual(command.expand(), [["cycle-workspace", "next"]] * 3)
+
+    def test_cycles_cancelling_out_expand_to_nothing(self):
+        command = KomorebiCommand("cycle-workspace", "next")
+        command.coalesce(KomorebiCommand("cycle-workspace", "prev"))
+
+        self.assertEqual(command.expand(), [])
+
+    def test_last_call_wins(self):
+        for name, first, last in [("focus-workspace", "1", "3"), ("change-layout", "bsp", "rows")]:
+            command = KomorebiCommand(name, first)
+
+            self.assertTrue(command.coalesce(KomorebiCommand(name, last)))
+            self.assertEqual(command.expand(), [[name, last]])
+
+    def test_other_commands_are_not_coalesced(self):
+        command = KomorebiCommand("toggle-tiling")
+
+        self.assertFalse(command.coalesce(KomorebiCommand("toggle-tiling")))
+        self.assertFalse(command.coalesce(KomorebiCommand("focus-workspace", "1")))
+
+
+class KomorebiCommandDispatcherTests(unittest.TestCase):
+    def _blocked_dispatcher(self, *executors: FakeExecutor) -> KomorebiCommandDispatcher:
+        """Returns a dispatcher whose worker is held on a first toggle-pause, so the commands submitted next queue up."""
+        dispatcher = KomorebiCommandDispatcher("komorebic", executors)
+        dispatcher.submit("toggle-pause")
+        executors[0].wait_started()
+        return dispatcher
+
+    def test_queued_commands_are_coalesced(self):
+        executor = FakeExecutor(block_first=True)
+        dispatcher = self._blocked_dispatcher(executor)
+
+        for direction in ["next", "next", "prev", "next"]:
+            dispatcher.submit("cycle-workspace", direction)
+        dispatcher.submit("focus-workspace", "1")
+        dispatcher.submit("focus-workspace", "2")
+        dispatcher.submit("change-layout", "bsp")
+        dispatcher.submit("change-layout", "columns")
+        executor.release()
+
+        self.assertEqual(executor.wait_for(5), [
+            ["toggle-pause"],
+            ["cycle-workspace", "next"],
+            ["cycle-workspace", "next"],
+            ["focus-workspace", "2"],
+            ["change-layout", "columns"]
+        ])
+
+    def test_commands_run_in_submission_order(self):
+        executor = FakeExecutor(block_first=True)
+        dispatcher = self._blocked_dispatcher(executor)
+
+        dispatcher.submit("focus-workspace", "1")
+        dispatcher.submit("toggle-tiling")
+        dispatcher.submit("focus-workspace", "2")
+        dispatcher.submit("toggle-tiling")
+        executor.release()
+
+        self.assertEqual(executor.wait_for(5), [
+            ["toggle-pause"],
+            ["focus-workspace", "1"],
+            ["toggle-tiling"],
+            ["focus-workspace", "2"],
+            ["toggle-tiling"]
+        ])
+
+    def test_falls_back_to_next_executor(self):
+        unsupported = FakeExecutor(supported=False)
+        fallback = FakeExecutor()
+        dispatcher = KomorebiCommandDispatcher("komorebic", (unsupported, fallback))
+
+        dispatcher.submit("change-layout", "bsp")
+
+        self.assertEqual(fallback.wait_for(1), [["change-layout", "bsp"]])
+        self.assertEqual(unsupported.commands, [])
+
+    def test_worker_survives_failing_command(self):
+        executor = FakeExecutor(fail_on="toggle-float")
+        dispatcher = KomorebiCommandDispatcher("komorebic", (executor,))
+
+        with self.assertLogs(level="ERROR"):
+            dispatcher.submit("toggle-float")
+            dispatcher.submit("toggle-monocle")
+            self.assertEqual(executor.wait_for(1), [["toggle-monocle"]])
+
+
+if __name__ == '__main__':
+    unittest.main()
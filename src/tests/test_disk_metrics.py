@@ -0,0 +1,20 @@
+import unittest
+from core.utils.disk_metrics import normalize_volume_label
+
+
+class NormalizeVolumeLabelTests(unittest.TestCase):
+    def test_drive_letter_forms_name_one_volume(self):
+        for volume_label in ["C", "c", "C:", "C:\\", "c:\\"]:
+            with self.subTest(volume_label=volume_label):
+                self.assertEqual(normalize_volume_label(volume_label), "C")
+
+    def test_mount_points_drop_trailing_slashes(self):
+        self.assertEqual(normalize_volume_label("/mnt/x/"), "/mnt/x")
+        self.assertEqual(normalize_volume_label("/mnt/x"), "/mnt/x")
+
+    def test_root_mount_point_is_kept(self):
+        self.assertEqual(normalize_volume_label("/"), "/")
+
+
+if __name__ == '__main__':
+    unittest.main()
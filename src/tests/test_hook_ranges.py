@@ -0,0 +1,40 @@
+import unittest
+from core.utils.win32.hook_ranges import CallbackRateCounter, compute_hook_ranges
+
+
+class ComputeHookRangesTests(unittest.TestCase):
+    def test_adjacent_ids_merge_into_one_range(self):
+        self.assertEqual(compute_hook_ranges([0x8001, 0x8000, 0x8002]), [(0x8000, 0x8002)])
+
+    def test_separate_ids_get_their_own_ranges(self):
+        self.assertEqual(
+            compute_hook_ranges([0x800C, 0x0003, 0x8001]),
+            [(0x0003, 0x0003), (0x8001, 0x8001), (0x800C, 0x800C)]
+        )
+
+    def test_ranges_within_max_gap_are_merged(self):
+        self.assertEqual(compute_hook_ranges([0x8001, 0x8003, 0x800C], max_gap=1), [(0x8001, 0x8003), (0x800C, 0x800C)])
+
+    def test_duplicates_and_no_ids(self):
+        self.assertEqual(compute_hook_ranges([0x0003, 0x0003]), [(0x0003, 0x0003)])
+        self.assertEqual(compute_hook_ranges([]), [])
+
+
+class CallbackRateCounterTests(unittest.TestCase):
+    def test_rate_over_elapsed_clock_time(self):
+        now = [10.0]
+        counter = CallbackRateCounter(clock=lambda: now[0])
+
+        for _ in range(50):
+            counter.increment()
+        now[0] = 12.0
+
+        self.assertEqual(counter.callbacks_per_second, 25.0)
+
+        counter.reset()
+        self.assertEqual(counter.num_callbacks, 0)
+        self.assertEqual(counter.callbacks_per_second, 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import asyncio
+import threading
+import unittest
+from PyQt6.QtCore import Qt
+from core.utils.win32.media_control import DEFAULT_MEDIA_INFO, DEFAULT_PLAYBACK_INFO
+from core.utils.win32.media_session import FakeMediaSessionProvider, MediaSessionService, MediaSessionState
+
+WAIT_SECS = 1
+
+
+class MediaSessionServiceTests(unittest.TestCase):
+    def setUp(self):
+        self.provider = FakeMediaSessionProvider()
+        self.service = MediaSessionService(self.provider)
+        self.states = []
+        self.state_received = threading.Event()
+        # Emitted from the service loop, so received there without a Qt event loop
+        self.service.session_changed.connect(self._on_session_changed, Qt.ConnectionType.DirectConnection)
+        self.service.start()
+        # Coroutines run in order, so the provider has started once this one has run
+        self.service.run_coroutine(asyncio.sleep(0)).result(timeout=WAIT_SECS)
+
+    def tearDown(self):
+        self.service.stop()
+
+    def _on_session_changed(self, session_state: MediaSessionState):
+        self.states.append(session_state)
+
+        if len(self.states) % 2 == 0:
+            # Each push reports media properties, then playback info
+            self.state_received.set()
+
+    def push(self, media_info, playback_info) -> MediaSessionState:
+        self.state_received.clear()
+        self.provider.push(media_info, playback_info)
+        self.assertTrue(self.state_received.wait(WAIT_SECS))
+        return self.states[-1]
+
+    def test_session_change_is_emitted(self):
+        media_info = dict(DEFAULT_MEDIA_INFO, title="Track", artist="Artist")
+        playback_info = dict(DEFAULT_PLAYBACK_INFO)
+
+        session_state = self.push(media_info, playback_info)
+
+        self.assertTrue(session_state.has_session)
+        self.assertEqual(session_state.media_info, media_info)
+        self.assertIs(self.service.state, session_state)
+
+    def test_session_end_resets_to_defaults(self):
+        self.push(dict(DEFAULT_MEDIA_INFO, title="Track"), dict(DEFAULT_PLAYBACK_INFO))
+
+        session_state = self.push(None, None)
+
+        self.assertFalse(session_state.has_session)
+        self.assertEqual(session_state.media_info, DEFAULT_MEDIA_INFO)
+        self.assertEqual(session_state.playback_info, DEFAULT_PLAYBACK_INFO)
+
+    def test_action_is_sent_to_provider(self):
+        self.assertTrue(self.service.send_action("next").result(timeout=WAIT_SECS))
+        self.assertEqual(self.provider.actions, [("next",)])
+
+    def test_unknown_action(self):
+        with self.assertRaises(ValueError):
+            self.service.send_action("rewind")
+
+    def test_action_after_stop_fails(self):
+        self.service.stop()
+
+        with self.assertLogs(level="ERROR"):
+            future = self.service.send_action("play_pause")
+
+        with self.assertRaises(RuntimeError):
+            future.result(timeout=WAIT_SECS)
+
+        self.assertEqual(self.provider.actions, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
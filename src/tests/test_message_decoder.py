@@ -0,0 +1,84 @@
+import json
+import unittest
+from core.utils.komorebi.message_decoder import KomorebiMessageDecoder
+
+
+def encode_message(event_type: str, state: dict) -> bytes:
+    return json.dumps({'event': {'type': event_type}, 'state': state}, separators=(",", ":")).encode("utf-8")
+
+
+def split(data: bytes, chunk_size: int) -> list[bytes]:
+    return [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+
+class KomorebiMessageDecoderTests(unittest.TestCase):
+    def setUp(self):
+        self.needs_state = True
+        self.decoder = KomorebiMessageDecoder(lambda _event: self.needs_state)
+        self.state = {'monitors': {'elements': [{'id': 1, 'name': "{\"event\":"}], 'focused': 0}}
+
+    def feed_all(self, chunks: list[bytes], end_of_frame: bool = False) -> list:
+        return [message for chunk in chunks for message in self.decoder.feed(chunk, end_of_frame)]
+
+    def test_several_messages_in_one_chunk(self):
+        data = encode_message("FocusChange", self.state) + b"\n" + encode_message("Manage", self.state)
+
+        messages = self.decoder.feed(data)
+
+        self.assertEqual([message.event['type'] for message in messages], ["FocusChange", "Manage"])
+        self.assertEqual(messages[1].state, self.state)
+
+    def test_message_split_across_chunks(self):
+        for chunk_size in [1, 3, 7, 64]:
+            with self.subTest(chunk_size=chunk_size):
+                self.decoder.reset()
+                messages = self.feed_all(split(encode_message("FocusChange", self.state), chunk_size))
+
+                self.assertEqual(len(messages), 1)
+                self.assertEqual(messages[0].state, self.state)
+
+    def test_split_header_is_kept(self):
+        first = encode_message("FocusChange", self.state)
+        second = encode_message("Manage", self.state)
+
+        with self.assertNoLogs(level="WARNING"):
+            messages = self.decoder.feed(first + b'\n{"ev')
+            messages += self.decoder.feed(second[len(b'{"ev'):])
+
+        self.assertEqual([message.event['type'] for message in messages], ["FocusChange", "Manage"])
+
+    def test_whitespace_around_header_and_separator(self):
+        data = b'{ "event" : {"type": "Manage"} ,\n  "state" : {"is_paused": true}\n}'
+
+        messages = self.feed_all(split(data, 5))
+
+        self.assertEqual(messages[0].event, {'type': "Manage"})
+        self.assertEqual(messages[0].state, {'is_paused': True})
+
+    def test_incomplete_message_is_not_emitted_without_its_state(self):
+        # Chunks ending on a closing brace of the state must not be taken for the end of the message
+        self.needs_state = False
+        data = encode_message("FocusChange", {'a': {'b': {}}, 'c': 1})
+
+        messages = self.feed_all(split(data, data.index(b"}") + 1))
+
+        self.assertEqual(len(messages), 1)
+        self.assertEqual(messages[0].state, {'a': {'b': {}}, 'c': 1})
+
+    def test_state_is_parsed_lazily_for_framed_messages(self):
+        self.needs_state = False
+
+        message = self.decoder.feed(encode_message("FocusChange", self.state), end_of_frame=True)[0]
+
+        self.assertNotIn('state', message.__dict__)
+        self.assertEqual(message.state, self.state)
+
+    def test_stray_data_is_discarded(self):
+        with self.assertLogs(level="WARNING"):
+            messages = self.decoder.feed(b"garbage" + encode_message("Manage", self.state))
+
+        self.assertEqual([message.event['type'] for message in messages], ["Manage"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+import unittest
+from core.utils.process_cache import ProcessCache
+
+
+def start_exited_process() -> int:
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+class ProcessCacheTests(unittest.TestCase):
+    def test_hits_are_counted(self):
+        process_cache = ProcessCache(revalidate_secs=60)
+
+        first = process_cache.get(os.getpid())
+        second = process_cache.get(os.getpid())
+
+        self.assertIs(first, second)
+        self.assertEqual(process_cache.stats['hits'], 1)
+        self.assertEqual(process_cache.stats['misses'], 1)
+        self.assertEqual(process_cache.hit_rate, 0.5)
+
+    def test_exited_process_is_dropped_once_revalidated(self):
+        proc = subprocess.Popen([sys.executable, "-c", "import sys; sys.stdin.read()"], stdin=subprocess.PIPE)
+        process_cache = ProcessCache(revalidate_secs=0)
+
+        try:
+            self.assertIsNotNone(process_cache.get(proc.pid))
+        finally:
+            proc.communicate()
+
+        self.assertIsNone(process_cache.get(proc.pid))
+        self.assertEqual(process_cache.stats['invalidations'], 1)
+
+    def test_missing_process(self):
+        self.assertIsNone(ProcessCache().get(start_exited_process()))
+
+    def test_least_recently_used_is_evicted(self):
+        process_cache = ProcessCache(max_size=1, revalidate_secs=60)
+
+        process_cache.get(os.getpid())
+        process_cache.get(os.getppid())
+        process_cache.get(os.getpid())
+
+        self.assertEqual(process_cache.stats['misses'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication
+from core.event_enums import VolumeEvent
+from core.event_service import EventService
+from core.utils.win32.audio_volume import FakeVolumeProvider, VolumeService, VolumeState
+from core.widgets.yasb import volume
+from core.widgets.yasb.volume import VOLUME_CHANGE_COALESCE_MS, VolumeWidget
+
+app = QApplication.instance() or QApplication([])
+
+
+def create_widget(volume_service: VolumeService) -> VolumeWidget:
+    with mock.patch.object(volume, 'VolumeService', return_value=volume_service):
+        return VolumeWidget(
+            label="{volume[percent]}",
+            label_alt="VOL {volume[percent]}",
+            update_interval=0,
+            callbacks={'on_left': "toggle_label", 'on_middle': "do_nothing", 'on_right': "do_nothing"}
+        )
+
+
+class VolumeStateTests(unittest.TestCase):
+    def test_equal_states_hash_alike(self):
+        self.assertEqual(VolumeState(0.5, False), VolumeState(0.5, False))
+        self.assertEqual(len({VolumeState(0.5, False), VolumeState(0.5, False), VolumeState(0.5, True)}), 2)
+
+
+class VolumeWidgetTests(unittest.TestCase):
+    def setUp(self):
+        self.provider = FakeVolumeProvider(level=0.42)
+        self.widget = create_widget(VolumeService(self.provider))
+
+    def tearDown(self):
+        self.widget.teardown()
+        self.widget.deleteLater()
+
+    def test_percent_is_read_on_start(self):
+        self.assertEqual(self.widget._label.text(), "42%")
+
+    def test_muted(self):
+        self.provider.set_volume(0.42, is_muted=True)
+        QTest.qWait(VOLUME_CHANGE_COALESCE_MS * 2)
+
+        self.assertIn("muted", self.widget._label.text())
+
+    def test_alt_label(self):
+        self.widget._toggle_label()
+
+        self.assertEqual(self.widget._label_alt.text(), "VOL 42%")
+
+    def test_changes_within_the_window_are_coalesced(self):
+        delivered_states = []
+        self.widget.volume_change.connect(delivered_states.append)
+
+        for level in range(10):
+            self.provider.set_volume(level / 10)
+
+        self.assertEqual(self.widget._label.text(), "42%")
+        QTest.qWait(VOLUME_CHANGE_COALESCE_MS * 2)
+
+        self.assertEqual(delivered_states, [VolumeState(0.9, False)])
+        self.assertEqual(self.widget._label.text(), "90%")
+
+    def test_teardown_drops_pending_and_later_changes(self):
+        delivered_states = []
+        self.widget.volume_change.connect(delivered_states.append)
+
+        self.provider.set_volume(0.1)
+        self.widget.teardown()
+        self.provider.set_volume(0.2)
+        QTest.qWait(VOLUME_CHANGE_COALESCE_MS * 2)
+
+        self.assertEqual(delivered_states, [])
+        self.assertFalse(EventService().has_registered_signals(VolumeEvent.VolumeChange))
+
+
+class VolumeWidgetWithoutProviderTests(unittest.TestCase):
+    def test_unknown_volume_is_not_available(self):
+        volume_service = VolumeService(FakeVolumeProvider())
+        volume_service.provider = None
+        widget = create_widget(volume_service)
+
+        self.assertEqual(widget._label.text(), "N/A")
+        widget.teardown()
+        widget.deleteLater()
+
+
+if __name__ == '__main__':
+    unittest.main()
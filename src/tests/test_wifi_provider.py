@@ -0,0 +1,118 @@
+import os
+import tempfile
+import unittest
+from core.utils.wifi_provider import (
+    CachedWifiProvider,
+    LinuxWifiProvider,
+    WifiInfo,
+    WifiProvider,
+    parse_iw_link,
+    parse_netsh_interfaces,
+    parse_proc_net_wireless
+)
+
+SAMPLES_PATH = os.path.join(os.path.dirname(__file__), "..", "scripts", "samples")
+
+
+def read_sample(file_name: str) -> str:
+    with open(os.path.join(SAMPLES_PATH, file_name)) as sample:
+        return sample.read()
+
+
+class CountingWifiProvider(WifiProvider):
+    def __init__(self):
+        self.num_queries = 0
+
+    def query(self) -> WifiInfo:
+        self.num_queries += 1
+        return WifiInfo(ssid="HomeNet", signal=80)
+
+
+class ParseNetshInterfacesTests(unittest.TestCase):
+    def test_connected(self):
+        wifi_info = parse_netsh_interfaces(read_sample("netsh_interfaces_connected.txt"))
+
+        self.assertEqual(wifi_info.ssid, "HomeNet")
+        self.assertEqual(wifi_info.signal, 88)
+        self.assertEqual(wifi_info.bssid, "a0:63:91:ab:cd:ef")
+        self.assertEqual(wifi_info.band, "5 GHz")
+        self.assertEqual(wifi_info.link_rate, 866.7)
+
+    def test_disconnected(self):
+        wifi_info = parse_netsh_interfaces(read_sample("netsh_interfaces_disconnected.txt"))
+
+        self.assertFalse(wifi_info.is_connected)
+        self.assertIsNone(wifi_info.bssid)
+
+    def test_first_connected_of_several_interfaces_with_ap_bssid(self):
+        wifi_info = parse_netsh_interfaces(read_sample("netsh_interfaces_multi.txt"))
+
+        self.assertEqual(wifi_info.ssid, "Office 5G")
+        self.assertEqual(wifi_info.signal, 71)
+        self.assertEqual(wifi_info.bssid, "5c:a6:e6:10:20:30")
+        self.assertEqual(wifi_info.band, "5 GHz")
+        self.assertEqual(wifi_info.link_rate, 400)
+
+    def test_empty_output(self):
+        self.assertFalse(parse_netsh_interfaces("").is_connected)
+
+
+class ParseIwLinkTests(unittest.TestCase):
+    def test_connected(self):
+        wifi_info = parse_iw_link(read_sample("iw_link_connected.txt"))
+
+        self.assertEqual(wifi_info.ssid, "HomeNet")
+        self.assertEqual(wifi_info.signal, 84)
+        self.assertEqual(wifi_info.bssid, "a0:63:91:ab:cd:ef")
+        self.assertEqual(wifi_info.band, "5 GHz")
+        self.assertEqual(wifi_info.link_rate, 866.7)
+
+    def test_disconnected(self):
+        self.assertFalse(parse_iw_link(read_sample("iw_link_disconnected.txt")).is_connected)
+
+
+class ParseProcNetWirelessTests(unittest.TestCase):
+    def test_signal_of_each_interface(self):
+        signals = parse_proc_net_wireless(read_sample("proc_net_wireless.txt"))
+
+        self.assertEqual(signals, {'wlx00e04c8192a3': 0, 'wlp2s0': 74})
+
+
+class LinuxWifiProviderTests(unittest.TestCase):
+    def test_strongest_interface_without_iw(self):
+        provider = LinuxWifiProvider(os.path.join(SAMPLES_PATH, "proc_net_wireless.txt"), use_iw=False)
+
+        self.assertEqual(provider.query().signal, 74)
+
+    def test_no_wireless_interfaces(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as wireless:
+            wireless.write("\n".join(read_sample("proc_net_wireless.txt").splitlines()[:2]))
+
+        try:
+            self.assertFalse(LinuxWifiProvider(wireless.name, use_iw=False).query().is_connected)
+        finally:
+            os.remove(wireless.name)
+
+
+class CachedWifiProviderTests(unittest.TestCase):
+    def test_queries_within_ttl_are_shared(self):
+        provider = CountingWifiProvider()
+        cached_provider = CachedWifiProvider(provider, ttl_secs=60)
+
+        wifi_infos = [cached_provider.query() for _ in range(5)]
+
+        self.assertEqual(provider.num_queries, 1)
+        self.assertTrue(all(wifi_info is wifi_infos[0] for wifi_info in wifi_infos))
+
+    def test_expired_query_is_repeated(self):
+        provider = CountingWifiProvider()
+        cached_provider = CachedWifiProvider(provider, ttl_secs=-1)
+
+        cached_provider.query()
+        cached_provider.query()
+
+        self.assertEqual(provider.num_queries, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()